@@ -6,6 +6,7 @@ import asyncio
 import logging
 from logging.config import fileConfig
 from os import getenv
+from typing import Any, Optional
 
 import sqlalchemy.engine
 from alembic import context
@@ -29,6 +30,20 @@ if (
     app_config.rich_logging(loggers=[logging.getLogger()])
 
 
+def include_name(name: Optional[str], type_: str, _: Any) -> bool:
+    """
+    Exclude the full-text search and PostgreSQL pattern objects managed by
+    dialect specific migrations
+    """
+    if type_ == "table" and name is not None:
+        return not name.startswith("search_index")
+    if type_ == "column":
+        return name != "search_vector"
+    if type_ == "index" and name is not None:
+        return not name.endswith(("_search_vector", "_name_pattern"))
+    return True
+
+
 def run_migrations_offline() -> None:
     """
     Run migrations in 'offline' mode.
@@ -47,6 +62,7 @@ def run_migrations_offline() -> None:
         url=url,
         target_metadata=target_metadata,
         literal_binds=True,
+        include_name=include_name,
         dialect_opts={"paramstyle": "named"},
     )
 
@@ -59,7 +75,10 @@ def sync_run_migrations(connection: sqlalchemy.engine.Connection) -> None:
     Run migrations in 'sync' mode.
     """
     context.configure(
-        connection=connection, target_metadata=target_metadata, include_schemas=True
+        connection=connection,
+        target_metadata=target_metadata,
+        include_schemas=True,
+        include_name=include_name,
     )
 
     with context.begin_transaction():
@@ -0,0 +1,134 @@
+"""Full Text Search
+
+Revision ID: bbd7d5d8abb6
+Revises: fea3be449e43
+Create Date: 2026-10-18 05:45:30.412908
+
+SQLite: a single FTS5 `search_index` table kept in sync by triggers,
+rowids are `id * 4 + entity code` so each row can be replaced by rowid.
+
+PostgreSQL: a generated `search_vector` tsvector column with a GIN index
+on each searchable table.
+"""
+
+from typing import Dict, Sequence, Tuple, Union
+
+from alembic import op
+
+revision: str = "bbd7d5d8abb6"
+down_revision: Union[str, None] = "fea3be449e43"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table name -> (entity code, name column, body columns)
+searchable_tables: Dict[str, Tuple[int, str, Tuple[str, ...]]] = {
+    "animals": (1, "name", ("species", "description")),
+    "exhibits": (2, "name", ("location", "description")),
+    "staff": (3, "name", ("job_title", "notes")),
+}
+
+
+def _body(columns: Tuple[str, ...], prefix: str = "") -> str:
+    """
+    Concatenate the body columns of a table into a single text expression
+    """
+    return " || ' ' || ".join(f"coalesce({prefix}{column}, '')" for column in columns)
+
+
+def _upgrade_sqlite() -> None:
+    """
+    Create the FTS5 index and its triggers
+    """
+    op.execute(
+        "CREATE VIRTUAL TABLE search_index USING fts5("
+        "entity_type UNINDEXED, entity_id UNINDEXED, name, body, "
+        "tokenize = 'porter unicode61')"
+    )
+    for table, (code, name, body_columns) in searchable_tables.items():
+        insert_new = (
+            "INSERT INTO search_index (rowid, entity_type, entity_id, name, body) "
+            f"SELECT new.id * 4 + {code}, '{table}', new.id, new.{name}, "
+            f"{_body(body_columns, prefix='new.')} WHERE new.deleted_at IS NULL;"
+        )
+        delete_old = f"DELETE FROM search_index WHERE rowid = old.id * 4 + {code};"  # noqa: S608
+        watched_columns = ", ".join([name, *body_columns, "deleted_at"])
+        op.execute(
+            f"CREATE TRIGGER {table}_search_insert AFTER INSERT ON {table} "
+            f"BEGIN {insert_new} END"
+        )
+        op.execute(
+            f"CREATE TRIGGER {table}_search_update "
+            f"AFTER UPDATE OF {watched_columns} ON {table} "
+            f"BEGIN {delete_old} {insert_new} END"
+        )
+        op.execute(
+            f"CREATE TRIGGER {table}_search_delete AFTER DELETE ON {table} "
+            f"BEGIN {delete_old} END"
+        )
+        backfill = (
+            "INSERT INTO search_index (rowid, entity_type, entity_id, name, body) "  # noqa: S608
+            f"SELECT id * 4 + {code}, '{table}', id, {name}, {_body(body_columns)} "
+            f"FROM {table} WHERE deleted_at IS NULL"
+        )
+        op.execute(backfill)
+
+
+def _downgrade_sqlite() -> None:
+    """
+    Drop the FTS5 index and its triggers
+    """
+    for table in searchable_tables:
+        for event in ("insert", "update", "delete"):
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_search_{event}")
+    op.execute("DROP TABLE IF EXISTS search_index")
+
+
+def _upgrade_postgresql() -> None:
+    """
+    Create the generated tsvector columns and their GIN indexes
+    """
+    for table, (_, name, body_columns) in searchable_tables.items():
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN search_vector tsvector "
+            "GENERATED ALWAYS AS ("
+            f"setweight(to_tsvector('english', coalesce({name}, '')), 'A') || "
+            f"setweight(to_tsvector('english', {_body(body_columns)}), 'B')"
+            ") STORED"
+        )
+        op.create_index(
+            f"ix_{table}_search_vector",
+            table,
+            ["search_vector"],
+            postgresql_using="gin",
+        )
+
+
+def _downgrade_postgresql() -> None:
+    """
+    Drop the generated tsvector columns and their GIN indexes
+    """
+    for table in searchable_tables:
+        op.drop_index(f"ix_{table}_search_vector", table_name=table)
+        op.drop_column(table, "search_vector")
+
+
+def upgrade() -> None:
+    """
+    Upgrade the database
+    """
+    dialect_name = op.get_bind().dialect.name
+    if dialect_name == "sqlite":
+        _upgrade_sqlite()
+    elif dialect_name == "postgresql":
+        _upgrade_postgresql()
+
+
+def downgrade() -> None:
+    """
+    Rollback the database upgrade
+    """
+    dialect_name = op.get_bind().dialect.name
+    if dialect_name == "sqlite":
+        _downgrade_sqlite()
+    elif dialect_name == "postgresql":
+        _downgrade_postgresql()
@@ -0,0 +1,63 @@
+"""Live row partial indexes
+
+Revision ID: f659835961c1
+Revises: bbd7d5d8abb6
+Create Date: 2026-10-18 05:48:43.396129
+
+Recreate the list filter indexes as partial indexes over live rows
+(`WHERE deleted_at IS NULL`) and add a live row index on each `id`.
+"""
+
+from typing import Dict, List, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "f659835961c1"
+down_revision: Union[str, None] = "bbd7d5d8abb6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+filter_indexes: Dict[str, List[str]] = {
+    "animals": ["exhibit_id", "name", "species"],
+    "exhibits": ["location", "name"],
+    "staff": ["email", "exhibit_id", "job_title", "name"],
+}
+
+live_rows = sa.text("deleted_at IS NULL")
+
+
+def upgrade() -> None:
+    """
+    Upgrade the database
+    """
+    for table, columns in filter_indexes.items():
+        op.create_index(
+            op.f(f"ix_{table}_live_id"),
+            table,
+            ["id"],
+            unique=False,
+            postgresql_where=live_rows,
+            sqlite_where=live_rows,
+        )
+        for column in columns:
+            op.drop_index(op.f(f"ix_{table}_{column}"), table_name=table)
+            op.create_index(
+                op.f(f"ix_{table}_{column}"),
+                table,
+                [column],
+                unique=False,
+                postgresql_where=live_rows,
+                sqlite_where=live_rows,
+            )
+
+
+def downgrade() -> None:
+    """
+    Rollback the database upgrade
+    """
+    for table, columns in filter_indexes.items():
+        for column in columns:
+            op.drop_index(op.f(f"ix_{table}_{column}"), table_name=table)
+            op.create_index(op.f(f"ix_{table}_{column}"), table, [column], unique=False)
+        op.drop_index(op.f(f"ix_{table}_live_id"), table_name=table)
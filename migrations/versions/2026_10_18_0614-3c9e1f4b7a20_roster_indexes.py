@@ -0,0 +1,55 @@
+"""Roster indexes
+
+Revision ID: 3c9e1f4b7a20
+Revises: f659835961c1
+Create Date: 2026-10-18 06:14:05.118402
+
+Extend the live row `exhibit_id` indexes with `id`, so a page of an
+exhibit's roster is a single index range scan in `id` order.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "3c9e1f4b7a20"
+down_revision: Union[str, None] = "f659835961c1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+roster_tables = ["animals", "staff"]
+
+live_rows = sa.text("deleted_at IS NULL")
+
+
+def upgrade() -> None:
+    """
+    Upgrade the database
+    """
+    for table in roster_tables:
+        op.drop_index(op.f(f"ix_{table}_exhibit_id"), table_name=table)
+        op.create_index(
+            op.f(f"ix_{table}_exhibit_id"),
+            table,
+            ["exhibit_id", "id"],
+            unique=False,
+            postgresql_where=live_rows,
+            sqlite_where=live_rows,
+        )
+
+
+def downgrade() -> None:
+    """
+    Rollback the database upgrade
+    """
+    for table in roster_tables:
+        op.drop_index(op.f(f"ix_{table}_exhibit_id"), table_name=table)
+        op.create_index(
+            op.f(f"ix_{table}_exhibit_id"),
+            table,
+            ["exhibit_id"],
+            unique=False,
+            postgresql_where=live_rows,
+            sqlite_where=live_rows,
+        )
@@ -0,0 +1,59 @@
+"""Timestamp sort indexes
+
+Revision ID: 5297adc5c02c
+Revises: 3c9e1f4b7a20
+Create Date: 2026-10-18 06:52:11.604127
+
+Add live row `(created_at, id)` and `(updated_at, id)` indexes, so a page
+sorted by a timestamp is a single index range scan.
+
+SQLite: pad the stored `CURRENT_TIMESTAMP` / millisecond timestamps to the
+microseconds SQLAlchemy binds, so the timestamps compare as plain strings.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "5297adc5c02c"
+down_revision: Union[str, None] = "3c9e1f4b7a20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+sorted_tables = ["animals", "exhibits", "staff"]
+timestamp_columns = ["created_at", "updated_at"]
+
+live_rows = sa.text("deleted_at IS NULL")
+
+
+def upgrade() -> None:
+    """
+    Upgrade the database
+    """
+    is_sqlite = op.get_bind().dialect.name == "sqlite"
+    for table in sorted_tables:
+        for column in timestamp_columns:
+            if is_sqlite:
+                op.execute(
+                    f"UPDATE {table} "  # noqa: S608
+                    f"SET {column} = strftime('%Y-%m-%d %H:%M:%f000', {column}) "
+                    f"WHERE length({column}) < 26"
+                )
+            op.create_index(
+                op.f(f"ix_{table}_{column}"),
+                table,
+                [column, "id"],
+                unique=False,
+                postgresql_where=live_rows,
+                sqlite_where=live_rows,
+            )
+
+
+def downgrade() -> None:
+    """
+    Rollback the database upgrade
+    """
+    for table in sorted_tables:
+        for column in timestamp_columns:
+            op.drop_index(op.f(f"ix_{table}_{column}"), table_name=table)
@@ -0,0 +1,52 @@
+"""Name pattern indexes
+
+Revision ID: 1b3d4ff27b61
+Revises: 5297adc5c02c
+Create Date: 2026-10-18 07:31:42.556019
+
+PostgreSQL: add live row `text_pattern_ops` indexes on `name`, so the
+byte order `name_prefix` range (`~>=~` / `~<~`) is an index range scan
+whatever the database collation. SQLite's `ix_*_name` indexes already
+use the byte order (`BINARY`) collation.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "1b3d4ff27b61"
+down_revision: Union[str, None] = "5297adc5c02c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+prefix_tables = ["animals", "exhibits", "staff"]
+
+live_rows = sa.text("deleted_at IS NULL")
+
+
+def upgrade() -> None:
+    """
+    Upgrade the database
+    """
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table in prefix_tables:
+        op.create_index(
+            f"ix_{table}_name_pattern",
+            table,
+            ["name"],
+            unique=False,
+            postgresql_ops={"name": "text_pattern_ops"},
+            postgresql_where=live_rows,
+        )
+
+
+def downgrade() -> None:
+    """
+    Rollback the database upgrade
+    """
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table in prefix_tables:
+        op.drop_index(f"ix_{table}_name_pattern", table_name=table)
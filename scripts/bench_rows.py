@@ -0,0 +1,132 @@
+"""
+Benchmark reading list rows as ORM entities vs Core row mappings
+
+Each strategy fetches every live animal, validates the rows into
+`AnimalsRead` models and dumps them to JSON bytes, the work a list or
+export request does. The best of `--repeat` runs is reported per size.
+
+Run it from the project root, it uses a temporary SQLite database:
+
+    python scripts/bench_rows.py --rows 100 10000 1000000
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, List
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from zoo.api.fields import fields_columns
+from zoo.api.responses import list_adapter, validate_all
+from zoo.models import Animals
+from zoo.models.base import Base
+from zoo.schemas.animals import AnimalsRead
+
+Strategy = Callable[["async_sessionmaker[AsyncSession]"], Awaitable[bytes]]
+
+
+async def orm_entities(sessionmaker: "async_sessionmaker[AsyncSession]") -> bytes:
+    """
+    Select the mapped entity, the approach before row mappings
+    """
+    async with sessionmaker() as session:
+        result = await session.execute(select(Animals).order_by(Animals.id))
+        models = validate_all(AnimalsRead, result.scalars().all())
+    return list_adapter(AnimalsRead).dump_json(models)
+
+
+async def core_mappings(sessionmaker: "async_sessionmaker[AsyncSession]") -> bytes:
+    """
+    Select the read model's columns and validate the row mappings
+    """
+    columns = fields_columns(Animals, AnimalsRead, None)
+    async with sessionmaker() as session:
+        result = await session.execute(select(*columns).order_by(Animals.id))
+        models = validate_all(AnimalsRead, result.mappings().all())
+    return list_adapter(AnimalsRead).dump_json(models)
+
+
+async def populate(engine: AsyncEngine, rows: int) -> None:
+    """
+    Create the tables and insert `rows` animals
+    """
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+        batch = 10_000
+        for start in range(0, rows, batch):
+            values = [
+                {
+                    "name": f"Animal {number}",
+                    "description": "A benchmark animal",
+                    "species": "Benchmark",
+                }
+                for number in range(start, min(start + batch, rows))
+            ]
+            await connection.execute(insert(Animals), values)
+
+
+async def best_time(
+    strategy: Strategy,
+    sessionmaker: "async_sessionmaker[AsyncSession]",
+    repeat: int,
+) -> float:
+    """
+    Run a strategy `repeat` times and return the fastest run in seconds
+    """
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await strategy(sessionmaker)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def format_time(seconds: float) -> str:
+    """
+    Format a duration like the benchmark table, in ms below a second
+    """
+    if seconds < 1:
+        return f"{seconds * 1000:,.1f} ms"
+    return f"{seconds:,.1f} s"
+
+
+async def main(sizes: List[int], repeat: int) -> None:
+    """
+    Benchmark both strategies for every table size
+    """
+    sys.stdout.write(f"{'rows':>10}  {'ORM entity':>12}  {'Core mappings':>14}\n")
+    for rows in sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            database = Path(directory) / "bench.sqlite"
+            engine = create_async_engine(f"sqlite+aiosqlite:///{database}")
+            await populate(engine=engine, rows=rows)
+            sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
+            results: List[Any] = [
+                await best_time(strategy, sessionmaker, repeat)
+                for strategy in (orm_entities, core_mappings)
+            ]
+            await engine.dispose()
+        orm_time, core_time = (format_time(result) for result in results)
+        sys.stdout.write(f"{rows:>10,}  {orm_time:>12}  {core_time:>14}\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=[100, 10_000], help="Table sizes"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Runs per strategy, the best is kept"
+    )
+    arguments = parser.parse_args()
+    asyncio.run(main(sizes=arguments.rows, repeat=arguments.repeat))
@@ -4,10 +4,13 @@ API Tests: /animals
 
 import datetime
 from os import environ
+from typing import List
 
 from fastapi.testclient import TestClient
 
+from zoo.cache import MemoryCache
 from zoo.schemas.animals import AnimalsCreate, AnimalsRead, AnimalsUpdate
+from zoo.schemas.include import CompoundDocument
 
 
 def test_get_animals(migrated_client: TestClient) -> None:
@@ -90,3 +93,391 @@ def test_delete_animal(migrated_client: TestClient) -> None:
     response_data = response.json()
     animal = AnimalsRead(**response_data)
     assert animal.deleted_at is not None
+
+
+def test_get_animals_cursor(migrated_client: TestClient) -> None:
+    """
+    Test GET /animals - keyset pagination
+    """
+    response = migrated_client.get("/animals", params={"limit": 2})
+    assert response.status_code == 200
+    first_page = [AnimalsRead(**animal) for animal in response.json()]
+    next_cursor = response.headers["X-Next-Cursor"]
+    assert response.links["next"]["url"].endswith(f"cursor={next_cursor}")
+    response = migrated_client.get(response.links["next"]["url"])
+    assert response.status_code == 200
+    second_page = [AnimalsRead(**animal) for animal in response.json()]
+    assert len(second_page) == 2
+    assert second_page[0].id > first_page[-1].id
+
+
+def test_get_animals_cursor_failure(migrated_client: TestClient) -> None:
+    """
+    Test GET /animals - invalid cursor
+    """
+    response = migrated_client.get("/animals", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Error: invalid cursor"}
+
+
+def test_export_animals(migrated_client: TestClient) -> None:
+    """
+    Test GET /animals/export
+    """
+    response = migrated_client.get("/animals/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = response.text.splitlines()
+    animals = [AnimalsRead.model_validate_json(line) for line in lines]
+    assert len(animals) == len({animal.id for animal in animals})
+    assert all(animal.deleted_at is None for animal in animals)
+
+
+def test_bulk_create_animals(migrated_client: TestClient) -> None:
+    """
+    Test POST /animals/bulk
+    """
+    test_name = environ["PYTEST_CURRENT_TEST"].split(":")[-1].split(" ")[0]
+    animals_body = [
+        AnimalsCreate(name=f"{test_name}-{i}", species="test").model_dump()
+        for i in range(3)
+    ]
+    response = migrated_client.post("/animals/bulk", json=animals_body)
+    assert response.status_code == 200
+    animals = [AnimalsRead(**animal) for animal in response.json()]
+    assert sorted(animal.name for animal in animals) == [
+        f"{test_name}-{i}" for i in range(3)
+    ]
+
+
+def test_bulk_create_animals_order(migrated_client: TestClient) -> None:
+    """
+    Test POST /animals/bulk - results follow the request order
+    """
+    test_name = environ["PYTEST_CURRENT_TEST"].split(":")[-1].split(" ")[0]
+    response = migrated_client.post("/animals/bulk", json=[{"name": test_name}])
+    free_id = response.json()[0]["id"] + 1000
+    animals_body = [
+        {"name": f"{test_name}-0"},
+        {"id": free_id, "name": f"{test_name}-1"},
+        {"name": f"{test_name}-2"},
+        {"id": free_id + 1, "name": f"{test_name}-3"},
+        {"name": f"{test_name}-4"},
+    ]
+    response = migrated_client.post("/animals/bulk", json=animals_body)
+    assert response.status_code == 200
+    animals = [AnimalsRead(**animal) for animal in response.json()]
+    assert [animal.name for animal in animals] == [
+        animal["name"] for animal in animals_body
+    ]
+    assert [animal.id for animal in animals][1::2] == [free_id, free_id + 1]
+    animals_body = [
+        {"name": f"{test_name}-5"},
+        {"id": free_id, "name": f"{test_name}-6"},
+        {"name": f"{test_name}-7"},
+    ]
+    response = migrated_client.post(
+        "/animals/bulk", json=animals_body, params={"on_conflict": "ignore"}
+    )
+    names = [animal["name"] for animal in response.json()]
+    assert names == [f"{test_name}-5", f"{test_name}-7"]
+
+
+def test_bulk_upsert_animals(migrated_client: TestClient) -> None:
+    """
+    Test POST /animals/bulk - on_conflict
+    """
+    test_name = environ["PYTEST_CURRENT_TEST"].split(":")[-1].split(" ")[0]
+    response = migrated_client.post("/animals/bulk", json=[{"name": test_name}])
+    existing = AnimalsRead(**response.json()[0])
+    upsert_body = [{"id": existing.id, "name": test_name, "species": "upserted"}]
+    response = migrated_client.post("/animals/bulk", json=upsert_body)
+    assert response.status_code == 409
+    response = migrated_client.post(
+        "/animals/bulk", json=upsert_body, params={"on_conflict": "ignore"}
+    )
+    assert response.status_code == 200
+    assert response.json() == []
+    response = migrated_client.post(
+        "/animals/bulk", json=upsert_body, params={"on_conflict": "update"}
+    )
+    assert response.status_code == 200
+    animal = AnimalsRead(**response.json()[0])
+    assert animal.id == existing.id
+    assert animal.species == "upserted"
+
+
+def test_get_animals_filter(migrated_client: TestClient) -> None:
+    """
+    Test GET /animals - filters
+    """
+    response = migrated_client.get(
+        "/animals", params={"species": "Panthera tigris", "name_prefix": "Ti"}
+    )
+    assert response.status_code == 200
+    animals = [AnimalsRead(**animal) for animal in response.json()]
+    assert {animal.name for animal in animals} == {"Tiger"}
+    for name_prefix in ["ti", "T%", "T_ger"]:
+        response = migrated_client.get("/animals", params={"name_prefix": name_prefix})
+        assert response.json() == []
+
+
+def test_get_animals_sort_cursor(migrated_client: TestClient) -> None:
+    """
+    Test GET /animals - sorting with keyset pagination
+    """
+    response = migrated_client.get("/animals", params={"sort": "-name", "limit": 2})
+    names = [animal["name"] for animal in response.json()]
+    while "next" in response.links:
+        response = migrated_client.get(response.links["next"]["url"])
+        assert response.status_code == 200
+        names.extend(animal["name"] for animal in response.json())
+    assert names == sorted(names, reverse=True)
+    assert len(names) == len(migrated_client.get("/animals").json())
+
+
+def test_get_animals_sort_cursor_failure(migrated_client: TestClient) -> None:
+    """
+    Test GET /animals - cursor used with a different sort order
+    """
+    response = migrated_client.get("/animals", params={"sort": "name", "limit": 1})
+    cursor = response.headers["X-Next-Cursor"]
+    response = migrated_client.get("/animals", params={"cursor": cursor})
+    assert response.status_code == 400
+
+
+def test_get_animals_sort_timestamp_cursor(migrated_client: TestClient) -> None:
+    """
+    Test GET /animals - keyset pagination over a timestamp sort
+    """
+    response = migrated_client.get(
+        "/animals", params={"sort": "-updated_at", "limit": 2}
+    )
+    ids = [animal["id"] for animal in response.json()]
+    while "next" in response.links:
+        response = migrated_client.get(response.links["next"]["url"])
+        ids.extend(animal["id"] for animal in response.json())
+    assert sorted(ids) == [
+        animal["id"] for animal in migrated_client.get("/animals").json()
+    ]
+
+
+def test_get_animals_count(migrated_client: TestClient) -> None:
+    """
+    Test GET /animals - exact total count is invalidated by writes
+    """
+    response = migrated_client.get("/animals", params={"count": "exact", "limit": 1})
+    assert response.status_code == 200
+    total = int(response.headers["X-Total-Count"])
+    assert total >= len(response.json())
+    response = migrated_client.post("/animals", json={"name": "Counted"})
+    animal_id = response.json()["id"]
+    response = migrated_client.get("/animals", params={"count": "exact", "limit": 1})
+    assert int(response.headers["X-Total-Count"]) == total + 1
+    migrated_client.delete(f"/animals/{animal_id}")
+    response = migrated_client.get("/animals", params={"count": "exact", "limit": 1})
+    assert int(response.headers["X-Total-Count"]) == total
+    response = migrated_client.get(
+        "/animals", params={"count": "exact", "name_prefix": "Counted"}
+    )
+    assert response.headers["X-Total-Count"] == "0"
+
+
+def test_get_animals_count_shared(migrated_client: TestClient) -> None:
+    """
+    Test GET /animals - exact counts are invalidated by other workers' writes
+    """
+    from zoo.api.count import count_cache
+    from zoo.cache import BroadcastCache, FileBus
+
+    assert isinstance(count_cache, BroadcastCache)
+    assert isinstance(count_cache.bus, FileBus)
+    response = migrated_client.get("/animals", params={"count": "exact", "limit": 1})
+    total = response.headers["X-Total-Count"]
+    count_cache.set(("animals", "{}"), -1)
+    response = migrated_client.get("/animals", params={"count": "exact", "limit": 1})
+    assert response.headers["X-Total-Count"] == "-1"
+    other_worker = BroadcastCache(
+        MemoryCache(max_size=10, ttl=60), FileBus(count_cache.bus.path)
+    )
+    other_worker.delete_matching(("animals", None))
+    response = migrated_client.get("/animals", params={"count": "exact", "limit": 1})
+    assert response.headers["X-Total-Count"] == total
+
+
+def test_get_animals_count_estimated(migrated_client: TestClient) -> None:
+    """
+    Test GET /animals - estimated total count
+    """
+    response = migrated_client.get("/animals", params={"count": "estimated"})
+    assert response.status_code == 200
+    assert int(response.headers["X-Total-Count"]) >= 0
+    response = migrated_client.get("/animals")
+    assert "X-Total-Count" not in response.headers
+
+
+def test_get_animal_not_modified(migrated_client: TestClient) -> None:
+    """
+    Test GET /animals/{animal_id} - conditional requests
+    """
+    response = migrated_client.post("/animals", json={"name": "Etag"})
+    animal_id = response.json()["id"]
+    response = migrated_client.get(f"/animals/{animal_id}")
+    etag = response.headers["ETag"]
+    last_modified = response.headers["Last-Modified"]
+    response = migrated_client.get(
+        f"/animals/{animal_id}", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+    response = migrated_client.get(
+        f"/animals/{animal_id}", headers={"If-Modified-Since": last_modified}
+    )
+    assert response.status_code == 304
+    response = migrated_client.get(
+        f"/animals/{animal_id}",
+        params={"fields": "name"},
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == 200
+    migrated_client.patch(f"/animals/{animal_id}", json={"species": "Etag"})
+    response = migrated_client.get(
+        f"/animals/{animal_id}", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_get_animals_not_modified(migrated_client: TestClient) -> None:
+    """
+    Test GET /animals - conditional requests, versioned by the page's rows
+    """
+    response = migrated_client.get("/animals", params={"limit": 2})
+    etag = response.headers["ETag"]
+    assert etag.startswith('W/"')
+    response = migrated_client.get(
+        "/animals", params={"limit": 2}, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    response = migrated_client.get(
+        "/animals", params={"limit": 3}, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    migrated_client.post("/animals", json={"name": "Etags"})
+    response = migrated_client.get(
+        "/animals", params={"limit": 2}, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    first_id = migrated_client.get("/animals", params={"limit": 2}).json()[0]["id"]
+    migrated_client.patch(f"/animals/{first_id}", json={"description": "Etags"})
+    response = migrated_client.get(
+        "/animals", params={"limit": 2}, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+
+
+def test_get_animals_serialized(migrated_client: TestClient) -> None:
+    """
+    Test GET /animals - serialized JSON keeps the route's headers
+    """
+    response = migrated_client.get(
+        "/animals", params={"count": "exact", "fields": "id,name", "limit": 2}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert int(response.headers["content-length"]) == len(response.content)
+    assert "ETag" in response.headers
+    assert "X-Total-Count" in response.headers
+    assert all(set(animal) == {"id", "name"} for animal in response.json())
+
+
+def test_update_animal_unchanged(
+    migrated_client: TestClient, sql_statements: List[str]
+) -> None:
+    """
+    Test PATCH /animals/{animal_id} - unchanged values and missing animals
+    """
+    response = migrated_client.post("/animals", json={"name": "Steady"})
+    animal = AnimalsRead(**response.json())
+    sql_statements.clear()
+    response = migrated_client.patch(f"/animals/{animal.id}", json={"name": "Steady"})
+    assert response.status_code == 200
+    assert AnimalsRead(**response.json()).updated_at == animal.updated_at
+    assert [statement.split()[0] for statement in sql_statements] == [
+        "UPDATE",
+        "SELECT",
+    ]
+    sql_statements.clear()
+    response = migrated_client.patch(f"/animals/{animal.id}", json={"name": "Moved"})
+    assert response.status_code == 200
+    assert response.json()["name"] == "Moved"
+    assert [statement.split()[0] for statement in sql_statements] == ["UPDATE"]
+    response = migrated_client.patch(f"/animals/{animal.id}", json={})
+    assert response.status_code == 200
+    migrated_client.delete(f"/animals/{animal.id}")
+    response = migrated_client.patch(f"/animals/{animal.id}", json={"name": "Gone"})
+    assert response.status_code == 404
+    response = migrated_client.delete(f"/animals/{animal.id}")
+    assert response.status_code == 404
+
+
+def test_get_animals_ids(migrated_client: TestClient) -> None:
+    """
+    Test GET /animals?ids= and POST /animals/lookup
+    """
+    response = migrated_client.post("/animals", json={"name": "Vanished"})
+    deleted_id = response.json()["id"]
+    migrated_client.delete(f"/animals/{deleted_id}")
+    ids = [3, 1, 999999, deleted_id, 2]
+    response = migrated_client.get(
+        "/animals", params={"ids": ",".join(map(str, ids)), "fields": "id"}
+    )
+    assert response.status_code == 200
+    assert response.json() == [{"id": 3}, {"id": 1}, {"id": 2}]
+    assert response.headers["X-Not-Found-Ids"] == "999999"
+    assert response.headers["X-Deleted-Ids"] == str(deleted_id)
+    response = migrated_client.post("/animals/lookup", json={"ids": ids})
+    assert response.status_code == 200
+    assert [animal["id"] for animal in response.json()] == [3, 1, 2]
+    response = migrated_client.post("/animals/lookup", json={"ids": []})
+    assert response.status_code == 422
+
+
+def test_get_animals_include(migrated_client: TestClient) -> None:
+    """
+    Test GET /animals?include= - side-loaded exhibits and staff
+    """
+    response = migrated_client.get(
+        "/animals", params={"include": "exhibit,exhibit.staff", "fields": "id"}
+    )
+    assert response.status_code == 200
+    document = response.json()
+    assert all(set(animal) == {"id"} for animal in document["data"])
+    exhibit_ids = [exhibit["id"] for exhibit in document["included"]["exhibits"]]
+    assert exhibit_ids == sorted(set(exhibit_ids))
+    staff = document["included"]["staff"]
+    assert all(member["exhibit_id"] in exhibit_ids for member in staff)
+    response = migrated_client.get("/animals/1", params={"include": "exhibit"})
+    assert response.status_code == 200
+    document = response.json()
+    assert document["data"]["id"] == 1
+    exhibit = document["included"]["exhibits"][0]
+    assert exhibit["id"] == document["data"]["exhibit_id"]
+    assert set(document["included"]) == {"exhibits"}
+    CompoundDocument[AnimalsRead].model_validate(document)
+    response = migrated_client.get("/animals", params={"include": "keeper"})
+    assert response.status_code == 400
+
+
+def test_get_animals_include_schema(migrated_client: TestClient) -> None:
+    """
+    Test the OpenAPI schema declares the `?include=` compound document
+    """
+    schema = migrated_client.get("/openapi.json").json()
+    operation = schema["paths"]["/animals/{animal_id}"]["get"]
+    content = operation["responses"]["200"]["content"]["application/json"]
+    refs = {option["$ref"].rsplit("/", 1)[-1] for option in content["schema"]["anyOf"]}
+    assert refs == {"AnimalsRead", "CompoundDocument_AnimalsRead_"}
+    included = schema["components"]["schemas"]["IncludedRecords"]["properties"]
+    assert set(included) == {"animals", "exhibits", "staff"}
@@ -2,8 +2,13 @@
 Test the Auth API
 """
 
+import asyncio
+from typing import List
+
 from fastapi.testclient import TestClient
 
+from zoo.schemas.utils import HashingStats
+
 
 def test_get_access_token(migrated_client: TestClient) -> None:
     """
@@ -31,3 +36,109 @@ def test_get_cookie(migrated_client: TestClient) -> None:
     assert response.status_code == 204
     assert "zoo-auth" in response.cookies
     assert len(response.cookies["zoo-auth"]) == 181
+
+
+def test_cached_access_token(
+    migrated_client: TestClient, sql_statements: List[str]
+) -> None:
+    """
+    Test access tokens are read from the auth cache until logout
+    """
+    from fastapi import Depends
+
+    from zoo.app import app
+    from zoo.models.users import (
+        User,
+        access_token_key,
+        auth_cache,
+        current_active_user,
+    )
+
+    async def current_user(user: User = Depends(current_active_user)) -> str:
+        return user.email
+
+    app.router.add_api_route(
+        "/auth/current-user", current_user, tags=["auth"], include_in_schema=False
+    )
+    try:
+        response = migrated_client.post(
+            "/auth/jwt/login",
+            data={"username": "test@testing.com", "password": "password"},
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        token = response.json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        response = migrated_client.get("/auth/current-user", headers=headers)
+        assert response.json() == "test@testing.com"
+        assert auth_cache.get(access_token_key(token)) is not None
+        sql_statements.clear()
+        response = migrated_client.get("/auth/current-user", headers=headers)
+        assert response.json() == "test@testing.com"
+        assert sql_statements == []
+        cookie_response = migrated_client.post(
+            "/auth/cookie/login",
+            data={"username": "test@testing.com", "password": "password"},
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        hits = auth_cache.statistics.hits
+        for _ in range(2):
+            migrated_client.cookies.set("zoo-auth", cookie_response.cookies["zoo-auth"])
+            response = migrated_client.post("/auth/cookie/logout")
+            assert response.status_code == 204
+        assert auth_cache.statistics.hits >= hits + 1
+        migrated_client.cookies.clear()
+        response = migrated_client.post("/auth/jwt/logout", headers=headers)
+        assert response.status_code == 204
+        assert auth_cache.get(access_token_key(token)) is None
+        response = migrated_client.get("/auth/current-user", headers=headers)
+        assert response.status_code == 401
+        response = migrated_client.post("/auth/jwt/logout", headers=headers)
+        assert response.status_code == 401
+    finally:
+        app.router.routes.pop()
+        migrated_client.cookies.clear()
+
+
+def test_hashing_stats(migrated_client: TestClient) -> None:
+    """
+    Test logins verify passwords in the hashing pool
+    """
+    completed = migrated_client.get("/stats/hashing").json()["completed"]
+    response = migrated_client.post(
+        "/auth/jwt/login",
+        data={"username": "test@testing.com", "password": "wrong-password"},
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    assert response.status_code == 400
+    response = migrated_client.get("/stats/hashing")
+    assert response.status_code == 200
+    stats = HashingStats(**response.json())
+    assert stats.completed == completed + 1
+    assert stats.pending == 0
+    assert stats.rejected == 0
+
+
+def test_purge_expired_tokens(migrated_client: TestClient) -> None:
+    """
+    Test expired access tokens are purged in batches
+    """
+    from zoo.tokens import purge_expired_tokens
+
+    tokens = [
+        migrated_client.post(
+            "/auth/jwt/login",
+            data={"username": "test@testing.com", "password": "password"},
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        ).json()["access_token"]
+        for _ in range(2)
+    ]
+    result = asyncio.run(purge_expired_tokens(max_age=3600, batch_size=1))
+    assert result.deleted == 0
+    result = asyncio.run(purge_expired_tokens(max_age=0, batch_size=1))
+    assert result.deleted >= len(tokens)
+    assert result.batches == result.deleted + 1
+    migrated_client.cookies.clear()
+    response = migrated_client.post(
+        "/auth/jwt/logout", headers={"Authorization": f"Bearer {tokens[0]}"}
+    )
+    assert response.status_code == 401
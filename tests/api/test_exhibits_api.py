@@ -7,7 +7,12 @@ from os import environ
 
 from fastapi.testclient import TestClient
 
-from zoo.schemas.exhibits import ExhibitsCreate, ExhibitsRead, ExhibitsUpdate
+from zoo.schemas.exhibits import (
+    ExhibitsCreate,
+    ExhibitsFull,
+    ExhibitsRead,
+    ExhibitsUpdate,
+)
 from zoo.schemas.staff import StaffRead
 
 
@@ -100,3 +105,99 @@ def test_get_exhibit_staff(migrated_client: TestClient) -> None:
     assert response.status_code == 200
     first_staff = StaffRead(**response.json()[0])
     assert isinstance(first_staff.updated_at, datetime.datetime)
+
+
+def test_get_exhibit_animals_excludes_deleted(migrated_client: TestClient) -> None:
+    """
+    Test GET /exhibits/{exhibit_id}/animals - soft-deleted animals are excluded
+    """
+    response = migrated_client.post("/animals", json={"name": "Ghost", "exhibit_id": 3})
+    animal_id = response.json()["id"]
+    response = migrated_client.get("/exhibits/3/animals")
+    assert animal_id in [animal["id"] for animal in response.json()]
+    migrated_client.delete(f"/animals/{animal_id}")
+    response = migrated_client.get("/exhibits/3/animals")
+    assert response.status_code == 200
+    assert animal_id not in [animal["id"] for animal in response.json()]
+
+
+def test_get_exhibit_animals_failure(migrated_client: TestClient) -> None:
+    """
+    Test GET /exhibits/{exhibit_id}/animals - missing exhibit
+    """
+    response = migrated_client.get("/exhibits/9999/animals")
+    assert response.status_code == 404
+
+
+def test_get_exhibit_animals_paginated(migrated_client: TestClient) -> None:
+    """
+    Test GET /exhibits/{exhibit_id}/animals - cursor pagination and filters
+    """
+    for name in ("Paged One", "Paged Two"):
+        migrated_client.post("/animals", json={"name": name, "exhibit_id": 4})
+    response = migrated_client.get("/exhibits/4/animals", params={"count": "exact"})
+    animal_ids = [animal["id"] for animal in response.json()]
+    assert animal_ids == sorted(animal_ids)
+    assert int(response.headers["X-Total-Count"]) == len(animal_ids)
+    response = migrated_client.get("/exhibits/4/animals", params={"limit": 1})
+    assert [animal["id"] for animal in response.json()] == animal_ids[:1]
+    cursor = response.headers["X-Next-Cursor"]
+    response = migrated_client.get(
+        "/exhibits/4/animals", params={"limit": 1, "cursor": cursor}
+    )
+    assert [animal["id"] for animal in response.json()] == animal_ids[1:2]
+    response = migrated_client.get(
+        "/exhibits/4/animals", params={"name_prefix": "Paged", "fields": "name"}
+    )
+    assert response.json() == [{"name": "Paged One"}, {"name": "Paged Two"}]
+
+
+def test_get_exhibits_full(migrated_client: TestClient) -> None:
+    """
+    Test GET /exhibits/full and /exhibits/{exhibit_id}/full
+    """
+    response = migrated_client.get("/exhibits/full", params={"limit": 2})
+    assert response.status_code == 200
+    for exhibit in response.json():
+        full_view = ExhibitsFull(**exhibit)
+        assert full_view.animals_count == len(full_view.animals)
+        assert all(animal.exhibit_id == full_view.id for animal in full_view.animals)
+    response = migrated_client.get("/exhibits/1/full")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    staff_count = response.json()["staff_count"]
+    response = migrated_client.get("/exhibits/1/full", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    migrated_client.post("/staff", json={"name": "New Hire", "exhibit_id": 1})
+    response = migrated_client.get("/exhibits/1/full", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["staff_count"] == staff_count + 1
+    response = migrated_client.get("/exhibits/9999/full")
+    assert response.status_code == 404
+
+
+def test_get_exhibits_full_embed_limit(migrated_client: TestClient) -> None:
+    """
+    Test GET /exhibits/full embeds at most `embed_limit` members, with exact counts
+    """
+    migrated_client.post("/staff", json={"name": "Second Hire", "exhibit_id": 1})
+    response = migrated_client.get("/exhibits/1/full", params={"embed_limit": 1})
+    assert response.status_code == 200
+    full_view = ExhibitsFull(**response.json())
+    assert len(full_view.staff) == 1
+    assert full_view.staff_count > 1
+    response = migrated_client.get("/exhibits/1/full", params={"embed_limit": 0})
+    assert response.json()["animals"] == []
+    response = migrated_client.get(
+        "/exhibits/full", params={"limit": 1, "embed_limit": 1}
+    )
+    etag = response.headers["ETag"]
+    exhibit_id = response.json()[0]["id"]
+    other = migrated_client.post("/staff", json={"name": "Elsewhere", "exhibit_id": 3})
+    assert other.json()["exhibit_id"] != exhibit_id
+    response = migrated_client.get(
+        "/exhibits/full",
+        params={"limit": 1, "embed_limit": 1},
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == 304
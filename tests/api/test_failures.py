@@ -2,8 +2,12 @@
 API Tests: /animals
 """
 
+import pytest
+from fastapi import Request, Response
 from fastapi.testclient import TestClient
 
+from zoo.api.pagination import next_page
+
 
 def test_get_bad_endpoint(migrated_client: TestClient) -> None:
     """
@@ -12,3 +16,37 @@ def test_get_bad_endpoint(migrated_client: TestClient) -> None:
     response = migrated_client.get("/badEndpoint")
     assert response.status_code == 404
     assert response.json() == {"detail": "Not Found"}
+
+
+@pytest.mark.parametrize(
+    "endpoint",
+    [
+        "/animals",
+        "/exhibits",
+        "/staff",
+        "/exhibits/1/animals",
+        "/exhibits/1/staff",
+        "/exhibits/full",
+        "/search?q=cat",
+    ],
+)
+@pytest.mark.parametrize("limit", [0, -1])
+def test_get_page_limit_failure(
+    migrated_client: TestClient, endpoint: str, limit: int
+) -> None:
+    """
+    Reject page sizes below one
+    """
+    response = migrated_client.get(endpoint, params={"limit": limit})
+    assert response.status_code == 422
+    assert [error["loc"] for error in response.json()["detail"]] == [["query", "limit"]]
+
+
+def test_next_page_empty() -> None:
+    """
+    An empty page has no next page
+    """
+    request = Request({"type": "http", "query_string": b"", "headers": []})
+    response = Response()
+    assert next_page(rows=[1, 2], limit=0, request=request, response=response) == []
+    assert "X-Next-Cursor" not in response.headers
@@ -0,0 +1,50 @@
+"""
+API Tests: /search
+"""
+
+from fastapi.testclient import TestClient
+
+from zoo.schemas.search import SearchResult
+
+
+def test_search(migrated_client: TestClient) -> None:
+    """
+    Test GET /search
+    """
+    response = migrated_client.get("/search", params={"q": "exhibit"})
+    assert response.status_code == 200
+    results = [SearchResult(**result) for result in response.json()]
+    assert {result.entity_type for result in results} == {"exhibits"}
+    ranks = [result.rank for result in results]
+    assert ranks == sorted(ranks, reverse=True)
+    response = migrated_client.get("/search", params={"q": "exhibit", "limit": 1})
+    assert len(response.json()) == 1
+
+
+def test_search_index_sync(migrated_client: TestClient) -> None:
+    """
+    Test GET /search - created, updated and deleted records
+    """
+    response = migrated_client.post(
+        "/animals", json={"name": "Quokka", "description": "Smiling marsupial"}
+    )
+    animal_id = response.json()["id"]
+    response = migrated_client.get("/search", params={"q": "marsupials"})
+    assert [(r["entity_type"], r["id"]) for r in response.json()] == [
+        ("animals", animal_id)
+    ]
+    migrated_client.patch(f"/animals/{animal_id}", json={"description": "Wallaby"})
+    assert migrated_client.get("/search", params={"q": "marsupial"}).json() == []
+    migrated_client.delete(f"/animals/{animal_id}")
+    assert migrated_client.get("/search", params={"q": "quokka"}).json() == []
+
+
+def test_search_syntax(migrated_client: TestClient) -> None:
+    """
+    Test GET /search - query syntax is treated as text
+    """
+    response = migrated_client.get("/search", params={"q": 'lion" OR NEAR(*'})
+    assert response.status_code == 200
+    response = migrated_client.get("/search", params={"q": "!!!"})
+    assert response.status_code == 200
+    assert response.json() == []
@@ -77,3 +77,60 @@ def test_update_staff(migrated_client: TestClient) -> None:
     response_data = response.json()
     staff = StaffRead(**response_data)
     assert staff.notes == test_name
+
+
+def test_bulk_update_and_delete_staff(migrated_client: TestClient) -> None:
+    """
+    Test PATCH /staff/bulk and DELETE /staff/bulk
+    """
+    test_name = environ["PYTEST_CURRENT_TEST"].split(":")[-1].split(" ")[0]
+    staff_body = [
+        StaffCreate(name=f"{test_name}-{i}", exhibit_id=4).model_dump()
+        for i in range(2)
+    ]
+    response = migrated_client.post("/staff/bulk", json=staff_body)
+    staff_ids = sorted(StaffRead(**staff).id for staff in response.json())
+    response = migrated_client.patch(
+        "/staff/bulk",
+        params={"ids": ",".join(str(staff_id) for staff_id in staff_ids)},
+        json=StaffUpdate(job_title=test_name).model_dump(exclude_unset=True),
+    )
+    assert response.status_code == 200
+    assert response.json() == {"count": 2, "ids": staff_ids}
+    response = migrated_client.delete("/staff/bulk", params={"exhibit_id": 4})
+    assert response.status_code == 200
+    assert response.json() == {"count": 2, "ids": staff_ids}
+    response = migrated_client.get(f"/staff/{staff_ids[0]}")
+    assert response.status_code == 404
+
+
+def test_bulk_delete_staff_failure(migrated_client: TestClient) -> None:
+    """
+    Test DELETE /staff/bulk - missing ids and filters
+    """
+    response = migrated_client.delete("/staff/bulk")
+    assert response.status_code == 400
+    response = migrated_client.delete("/staff/bulk", params={"ids": "1,one"})
+    assert response.status_code == 400
+
+
+def test_get_staff_members_fields(migrated_client: TestClient) -> None:
+    """
+    Test GET /staff - sparse fieldset
+    """
+    response = migrated_client.get("/staff", params={"fields": "id,name", "limit": 1})
+    assert response.status_code == 200
+    assert list(response.json()[0].keys()) == ["id", "name"]
+    assert "X-Next-Cursor" in response.headers
+
+
+def test_get_staff_fields(migrated_client: TestClient) -> None:
+    """
+    Test GET /staff/{staff_id} - sparse fieldset
+    """
+    response = migrated_client.get("/staff/1", params={"fields": "name,exhibit_id"})
+    assert response.status_code == 200
+    assert response.json() == {"name": "John Doe", "exhibit_id": 1}
+    response = migrated_client.get("/staff/1", params={"fields": "name,salary"})
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Error: invalid fields - salary"}
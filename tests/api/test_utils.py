@@ -2,11 +2,21 @@
 Utils Testing
 """
 
+import asyncio
 import datetime
+import pathlib
+import sqlite3
+from typing import Any, Dict
 
 from fastapi.testclient import TestClient
+from pytest import MonkeyPatch, raises
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
-from zoo.schemas.utils import Health
+from zoo.cache import MemoryCache, get_read_cache
+from zoo.config import app_config
+from zoo.schemas.utils import CacheStats, Health, PoolStats
 
 
 def test_get_health(migrated_client: TestClient) -> None:
@@ -28,3 +38,172 @@ def test_swagger_docs(migrated_client: TestClient) -> None:
     response = migrated_client.get("/docs")
     assert response.status_code == 200
     assert response.headers["content-type"] == "text/html; charset=utf-8"
+
+
+def test_read_cache(migrated_client: TestClient) -> None:
+    """
+    Test cached reads are invalidated by writes
+    """
+    from zoo.app import app
+
+    cache = MemoryCache(max_size=100, ttl=60)
+    app.dependency_overrides[get_read_cache] = lambda: cache
+    try:
+        migrated_client.get("/animals/1")
+        migrated_client.get("/exhibits/1/animals")
+        response = migrated_client.get("/animals/1")
+        assert response.status_code == 200
+        assert cache.statistics.hits == 1
+        migrated_client.patch("/animals/1", json={"description": "Cached kitty"})
+        response = migrated_client.get("/animals/1")
+        assert response.json()["description"] == "Cached kitty"
+        response = migrated_client.get("/exhibits/1/animals")
+        descriptions = [animal["description"] for animal in response.json()]
+        assert "Cached kitty" in descriptions
+        response = migrated_client.get("/stats/cache")
+        assert response.status_code == 200
+        stats = CacheStats(**response.json())
+        assert stats.enabled is True
+        assert stats.hits == 1
+        assert stats.invalidations == 2
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_read_cache_interleaved_write(migrated_client: TestClient) -> None:
+    """
+    Test a read that races an invalidating write doesn't refill the cache
+    """
+    from sqlalchemy import event
+
+    from zoo.app import app
+    from zoo.cache import entity_key, roster_key
+    from zoo.db import async_read_engine
+    from zoo.models.animals import Animals
+
+    cache = MemoryCache(max_size=100, ttl=60)
+    app.dependency_overrides[get_read_cache] = lambda: cache
+
+    def write_during_read(*args: Any) -> None:
+        # A write commits and invalidates while the row is being read
+        if args[2].startswith("SELECT"):
+            cache.delete(entity_key(Animals, 1))
+
+    event.listen(
+        async_read_engine.sync_engine, "after_cursor_execute", write_during_read
+    )
+    try:
+        assert migrated_client.get("/animals/1").status_code == 200
+        assert migrated_client.get("/exhibits/1/animals").status_code == 200
+        assert migrated_client.get("/exhibits/1").status_code == 200
+        assert cache.size == 0
+    finally:
+        event.remove(
+            async_read_engine.sync_engine, "after_cursor_execute", write_during_read
+        )
+    try:
+        migrated_client.get("/animals/1")
+        migrated_client.get("/exhibits/1/animals")
+        assert cache.get(entity_key(Animals, 1)) is not None
+        assert cache.get(roster_key(1, Animals)) is not None
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_pool_stats(migrated_client: TestClient) -> None:
+    """
+    Test reads check out the SQLite reader pool, not the single writer
+    """
+    response = migrated_client.get("/stats/pool")
+    pools = {
+        stats.name: stats for stats in map(PoolStats.model_validate, response.json())
+    }
+    assert pools["write"].size == 1
+    assert pools["write"].max_overflow == 0
+    assert pools["read"].size == 5
+    migrated_client.get("/animals/1")
+    response = migrated_client.get("/stats/pool")
+    assert response.status_code == 200
+    stats = {
+        stats.name: stats for stats in map(PoolStats.model_validate, response.json())
+    }
+    assert stats["read"].checkouts == pools["read"].checkouts + 1
+    assert stats["write"].checkouts == pools["write"].checkouts
+    assert stats["read"].timeouts == 0
+    assert stats["read"].wait_time_max >= stats["read"].wait_time_avg >= 0
+
+
+def test_sqlite_pragmas(migrated_client: TestClient) -> None:  # noqa: ARG001
+    """
+    Test pooled SQLite connections get the pragmas, and readers can't write
+    """
+    from zoo.db import async_engine, async_read_engine
+
+    async def read_pragmas(engine: Any) -> Dict[str, Any]:
+        async with engine.connect() as connection:
+            return {
+                pragma: (await connection.execute(text(f"PRAGMA {pragma}"))).scalar()
+                for pragma in ("journal_mode", "busy_timeout", "synchronous")
+            }
+
+    async def write(engine: Any) -> None:
+        async with engine.begin() as connection:
+            await connection.execute(
+                text("UPDATE animals SET description = description WHERE id = 1")
+            )
+
+    expected = {"journal_mode": "wal", "busy_timeout": 5000, "synchronous": 1}
+    assert asyncio.run(read_pragmas(async_engine)) == expected
+    assert asyncio.run(read_pragmas(async_read_engine)) == expected
+    with raises(OperationalError, match="attempt to write a readonly database"):
+        asyncio.run(write(async_read_engine))
+    asyncio.run(write(async_engine))
+
+
+def test_read_replica(
+    migrated_client: TestClient, tmp_path: pathlib.Path, monkeypatch: MonkeyPatch
+) -> None:
+    """
+    Test reads go to the replica unless the client wrote recently
+    """
+    import zoo.db
+
+    replica_file = tmp_path / "replica.sqlite"
+    with sqlite3.connect(app_config.DATABASE_FILE) as primary, sqlite3.connect(
+        replica_file
+    ) as replica:
+        primary.backup(replica)
+    replica_engine = zoo.db.create_engine(
+        app_config.database_url(host=None, port=None, database_file=str(replica_file)),
+        reader=True,
+    )
+    monkeypatch.setattr(
+        zoo.db, "async_read_session", async_sessionmaker(replica_engine)
+    )
+    monkeypatch.setattr(zoo.db, "read_replica", True)
+    from zoo.app import app
+
+    cache = MemoryCache(max_size=100, ttl=60)
+    app.dependency_overrides[get_read_cache] = lambda: cache
+    try:
+        response = migrated_client.patch(
+            "/animals/3", json={"description": "Replicated kitty"}
+        )
+        assert response.status_code == 200
+        assert zoo.db.RECENT_WRITE_COOKIE in response.cookies
+        response = migrated_client.get("/animals/3")
+        assert response.json()["description"] == "Replicated kitty"
+        migrated_client.cookies.clear()
+        # An unpinned read refills the cache from the lagging replica
+        response = migrated_client.get("/animals/3")
+        assert response.json()["description"] != "Replicated kitty"
+        assert cache.size == 1
+        migrated_client.cookies.set(zoo.db.RECENT_WRITE_COOKIE, "1")
+        response = migrated_client.get("/animals/3")
+        assert response.json()["description"] == "Replicated kitty"
+        response = migrated_client.get("/animals/export")
+        assert b"Replicated kitty" in response.content
+    finally:
+        app.dependency_overrides.clear()
+        migrated_client.cookies.clear()
+        asyncio.run(replica_engine.dispose())
@@ -4,7 +4,7 @@ Test fixtures for the project.
 
 import pathlib
 from tempfile import TemporaryDirectory
-from typing import Generator
+from typing import Any, Generator, List
 
 import pytest
 from alembic import command
@@ -44,3 +44,29 @@ def migrated_client() -> Generator[TestClient, None, None]:
 
         # Return the test client
         yield TestClient(fastapi_app)
+
+
+@pytest.fixture()
+def sql_statements(
+    migrated_client: TestClient,  # noqa: ARG001
+) -> Generator[List[str], None, None]:
+    """
+    The SQL statements executed by the writer and reader engines.
+
+    Clear the list before the requests whose statements are counted.
+    """
+    from sqlalchemy import event
+
+    from zoo.db import async_engine, async_read_engine
+
+    statements: List[str] = []
+
+    def record(*args: Any) -> None:
+        statements.append(args[2])
+
+    engines = {async_engine.sync_engine, async_read_engine.sync_engine}
+    for engine in engines:
+        event.listen(engine, "after_cursor_execute", record)
+    yield statements
+    for engine in engines:
+        event.remove(engine, "after_cursor_execute", record)
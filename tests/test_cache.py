@@ -0,0 +1,208 @@
+"""
+Read cache tests
+"""
+
+import asyncio
+import pathlib
+import time
+from tempfile import TemporaryDirectory
+from typing import Any, Callable, List
+
+from zoo.cache import (
+    BroadcastCache,
+    FileBus,
+    MemoryCache,
+    NullCache,
+    PostgresBus,
+    build_count_cache,
+)
+from zoo.config import ZooSettings
+
+
+def test_memory_cache_eviction() -> None:
+    """
+    Test the least recently used values are evicted first
+    """
+    cache = MemoryCache(max_size=2, ttl=60)
+    cache.set(("animals", 1), "a")
+    cache.set(("animals", 2), "b")
+    assert cache.get(("animals", 1)) == "a"
+    cache.set(("animals", 3), "c")
+    assert cache.get(("animals", 2)) is None
+    assert cache.get(("animals", 1)) == "a"
+    assert cache.size == 2
+    assert cache.statistics.evictions == 1
+    assert cache.statistics.hits == 2
+    assert cache.statistics.misses == 1
+
+
+def test_memory_cache_expiration() -> None:
+    """
+    Test values expire after the TTL
+    """
+    cache = MemoryCache(max_size=2, ttl=0.01)
+    cache.set(("animals", 1), "a")
+    time.sleep(0.02)
+    assert cache.get(("animals", 1)) is None
+    assert cache.statistics.expirations == 1
+    assert cache.size == 0
+
+
+def test_memory_cache_invalidation() -> None:
+    """
+    Test values are invalidated by key and by predicate
+    """
+    cache = MemoryCache(max_size=10, ttl=60)
+    cache.set(("animals", 1), "a")
+    cache.set(("exhibits", 1, "animals"), ["a"])
+    cache.set(("exhibits", 2, "staff"), ["b"])
+    cache.delete(("animals", 1), ("animals", 2))
+    cache.delete_matching(("exhibits", None, "animals"))
+    assert cache.get(("exhibits", 2, "staff")) == ["b"]
+    assert cache.size == 1
+    assert cache.statistics.invalidations == 2
+
+
+def test_null_cache() -> None:
+    """
+    Test the null cache never stores values
+    """
+    cache = NullCache()
+    cache.set(("animals", 1), "a")
+    assert cache.get(("animals", 1)) is None
+    assert cache.size == 0
+
+
+def test_file_bus() -> None:
+    """
+    Test invalidations are seen by caches sharing a generation file
+    """
+    with TemporaryDirectory() as temp_dir:
+        path = pathlib.Path(temp_dir) / "zoo.sqlite.cache"
+        worker_1 = BroadcastCache(MemoryCache(max_size=10, ttl=60), FileBus(path))
+        worker_2 = BroadcastCache(MemoryCache(max_size=10, ttl=60), FileBus(path))
+        worker_1.set(("animals", 1), "a")
+        worker_2.set(("animals", 1), "a")
+        assert worker_2.get(("animals", 1)) == "a"
+        worker_1.delete(("animals", 1))
+        assert worker_1.get(("animals", 1)) is None
+        assert worker_2.get(("animals", 1)) is None
+        worker_1.set(("animals", 2), "b")
+        assert worker_1.get(("animals", 2)) == "b"
+
+
+def test_cache_generation() -> None:
+    """
+    Test a value loaded before an invalidation isn't cached
+    """
+    cache = MemoryCache(max_size=10, ttl=60)
+    generation = cache.generation
+    cache.delete(("animals", 2))
+    cache.set(("animals", 1), "stale", generation=generation)
+    assert cache.get(("animals", 1)) is None
+    cache.set(("animals", 1), "a", generation=cache.generation)
+    assert cache.get(("animals", 1)) == "a"
+    with TemporaryDirectory() as temp_dir:
+        path = pathlib.Path(temp_dir) / "cache.generation"
+        worker_1 = BroadcastCache(MemoryCache(max_size=10, ttl=60), FileBus(path))
+        worker_2 = BroadcastCache(MemoryCache(max_size=10, ttl=60), FileBus(path))
+        generation = worker_2.generation
+        worker_1.delete(("animals", 1))
+        worker_2.set(("animals", 1), "stale", generation=generation)
+        assert worker_2.get(("animals", 1)) is None
+
+
+def test_build_count_cache(tmp_path: pathlib.Path) -> None:
+    """
+    Test the count cache only gets an invalidation bus when enabled
+    """
+    settings = ZooSettings(CACHE_BUS_DIR=str(tmp_path))
+    assert isinstance(build_count_cache(settings), BroadcastCache)
+    disabled = ZooSettings(CACHE_BUS_DIR=str(tmp_path), COUNT_CACHE_ENABLED=False)
+    assert isinstance(build_count_cache(disabled), NullCache)
+
+
+class FakeServer:
+    """
+    An in-memory stand-in for PostgreSQL `LISTEN` / `NOTIFY`
+    """
+
+    def __init__(self) -> None:
+        self.connections: List["FakeConnection"] = []
+
+    async def connect(self, dsn: str) -> "FakeConnection":  # noqa: ARG002
+        connection = FakeConnection(self)
+        self.connections.append(connection)
+        return connection
+
+
+class FakeConnection:
+    """
+    An asyncpg connection stand-in, `broken` connections fail every query
+    """
+
+    def __init__(self, server: FakeServer) -> None:
+        self.server = server
+        self.listeners: List[Callable[..., None]] = []
+        self.broken = False
+
+    async def add_listener(
+        self,
+        channel: str,  # noqa: ARG002
+        callback: Callable[..., None],
+    ) -> None:
+        self.listeners.append(callback)
+
+    async def execute(self, query: str, *args: Any) -> None:
+        if self.broken:
+            raise ConnectionError("connection lost")
+        if "pg_notify" in query:
+            channel, payload = args
+            for connection in self.server.connections:
+                if not connection.broken:
+                    for callback in connection.listeners:
+                        callback(connection, 0, channel, payload)
+
+    async def close(self) -> None:
+        self.broken = True
+
+
+def test_postgres_bus_reconnect() -> None:
+    """
+    Test a bus reconnects, clears its cache and resends after a lost connection
+    """
+
+    async def run() -> None:
+        server = FakeServer()
+        buses = [PostgresBus(dsn="postgresql://", connect=server.connect) for _ in "ab"]
+        workers = [
+            BroadcastCache(MemoryCache(max_size=10, ttl=60), bus) for bus in buses
+        ]
+        for bus in buses:
+            bus.keepalive_interval = 0.01
+            bus.min_retry_delay = 0.0
+            await bus.start()
+            await bus.wait_connected()
+        for worker in workers:
+            worker.set(("animals", 1), "a")
+        workers[0].delete(("animals", 1))
+        await asyncio.sleep(0.05)
+        assert workers[1].get(("animals", 1)) is None
+        # A lost listening connection is reopened and the missed state cleared
+        workers[1].set(("animals", 2), "b")
+        server.connections[1].broken = True
+        await asyncio.sleep(0.05)
+        await buses[1].wait_connected()
+        assert buses[1].connections == 2
+        assert workers[1].get(("animals", 2)) is None
+        # A notification that failed to send is sent on the new connection
+        workers[1].set(("animals", 3), "c")
+        server.connections[0].broken = True
+        workers[0].delete(("animals", 3))
+        await asyncio.sleep(0.05)
+        assert buses[0].connections == 2
+        assert workers[1].get(("animals", 3)) is None
+        for bus in buses:
+            await bus.stop()
+
+    asyncio.run(run())
@@ -3,6 +3,7 @@ Congiguration tests
 """
 
 import logging
+import pathlib
 
 from zoo.config import ZooSettings
 
@@ -25,3 +26,34 @@ def test_rich_logging_string() -> None:
     assert logger.handlers == []
     ZooSettings.rich_logging(["test_rich_logging_string"])
     assert len(logger.handlers) == 1
+
+
+def test_engine_options() -> None:
+    """
+    Test the asyncpg statement caches are only set for asyncpg
+    """
+    sqlite_settings = ZooSettings(DATABASE_POOL_SIZE=20)
+    assert sqlite_settings.engine_options["pool_size"] == 20
+    assert "connect_args" not in sqlite_settings.engine_options
+    postgres_settings = ZooSettings(
+        DATABASE_DRIVER="postgresql+asyncpg", DATABASE_STATEMENT_CACHE_SIZE=0
+    )
+    connect_args = postgres_settings.engine_options["connect_args"]
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 100
+
+
+def test_cache_bus_dir(tmp_path: pathlib.Path) -> None:
+    """
+    Test the generation files live outside of the package, one directory per database
+    """
+    settings = ZooSettings()
+    assert settings.cache_bus_dir == ZooSettings().cache_bus_dir
+    assert pathlib.Path(settings.DATABASE_FILE).parent not in [
+        settings.cache_bus_dir,
+        *settings.cache_bus_dir.parents,
+    ]
+    other = ZooSettings(DATABASE_FILE=str(tmp_path / "other.sqlite"))
+    assert other.cache_bus_dir != settings.cache_bus_dir
+    configured = ZooSettings(CACHE_BUS_DIR=str(tmp_path))
+    assert configured.cache_bus_dir == tmp_path
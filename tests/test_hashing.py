@@ -0,0 +1,39 @@
+"""
+Password hashing pool tests
+"""
+
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from zoo.hashing import HashingPool
+
+
+def test_hashing_pool_back_pressure() -> None:
+    """
+    Test hashes beyond the pending limit are rejected
+    """
+    pool = HashingPool(workers=1, max_pending=2)
+    release = threading.Event()
+
+    async def flood() -> None:
+        running = [
+            asyncio.ensure_future(pool.run(release.wait)),
+            asyncio.ensure_future(pool.run(str.upper, "queued")),
+        ]
+        await asyncio.sleep(0)
+        assert pool.pending == 2
+        assert pool.queued == 1
+        with pytest.raises(HTTPException) as error:
+            await pool.run(str.upper, "rejected")
+        assert error.value.status_code == 503
+        release.set()
+        assert await asyncio.gather(*running) == [True, "QUEUED"]
+
+    asyncio.run(flood())
+    assert pool.pending == 0
+    assert pool.statistics.completed == 2
+    assert pool.statistics.rejected == 1
+    assert pool.statistics.queued_max == 1
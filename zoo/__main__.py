@@ -7,6 +7,7 @@ import json
 import logging
 import pathlib
 from dataclasses import dataclass
+from typing import Optional
 
 import click
 import uvicorn
@@ -17,6 +18,7 @@ from zoo._version import __application__, __version__
 from zoo.app import ZooFastAPI, app
 from zoo.config import ZooSettings, app_config
 from zoo.models.users import create_user
+from zoo.tokens import purge_expired_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +89,46 @@ def users(context: Context, email: str, password: str) -> None:
         context.exit(1)
 
 
+@cli.group()
+def tokens() -> None:
+    """
+    Manage access tokens
+    """
+
+
+@tokens.command()
+@click.option(
+    "-m",
+    "--max-age",
+    default=None,
+    help="Token lifetime in seconds, defaults to ZOO_JWT_EXPIRATION",
+    type=int,
+)
+@click.option(
+    "-b",
+    "--batch-size",
+    default=app_config.TOKEN_PURGE_BATCH_SIZE,
+    help="Tokens deleted per transaction",
+    type=int,
+)
+@click.pass_context
+def purge(context: Context, max_age: Optional[int], batch_size: int) -> None:
+    """
+    Delete expired access tokens
+    """
+    max_age = max_age if max_age is not None else app_config.JWT_EXPIRATION
+    if max_age is None:
+        logger.error("Tokens don't expire, set ZOO_JWT_EXPIRATION or --max-age")
+        context.exit(1)
+    result = asyncio.run(purge_expired_tokens(max_age=max_age, batch_size=batch_size))
+    logger.info(
+        "Purged %d expired access tokens in %d batches (%.3fs)",
+        result.deleted,
+        result.batches,
+        result.elapsed,
+    )
+
+
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
     if not app_config.DOCKER:
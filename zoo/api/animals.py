@@ -3,86 +3,362 @@ Animals Router app
 """
 
 import logging
-from typing import List, Optional, Sequence
+from typing import List, Optional, Sequence, Union
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import RowMapping, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from zoo.api.utils import check_model
-from zoo.db import get_async_session
+from zoo.api.bulk import OnConflict, bulk_insert, bulk_update, on_conflict_query
+from zoo.api.conditional import (
+    entity_etag,
+    entity_not_modified,
+    is_not_modified,
+    not_modified,
+    page_not_modified,
+    set_validators,
+)
+from zoo.api.count import CountMode, count_query, total_count
+from zoo.api.export import export_responses, ndjson_export
+from zoo.api.fields import (
+    check_fields,
+    fields_columns,
+    fields_model,
+    fields_query,
+)
+from zoo.api.include import (
+    include_keys,
+    include_query,
+    load_included,
+    rows_response,
+)
+from zoo.api.lookup import lookup_rows
+from zoo.api.pagination import (
+    SortOrder,
+    cursor_query,
+    next_page,
+    paginate,
+    sort_query,
+)
+from zoo.api.responses import (
+    compound_response,
+    model_response,
+    models_response,
+    validate_all,
+)
+from zoo.api.utils import check_model, filter_clauses, ids_query
+from zoo.api.writes import delete_one, insert_one, update_one
+from zoo.cache import (
+    ZooCache,
+    entity_key,
+    get_read_cache,
+    get_read_through_cache,
+    invalidate_rosters,
+)
+from zoo.db import get_async_read_session, get_async_session, read_sessionmaker
 from zoo.models.animals import Animals
-from zoo.schemas.animals import AnimalsCreate, AnimalsRead, AnimalsUpdate
+from zoo.schemas.animals import (
+    AnimalsBulkCreate,
+    AnimalsCreate,
+    AnimalsFilter,
+    AnimalsRead,
+    AnimalsUpdate,
+)
+from zoo.schemas.include import CompoundDocument
+from zoo.schemas.utils import BulkResult, LookupRequest
 
 logger = logging.getLogger(__name__)
 
 animals_router = APIRouter(tags=["animals"])
 
 
-@animals_router.get("/animals", response_model=List[AnimalsRead])
+@animals_router.get(
+    "/animals",
+    response_model=Union[List[AnimalsRead], CompoundDocument[List[AnimalsRead]]],
+)
 async def get_animals(
+    request: Request,
+    response: Response,
     offset: int = 0,
-    limit: int = Query(default=100, le=100),
-    session: AsyncSession = Depends(get_async_session),
-) -> List[AnimalsRead]:
+    limit: int = Query(default=100, ge=1, le=100),
+    cursor: Optional[str] = cursor_query,
+    sort: SortOrder = sort_query,
+    count: CountMode = count_query,
+    filters: AnimalsFilter = Depends(),
+    ids: Optional[List[int]] = Depends(ids_query),
+    fields: Optional[List[str]] = Depends(fields_query),
+    include: Optional[List[str]] = Depends(include_query),
+    session: AsyncSession = Depends(get_async_read_session),
+) -> Response:
     """
     Get animals from the database
+
+    When `ids` are given, those animals are returned in request order
+    instead of a page (the other query parameters are ignored).
+    """
+    columns = fields_columns(
+        Animals,
+        AnimalsRead,
+        fields,
+        sort=sort,
+        extra=[*include_keys(Animals, include), "updated_at"],
+    )
+    if ids is not None:
+        requested = await lookup_rows(
+            session=session,
+            model_class=Animals,
+            columns=columns,
+            ids=ids,
+            response=response,
+        )
+        return await rows_response(
+            session=session,
+            model_class=Animals,
+            rows=requested,
+            fields=fields,
+            include=include,
+            response=response,
+        )
+    statement = paginate(
+        statement=select(*columns).where(
+            *filter_clauses(model_class=Animals, filters=filters)
+        ),
+        model_class=Animals,
+        offset=offset,
+        limit=limit,
+        cursor=cursor,
+        sort=sort,
+    )
+    await total_count(
+        session=session,
+        model_class=Animals,
+        filters=filters,
+        count=count,
+        response=response,
+    )
+    result = await session.execute(statement)
+    animals: Sequence[RowMapping] = next_page(
+        rows=result.mappings().all(),
+        limit=limit,
+        request=request,
+        response=response,
+        sort=sort,
+    )
+    if include is None:
+        # Included records have their own versions, so only plain lists are
+        # answered with validators
+        unchanged = page_not_modified(request, response=response, rows=animals)
+        if unchanged is not None:
+            return unchanged
+    return await rows_response(
+        session=session,
+        model_class=Animals,
+        rows=animals,
+        fields=fields,
+        include=include,
+        response=response,
+    )
+
+
+@animals_router.get(
+    "/animals/export",
+    response_class=StreamingResponse,
+    responses=export_responses,
+)
+async def export_animals(request: Request) -> StreamingResponse:
+    """
+    Export all animals from the database as newline delimited JSON
     """
-    result = await session.execute(
-        select(Animals)
-        .where(Animals.deleted_at.is_(None))
-        .order_by(Animals.id)
-        .offset(offset)
-        .limit(limit)
+    return ndjson_export(
+        model_class=Animals,
+        read_model=AnimalsRead,
+        sessionmaker=read_sessionmaker(request),
+    )
+
+
+@animals_router.post(
+    "/animals/lookup",
+    response_model=Union[List[AnimalsRead], CompoundDocument[List[AnimalsRead]]],
+)
+async def lookup_animals(
+    lookup: LookupRequest,
+    response: Response,
+    fields: Optional[List[str]] = Depends(fields_query),
+    include: Optional[List[str]] = Depends(include_query),
+    session: AsyncSession = Depends(get_async_read_session),
+) -> Response:
+    """
+    Get many animals by id, in request order
+
+    Use this instead of `GET /animals?ids=` for long lists of ids.
+    """
+    columns = fields_columns(
+        Animals, AnimalsRead, fields, extra=include_keys(Animals, include)
+    )
+    animals = await lookup_rows(
+        session=session,
+        model_class=Animals,
+        columns=columns,
+        ids=lookup.ids,
+        response=response,
+    )
+    return await rows_response(
+        session=session,
+        model_class=Animals,
+        rows=animals,
+        fields=fields,
+        include=include,
+        response=response,
     )
-    animals: Sequence[Animals] = result.scalars().all()
-    animals_models = [AnimalsRead.model_validate(animal) for animal in animals]
-    return animals_models
 
 
 @animals_router.post("/animals", response_model=AnimalsRead)
 async def create_animal(
-    animal: AnimalsCreate, session: AsyncSession = Depends(get_async_session)
-) -> AnimalsRead:
+    animal: AnimalsCreate,
+    session: AsyncSession = Depends(get_async_session),
+    cache: ZooCache = Depends(get_read_cache),
+) -> Response:
     """
     Create a new animal in the database
     """
-    new_animal = Animals(**animal.model_dump(exclude_unset=True))
-    session.add(new_animal)
-    await session.commit()
-    await session.refresh(new_animal)
-    new_animal_model = AnimalsRead.model_validate(new_animal)
-    return new_animal_model
+    new_animal = await insert_one(
+        session=session,
+        model_class=Animals,
+        values=animal.model_dump(exclude_unset=True),
+    )
+    invalidate_rosters(cache, Animals, exhibit_ids=[new_animal.exhibit_id])
+    return model_response(AnimalsRead.model_validate(new_animal))
+
+
+@animals_router.post("/animals/bulk", response_model=List[AnimalsRead])
+async def bulk_create_animals(
+    animals: List[AnimalsBulkCreate],
+    on_conflict: Optional[OnConflict] = on_conflict_query,
+    session: AsyncSession = Depends(get_async_session),
+    cache: ZooCache = Depends(get_read_cache),
+) -> Response:
+    """
+    Create (or upsert) many animals in the database
+    """
+    rows = await bulk_insert(
+        session=session, model_class=Animals, records=animals, on_conflict=on_conflict
+    )
+    cache.delete(*(entity_key(Animals, row.id) for row in rows))
+    invalidate_rosters(cache, Animals)
+    return models_response(AnimalsRead, validate_all(AnimalsRead, rows))
+
+
+@animals_router.patch("/animals/bulk", response_model=BulkResult)
+async def bulk_update_animals(
+    animal: AnimalsUpdate,
+    ids: Optional[List[int]] = Depends(ids_query),
+    filters: AnimalsFilter = Depends(),
+    session: AsyncSession = Depends(get_async_session),
+    cache: ZooCache = Depends(get_read_cache),
+) -> Response:
+    """
+    Update many animals in the database by id or filter
+    """
+    updated_ids = await bulk_update(
+        session=session,
+        model_class=Animals,
+        values=animal.model_dump(exclude_unset=True),
+        ids=ids,
+        filters=filters,
+    )
+    cache.delete(*(entity_key(Animals, animal_id) for animal_id in updated_ids))
+    invalidate_rosters(cache, Animals)
+    return model_response(BulkResult(count=len(updated_ids), ids=updated_ids))
 
 
-@animals_router.get("/animals/{animal_id}", response_model=AnimalsRead)
+@animals_router.delete("/animals/bulk", response_model=BulkResult)
+async def bulk_delete_animals(
+    ids: Optional[List[int]] = Depends(ids_query),
+    filters: AnimalsFilter = Depends(),
+    session: AsyncSession = Depends(get_async_session),
+    cache: ZooCache = Depends(get_read_cache),
+) -> Response:
+    """
+    Delete many animals from the database by id or filter
+    """
+    deleted_ids = await bulk_update(
+        session=session,
+        model_class=Animals,
+        values={"deleted_at": func.current_timestamp()},
+        ids=ids,
+        filters=filters,
+    )
+    cache.delete(*(entity_key(Animals, animal_id) for animal_id in deleted_ids))
+    invalidate_rosters(cache, Animals)
+    return model_response(BulkResult(count=len(deleted_ids), ids=deleted_ids))
+
+
+@animals_router.get(
+    "/animals/{animal_id}",
+    response_model=Union[AnimalsRead, CompoundDocument[AnimalsRead]],
+)
 async def get_animal(
-    animal_id: int, session: AsyncSession = Depends(get_async_session)
-) -> AnimalsRead:
+    animal_id: int,
+    request: Request,
+    response: Response,
+    fields: Optional[List[str]] = Depends(fields_query),
+    include: Optional[List[str]] = Depends(include_query),
+    session: AsyncSession = Depends(get_async_read_session),
+    cache: ZooCache = Depends(get_read_through_cache),
+) -> Response:
     """
     Get an animal from the database
     """
-    animal: Optional[Animals] = await session.get(Animals, animal_id)
-    animal = check_model(model_instance=animal, model_class=Animals, id=animal_id)
-    animal_model = AnimalsRead.model_validate(animal)
-    return animal_model
+    check_fields(AnimalsRead, fields)
+    include_keys(Animals, include)
+    cache_key = entity_key(Animals, animal_id)
+    animal_model: Optional[AnimalsRead] = cache.get(cache_key)
+    if animal_model is None:
+        generation = cache.generation
+        if include is None:
+            unchanged = await entity_not_modified(
+                request=request,
+                session=session,
+                model_class=Animals,
+                id=animal_id,
+                fields=fields,
+            )
+            if unchanged is not None:
+                return unchanged
+        animal: Optional[Animals] = await session.get(Animals, animal_id)
+        animal = check_model(model_instance=animal, model_class=Animals, id=animal_id)
+        animal_model = AnimalsRead.model_validate(animal)
+        cache.set(cache_key, animal_model, generation=generation)
+    animal_fields = fields_model(AnimalsRead, fields).model_validate(animal_model)
+    if include is not None:
+        included = await load_included(
+            session=session, model_class=Animals, rows=[animal_model], include=include
+        )
+        return compound_response(animal_fields, included, response)
+    updated_at = animal_model.updated_at
+    etag = entity_etag(Animals, id=animal_id, updated_at=updated_at, fields=fields)
+    if is_not_modified(request, etag=etag, last_modified=updated_at):
+        return not_modified(etag=etag, last_modified=updated_at)
+    set_validators(response, etag=etag, last_modified=updated_at)
+    return model_response(animal_fields, response)
 
 
 @animals_router.delete("/animals/{animal_id}", response_model=AnimalsRead)
 async def delete_animal(
-    animal_id: int, session: AsyncSession = Depends(get_async_session)
-) -> AnimalsRead:
+    animal_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    cache: ZooCache = Depends(get_read_cache),
+) -> Response:
     """
     Delete an animal from the database
     """
-    animal: Optional[Animals] = await session.get(Animals, animal_id)
-    animal = check_model(model_instance=animal, model_class=Animals, id=animal_id)
-    animal.deleted_at = func.current_timestamp()
-    session.add(animal)
-    await session.commit()
-    await session.refresh(animal)
-    animal_model = AnimalsRead.model_validate(animal)
-    return animal_model
+    deleted_animal = await delete_one(
+        session=session, model_class=Animals, id=animal_id
+    )
+    cache.delete(entity_key(Animals, animal_id))
+    invalidate_rosters(cache, Animals, exhibit_ids=[deleted_animal.exhibit_id])
+    return model_response(AnimalsRead.model_validate(deleted_animal))
 
 
 @animals_router.patch("/animals/{animal_id}", response_model=AnimalsRead)
@@ -90,16 +366,19 @@ async def update_animal(
     animal_id: int,
     animal: AnimalsUpdate,
     session: AsyncSession = Depends(get_async_session),
-) -> AnimalsRead:
+    cache: ZooCache = Depends(get_read_cache),
+) -> Response:
     """
     Update an animal in the database
     """
-    db_animal: Optional[Animals] = await session.get(Animals, animal_id)
-    db_animal = check_model(model_instance=db_animal, model_class=Animals, id=animal_id)
-    for field, value in animal.model_dump(exclude_unset=True).items():
-        setattr(db_animal, field, value)
-    session.add(db_animal)
-    await session.commit()
-    await session.refresh(db_animal)
-    animal_model = AnimalsRead.model_validate(db_animal)
-    return animal_model
+    values = animal.model_dump(exclude_unset=True)
+    db_animal = await update_one(
+        session=session, model_class=Animals, id=animal_id, values=values
+    )
+    cache.delete(entity_key(Animals, animal_id))
+    # The previous exhibit isn't returned, every roster is invalidated on a move
+    moved = "exhibit_id" in values
+    invalidate_rosters(
+        cache, Animals, exhibit_ids=None if moved else [db_animal.exhibit_id]
+    )
+    return model_response(AnimalsRead.model_validate(db_animal))
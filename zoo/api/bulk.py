@@ -0,0 +1,218 @@
+"""
+Bulk Write Helpers
+
+Set based writes for the bulk endpoints
+"""
+
+from typing import Any, Dict, List, Literal, Optional, Sequence, Type, Union, cast
+
+from fastapi import HTTPException, Query
+from sqlalchemy import Insert, Row, Table, func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from zoo.api.utils import filter_clauses
+from zoo.models.base import Base
+from zoo.schemas.base import ZooModel
+
+BULK_CHUNK_SIZE = 500
+
+OnConflict = Literal["ignore", "update"]
+
+on_conflict_query = Query(
+    default=None,
+    description=(
+        "What to do when a record `id` already exists: `ignore` skips the record, "
+        "`update` overwrites it. By default the request fails."
+    ),
+)
+
+
+def _insert_statement(
+    session: AsyncSession, model_class: Type[Base], on_conflict: Optional[OnConflict]
+) -> Insert:
+    """
+    Build the (dialect specific) INSERT ... RETURNING statement
+    """
+    table = cast(Table, model_class.__table__)
+    if on_conflict is None:
+        return insert(table).returning(*table.c)
+    statement: Union[postgresql.Insert, sqlite.Insert]
+    dialect_name = session.get_bind().dialect.name
+    if dialect_name == "postgresql":
+        statement = postgresql.insert(table)
+    elif dialect_name == "sqlite":
+        statement = sqlite.insert(table)
+    else:  # pragma: no cover
+        error_msg = f"Error: `on_conflict` is not supported on {dialect_name}"
+        raise HTTPException(status_code=400, detail=error_msg)
+    if on_conflict == "ignore":
+        statement = statement.on_conflict_do_nothing(index_elements=[table.c.id])
+    else:
+        updates: Dict[str, Any] = {
+            column.name: statement.excluded[column.name]
+            for column in table.c
+            if column.name not in {"id", "created_at", "updated_at", "deleted_at"}
+        }
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.id], set_={**updates, "updated_at": func.now()}
+        )
+    return statement.returning(*table.c)
+
+
+def _request_order(
+    chunk: List[Dict[str, Any]],
+    with_id_rows: List[Row[Any]],
+    without_id_rows: List[Row[Any]],
+) -> List[Row[Any]]:
+    """
+    Put the rows returned for a chunk back in the order of its records
+
+    RETURNING order isn't guaranteed. Records with an `id` are matched by
+    id, the others get ascending ids in the order they are inserted.
+    `sort_by_parameter_order` isn't used: without a sentinel column
+    SQLAlchemy falls back to one INSERT per row on SQLite.
+    """
+    by_id = {row.id: row for row in with_id_rows}
+    new_rows = iter(sorted(without_id_rows, key=lambda row: row.id))
+    ordered: List[Row[Any]] = []
+    for values in chunk:
+        if values.get("id") is None:
+            ordered.append(next(new_rows))
+        elif values["id"] in by_id:
+            ordered.append(by_id.pop(values["id"]))
+    return ordered
+
+
+async def bulk_insert(
+    session: AsyncSession,
+    model_class: Type[Base],
+    records: Sequence[ZooModel],
+    on_conflict: Optional[OnConflict] = None,
+    chunk_size: int = BULK_CHUNK_SIZE,
+) -> List[Row[Any]]:
+    """
+    Insert many records with one multi-row INSERT ... RETURNING per chunk
+
+    All chunks are written in a single transaction. The rows are returned
+    in the order of the records, records skipped by `on_conflict="ignore"`
+    are left out.
+
+    Parameters
+    ----------
+    session : AsyncSession
+        The database session
+    model_class : Type[Base]
+        The database model to insert into
+    records : Sequence[ZooModel]
+        The records to insert, an `id` is optional
+    on_conflict : Optional[OnConflict]
+        How to handle records whose `id` already exists
+    chunk_size : int
+        The number of records per INSERT statement
+
+    Returns
+    -------
+    List[Row[Any]]
+        The inserted (or updated) rows, in the order of the records
+
+    Raises
+    ------
+    HTTPException
+        If a record conflicts with existing data
+    """
+    statement = _insert_statement(
+        session=session, model_class=model_class, on_conflict=on_conflict
+    )
+    rows: List[Row[Any]] = []
+    has_ids = False
+    for start in range(0, len(records), chunk_size):
+        chunk = [record.model_dump() for record in records[start : start + chunk_size]]
+        # Records must share the same keys to be batched into a single INSERT
+        with_ids = [values for values in chunk if values.get("id") is not None]
+        without_ids = [
+            {key: value for key, value in values.items() if key != "id"}
+            for values in chunk
+            if values.get("id") is None
+        ]
+        returned: List[List[Row[Any]]] = []
+        for parameters in (with_ids, without_ids):
+            if not parameters:
+                returned.append([])
+                continue
+            try:
+                result = await session.execute(statement, parameters)
+            except IntegrityError as e:
+                await session.rollback()
+                error_msg = (
+                    f"Error: `{model_class.__name__}` bulk insert conflicts "
+                    "with existing data"
+                )
+                raise HTTPException(status_code=409, detail=error_msg) from e
+            returned.append(list(result.all()))
+        rows.extend(_request_order(chunk, *returned))
+        has_ids = has_ids or bool(with_ids)
+    if has_ids and session.get_bind().dialect.name == "postgresql":
+        # Explicit ids don't advance the serial sequence
+        table = cast(Table, model_class.__table__)
+        max_id = select(func.max(table.c.id)).scalar_subquery()
+        await session.execute(
+            select(func.setval(func.pg_get_serial_sequence(table.name, "id"), max_id))
+        )
+    await session.commit()
+    return rows
+
+
+async def bulk_update(
+    session: AsyncSession,
+    model_class: Type[Base],
+    values: Dict[str, Any],
+    ids: Optional[List[int]],
+    filters: ZooModel,
+) -> List[int]:
+    """
+    Update every live record matching the ids and filters in one statement
+
+    Parameters
+    ----------
+    session : AsyncSession
+        The database session
+    model_class : Type[Base]
+        The database model to update
+    values : Dict[str, Any]
+        The column values to set
+    ids : Optional[List[int]]
+        The ids of the records to update
+    filters : ZooModel
+        Additional equality filters the records must match
+
+    Returns
+    -------
+    List[int]
+        The ids of the updated records
+
+    Raises
+    ------
+    HTTPException
+        If no ids or filters were provided, or there is nothing to update
+    """
+    table = cast(Table, model_class.__table__)
+    clauses = filter_clauses(model_class=model_class, filters=filters)
+    if ids is not None:
+        clauses.append(table.c.id.in_(ids))
+    if not clauses:
+        error_msg = "Error: bulk operations require `ids` or at least one filter"
+        raise HTTPException(status_code=400, detail=error_msg)
+    if not values:
+        raise HTTPException(status_code=400, detail="Error: no fields to update")
+    statement = (
+        update(table)
+        .where(table.c.deleted_at.is_(None), *clauses)
+        .values(**values)
+        .returning(table.c.id)
+    )
+    result = await session.execute(statement)
+    updated_ids = sorted(result.scalars().all())
+    await session.commit()
+    return updated_ids
@@ -0,0 +1,278 @@
+"""
+Conditional Request Helpers
+
+ETag / Last-Modified validators and `304 Not Modified` responses
+"""
+
+import datetime
+import email.utils
+import hashlib
+from typing import Any, List, Optional, Sequence, Tuple, Type
+
+from fastapi import Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from zoo.api.count import COUNT_HEADER
+from zoo.api.pagination import NEXT_CURSOR_HEADER, row_value
+
+CONDITIONAL_HEADERS = ("if-none-match", "if-modified-since")
+# Response headers that are part of a list page's representation
+PAGE_HEADERS = (NEXT_CURSOR_HEADER, COUNT_HEADER)
+
+
+def _utc(timestamp: datetime.datetime) -> datetime.datetime:
+    """
+    Treat naive timestamps (SQLite) as UTC
+    """
+    if timestamp.tzinfo is None:
+        return timestamp.replace(tzinfo=datetime.timezone.utc)
+    return timestamp
+
+
+def _digest(*parts: Any) -> str:
+    """
+    Hash the parts of a validator into an opaque string
+    """
+    payload = "|".join(str(part) for part in parts).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()[:32]
+
+
+def entity_etag(
+    model_class: Type[Any],
+    id: int,  # noqa: A002
+    updated_at: datetime.datetime,
+    fields: Optional[List[str]] = None,
+) -> str:
+    """
+    Get the strong ETag of a single record
+
+    Parameters
+    ----------
+    model_class : Type[Any]
+        The database model of the record
+    id : int
+        The id of the record
+    updated_at : datetime.datetime
+        When the record was last updated
+    fields : Optional[List[str]]
+        The requested fields, part of the representation
+
+    Returns
+    -------
+    str
+    """
+    updated = _utc(updated_at).isoformat()
+    return f'"{_digest(model_class.__tablename__, id, updated, fields)}"'
+
+
+def collection_etag(request: Request, parts: Sequence[Any]) -> str:
+    """
+    Get the weak ETag of a list page (or any aggregate of records)
+
+    Parameters
+    ----------
+    request : Request
+        The list request, its query parameters select the page
+    parts : Sequence[Any]
+        The versions of everything in the response, timestamps included
+
+    Returns
+    -------
+    str
+    """
+    normalized = [
+        _utc(part).isoformat() if isinstance(part, datetime.datetime) else part
+        for part in parts
+    ]
+    return f'W/"{_digest(request.url.path, request.url.query, *normalized)}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Weak comparison of an `If-None-Match` header with an ETag
+    """
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque_tag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def is_not_modified(
+    request: Request, etag: str, last_modified: Optional[datetime.datetime]
+) -> bool:
+    """
+    Check the request's conditional headers against the current validators
+
+    `If-None-Match` takes precedence over `If-Modified-Since`.
+
+    Parameters
+    ----------
+    request : Request
+        The request
+    etag : str
+        The current ETag
+    last_modified : Optional[datetime.datetime]
+        The current last modified time
+
+    Returns
+    -------
+    bool
+        Whether the client's copy is still current
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = email.utils.parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    # HTTP dates have second precision
+    return _utc(last_modified).replace(microsecond=0) <= _utc(since)
+
+
+def set_validators(
+    response: Response, etag: str, last_modified: Optional[datetime.datetime]
+) -> None:
+    """
+    Set the `ETag` and `Last-Modified` headers of a response
+    """
+    response.headers["ETag"] = etag
+    if last_modified is not None:
+        response.headers["Last-Modified"] = email.utils.format_datetime(
+            _utc(last_modified).astimezone(datetime.timezone.utc), usegmt=True
+        )
+
+
+def not_modified(etag: str, last_modified: Optional[datetime.datetime]) -> Response:
+    """
+    Get a `304 Not Modified` response carrying the validators
+    """
+    response = Response(status_code=304)
+    set_validators(response, etag=etag, last_modified=last_modified)
+    return response
+
+
+async def entity_not_modified(
+    request: Request,
+    session: AsyncSession,
+    model_class: Type[Any],
+    id: int,  # noqa: A002
+    fields: Optional[List[str]] = None,
+) -> Optional[Response]:
+    """
+    Answer a conditional GET of a single record with a version-only query
+
+    Parameters
+    ----------
+    request : Request
+        The request
+    session : AsyncSession
+        The database session
+    model_class : Type[Any]
+        The database model of the record
+    id : int
+        The id of the record
+    fields : Optional[List[str]]
+        The requested fields
+
+    Returns
+    -------
+    Optional[Response]
+        A `304 Not Modified` response, `None` if the record must be sent
+    """
+    if not any(header in request.headers for header in CONDITIONAL_HEADERS):
+        return None
+    statement = select(model_class.updated_at).where(model_class.id == id)
+    updated_at: Optional[datetime.datetime] = (
+        await session.execute(statement)
+    ).scalar_one_or_none()
+    if updated_at is None:
+        return None
+    etag = entity_etag(model_class, id=id, updated_at=updated_at, fields=fields)
+    if is_not_modified(request, etag=etag, last_modified=updated_at):
+        return not_modified(etag=etag, last_modified=updated_at)
+    return None
+
+
+def parts_not_modified(
+    request: Request,
+    response: Response,
+    parts: Sequence[Any],
+    last_modified: Optional[datetime.datetime],
+) -> Optional[Response]:
+    """
+    Set the validators of an aggregate response and answer conditional GETs
+
+    Parameters
+    ----------
+    request : Request
+        The request
+    response : Response
+        The route's response, the validators are set on it
+    parts : Sequence[Any]
+        The versions of everything in the response, see `collection_etag`
+    last_modified : Optional[datetime.datetime]
+        The latest `updated_at` in the response
+
+    Returns
+    -------
+    Optional[Response]
+        A `304 Not Modified` response, `None` if the response must be sent
+    """
+    etag = collection_etag(request, parts=parts)
+    if is_not_modified(request, etag=etag, last_modified=last_modified):
+        return not_modified(etag=etag, last_modified=last_modified)
+    set_validators(response, etag=etag, last_modified=last_modified)
+    return None
+
+
+def page_not_modified(
+    request: Request,
+    response: Response,
+    rows: Sequence[Any],
+    related: Sequence[Tuple[int, Optional[datetime.datetime]]] = (),
+) -> Optional[Response]:
+    """
+    Set the validators of a list page and answer conditional GETs
+
+    The weak ETag is derived from the `id` and `updated_at` of the rows
+    on the page and its pagination / count headers, so it costs no query
+    beyond the page itself. Changes to records outside of the page leave
+    it alone.
+
+    Parameters
+    ----------
+    request : Request
+        The request
+    response : Response
+        The route's response, with the pagination and count headers set
+    rows : Sequence[Any]
+        The rows of the page, with their `id` and `updated_at`
+    related : Sequence[Tuple[int, Optional[datetime.datetime]]]
+        The count and latest `updated_at` of each collection embedded
+        in the rows
+
+    Returns
+    -------
+    Optional[Response]
+        A `304 Not Modified` response, `None` if the page must be sent
+    """
+    versions = [
+        *((row_value(row, "id"), row_value(row, "updated_at")) for row in rows),
+        *related,
+    ]
+    timestamps = [_utc(updated_at) for _, updated_at in versions if updated_at]
+    headers = [response.headers.get(header) for header in PAGE_HEADERS]
+    return parts_not_modified(
+        request,
+        response=response,
+        parts=[*headers, *(part for version in versions for part in version)],
+        last_modified=max(timestamps, default=None),
+    )
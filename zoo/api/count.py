@@ -0,0 +1,217 @@
+"""
+Total Count Helpers
+
+Exact (cached) and estimated row counts for list endpoints
+"""
+
+from collections import defaultdict
+from typing import Any, DefaultDict, Literal, Optional, Set, Type
+
+from fastapi import Query, Response
+from sqlalchemy import event, func, inspect, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session, UOWTransaction
+
+from zoo.api.utils import filter_clauses
+from zoo.cache import build_count_cache
+from zoo.config import app_config
+from zoo.db import async_read_engine, read_replica
+from zoo.models.base import Base
+from zoo.schemas.base import ZooModel
+
+CountMode = Literal["none", "exact", "estimated"]
+
+COUNT_HEADER = "X-Total-Count"
+PENDING_WRITES_KEY = "zoo_pending_writes"
+
+count_query = Query(
+    default="none",
+    description=(
+        f"Return the total number of matching records in the `{COUNT_HEADER}` "
+        "header: `exact` counts the records, `estimated` reads the database "
+        "statistics (falling back to `exact` when filtering or unavailable)."
+    ),
+)
+
+ESTIMATE_QUERIES = {
+    "postgresql": text("SELECT reltuples FROM pg_class WHERE relname = :index_name"),
+    "sqlite": text("SELECT stat FROM sqlite_stat1 WHERE idx = :index_name"),
+}
+
+# (table name, filters) -> count, invalidated in every worker on commit
+count_cache = build_count_cache(app_config)
+# table name -> local write generation, bumped when a write is committed
+_generations: DefaultDict[str, int] = defaultdict(int)
+
+
+def _pending_writes(session: Session) -> Set[str]:
+    """
+    Get the tables written to in the session's current transaction
+    """
+    pending: Set[str] = session.info.setdefault(PENDING_WRITES_KEY, set())
+    return pending
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush(session: Session, _: UOWTransaction) -> None:
+    """
+    Track the tables of flushed ORM instances
+    """
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        _pending_writes(session).add(inspect(instance).mapper.local_table.name)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_statement(execute_state: ORMExecuteState) -> None:
+    """
+    Track the tables of executed INSERT, UPDATE and DELETE statements
+    """
+    if execute_state.is_insert or execute_state.is_update or execute_state.is_delete:
+        table = getattr(execute_state.statement, "table", None)
+        if table is not None:
+            _pending_writes(execute_state.session).add(table.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_counts(session: Session) -> None:
+    """
+    Invalidate the cached counts of the tables written to
+    """
+    for table_name in session.info.pop(PENDING_WRITES_KEY, set()):
+        _generations[table_name] += 1
+        count_cache.delete_matching((table_name, None))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_writes(session: Session) -> None:
+    """
+    Forget the tables written to in a rolled back transaction
+    """
+    session.info.pop(PENDING_WRITES_KEY, None)
+
+
+async def exact_count(
+    session: AsyncSession, model_class: Type[Base], filters: ZooModel
+) -> int:
+    """
+    Count the live records matching the filters
+
+    Counts are cached per filter until a write to the table is committed
+    (in any worker) or `COUNT_CACHE_TTL` expires. Counts read from the
+    read replica, which may lag behind, are not cached.
+
+    Parameters
+    ----------
+    session : AsyncSession
+        The database session
+    model_class : Type[Base]
+        The database model to count
+    filters : ZooModel
+        The equality filters the records must match
+
+    Returns
+    -------
+    int
+    """
+    table_name = model_class.__tablename__
+    key = (table_name, filters.model_dump_json(exclude_none=True))
+    cached: Optional[int] = count_cache.get(key)
+    if cached is not None:
+        return cached
+    generation = _generations[table_name]
+    statement = (
+        select(func.count())
+        .select_from(model_class)
+        .where(*filter_clauses(model_class=model_class, filters=filters))
+    )
+    total: int = (await session.execute(statement)).scalar_one()
+    from_replica = read_replica and session.get_bind() is async_read_engine.sync_engine
+    # Skip counts that raced a commit, they may predate it
+    if not from_replica and generation == _generations[table_name]:
+        count_cache.set(key, total)
+    return total
+
+
+async def estimated_count(
+    session: AsyncSession, model_class: Type[Base]
+) -> Optional[int]:
+    """
+    Estimate the number of live records from the database statistics
+
+    The statistics of the table's live row index are used: `pg_class` on
+    PostgreSQL and `sqlite_stat1` (populated by `ANALYZE`) on SQLite.
+
+    Parameters
+    ----------
+    session : AsyncSession
+        The database session
+    model_class : Type[Base]
+        The database model to count
+
+    Returns
+    -------
+    Optional[int]
+        The estimated count, `None` if there are no statistics
+    """
+    dialect_name = session.get_bind().dialect.name
+    statement = ESTIMATE_QUERIES.get(dialect_name)
+    if statement is None:  # pragma: no cover
+        return None
+    if dialect_name == "sqlite":
+        has_statistics = await session.execute(
+            text("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+        )
+        if has_statistics.first() is None:
+            return None
+    index_name = f"ix_{model_class.__tablename__}_live_id"
+    result = await session.execute(statement, {"index_name": index_name})
+    estimate: Any = result.scalar()
+    if estimate is None:
+        return None
+    if isinstance(estimate, str):
+        # sqlite_stat1: "<rows in index> <rows per distinct value> ..."
+        estimate = estimate.split()[0]
+    # Postgres reports -1 for tables that have never been analyzed
+    return int(estimate) if float(estimate) >= 0 else None
+
+
+async def total_count(
+    session: AsyncSession,
+    model_class: Type[Base],
+    filters: ZooModel,
+    count: CountMode,
+    response: Response,
+) -> Optional[int]:
+    """
+    Count the records matching a list query and set the count header
+
+    Parameters
+    ----------
+    session : AsyncSession
+        The database session
+    model_class : Type[Base]
+        The database model being listed
+    filters : ZooModel
+        The equality filters of the list query
+    count : CountMode
+        How to count the records
+    response : Response
+        The route's response, the `X-Total-Count` header is set on it
+
+    Returns
+    -------
+    Optional[int]
+        The count, `None` if `count` is `none`
+    """
+    if count == "none":
+        return None
+    total: Optional[int] = None
+    is_filtered = bool(filters.model_dump(exclude_none=True))
+    if count == "estimated" and not is_filtered:
+        total = await estimated_count(session=session, model_class=model_class)
+    if total is None:
+        total = await exact_count(
+            session=session, model_class=model_class, filters=filters
+        )
+    response.headers[COUNT_HEADER] = str(total)
+    return total
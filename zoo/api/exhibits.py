@@ -2,94 +2,565 @@
 Exhibits Router app
 """
 
+import datetime
 import logging
-from typing import List, Optional, Sequence
+from collections import defaultdict
+from typing import Any, DefaultDict, Dict, List, Optional, Sequence, Tuple, Type, Union
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import RowMapping, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 
-from zoo.api.utils import check_model
-from zoo.db import get_async_session
+from zoo.api.bulk import OnConflict, bulk_insert, bulk_update, on_conflict_query
+from zoo.api.conditional import (
+    entity_etag,
+    entity_not_modified,
+    is_not_modified,
+    not_modified,
+    page_not_modified,
+    set_validators,
+)
+from zoo.api.count import CountMode, count_query, total_count
+from zoo.api.export import export_responses, ndjson_export
+from zoo.api.fields import (
+    check_fields,
+    fields_columns,
+    fields_model,
+    fields_query,
+)
+from zoo.api.include import (
+    include_keys,
+    include_query,
+    load_included,
+    rows_response,
+)
+from zoo.api.lookup import lookup_rows
+from zoo.api.pagination import (
+    SortOrder,
+    cursor_query,
+    next_page,
+    paginate,
+    sort_query,
+)
+from zoo.api.responses import (
+    compound_response,
+    json_response,
+    model_response,
+    models_response,
+    validate_all,
+)
+from zoo.api.utils import check_model, filter_clauses, ids_query, not_found
+from zoo.api.writes import delete_one, insert_one, update_one
+from zoo.cache import (
+    ZooCache,
+    entity_key,
+    get_read_cache,
+    get_read_through_cache,
+    invalidate_rosters,
+    roster_key,
+)
+from zoo.db import get_async_read_session, get_async_session, read_sessionmaker
 from zoo.models.animals import Animals
 from zoo.models.exhibits import Exhibits
 from zoo.models.staff import Staff
-from zoo.schemas.animals import AnimalsRead
-from zoo.schemas.exhibits import ExhibitsCreate, ExhibitsRead, ExhibitsUpdate
-from zoo.schemas.staff import StaffRead
+from zoo.schemas.animals import AnimalsFilter, AnimalsRead, AnimalsRosterFilter
+from zoo.schemas.base import ZooModel
+from zoo.schemas.exhibits import (
+    ExhibitsBulkCreate,
+    ExhibitsCreate,
+    ExhibitsFilter,
+    ExhibitsFull,
+    ExhibitsRead,
+    ExhibitsUpdate,
+)
+from zoo.schemas.include import CompoundDocument
+from zoo.schemas.staff import StaffFilter, StaffRead, StaffRosterFilter
+from zoo.schemas.utils import BulkResult, LookupRequest
 
 logger = logging.getLogger(__name__)
 
 exhibits_router = APIRouter(tags=["exhibits"])
 
 
-@exhibits_router.get("/exhibits", response_model=List[ExhibitsRead])
+@exhibits_router.get(
+    "/exhibits",
+    response_model=Union[List[ExhibitsRead], CompoundDocument[List[ExhibitsRead]]],
+)
 async def get_exhibits(
+    request: Request,
+    response: Response,
     offset: int = 0,
-    limit: int = Query(default=100, le=100),
-    session: AsyncSession = Depends(get_async_session),
-) -> List[ExhibitsRead]:
+    limit: int = Query(default=100, ge=1, le=100),
+    cursor: Optional[str] = cursor_query,
+    sort: SortOrder = sort_query,
+    count: CountMode = count_query,
+    filters: ExhibitsFilter = Depends(),
+    ids: Optional[List[int]] = Depends(ids_query),
+    fields: Optional[List[str]] = Depends(fields_query),
+    include: Optional[List[str]] = Depends(include_query),
+    session: AsyncSession = Depends(get_async_read_session),
+) -> Response:
     """
     Get exhibits from the database
+
+    When `ids` are given, those exhibits are returned in request order
+    instead of a page (the other query parameters are ignored).
+    """
+    columns = fields_columns(
+        Exhibits,
+        ExhibitsRead,
+        fields,
+        sort=sort,
+        extra=[*include_keys(Exhibits, include), "updated_at"],
+    )
+    if ids is not None:
+        requested = await lookup_rows(
+            session=session,
+            model_class=Exhibits,
+            columns=columns,
+            ids=ids,
+            response=response,
+        )
+        return await rows_response(
+            session=session,
+            model_class=Exhibits,
+            rows=requested,
+            fields=fields,
+            include=include,
+            response=response,
+        )
+    statement = paginate(
+        statement=select(*columns).where(
+            *filter_clauses(model_class=Exhibits, filters=filters)
+        ),
+        model_class=Exhibits,
+        offset=offset,
+        limit=limit,
+        cursor=cursor,
+        sort=sort,
+    )
+    await total_count(
+        session=session,
+        model_class=Exhibits,
+        filters=filters,
+        count=count,
+        response=response,
+    )
+    result = await session.execute(statement)
+    exhibits: Sequence[RowMapping] = next_page(
+        rows=result.mappings().all(),
+        limit=limit,
+        request=request,
+        response=response,
+        sort=sort,
+    )
+    if include is None:
+        # Included records have their own versions, so only plain lists are
+        # answered with validators
+        unchanged = page_not_modified(request, response=response, rows=exhibits)
+        if unchanged is not None:
+            return unchanged
+    return await rows_response(
+        session=session,
+        model_class=Exhibits,
+        rows=exhibits,
+        fields=fields,
+        include=include,
+        response=response,
+    )
+
+
+@exhibits_router.get(
+    "/exhibits/export",
+    response_class=StreamingResponse,
+    responses=export_responses,
+)
+async def export_exhibits(request: Request) -> StreamingResponse:
+    """
+    Export all exhibits from the database as newline delimited JSON
+    """
+    return ndjson_export(
+        model_class=Exhibits,
+        read_model=ExhibitsRead,
+        sessionmaker=read_sessionmaker(request),
+    )
+
+
+@exhibits_router.post(
+    "/exhibits/lookup",
+    response_model=Union[List[ExhibitsRead], CompoundDocument[List[ExhibitsRead]]],
+)
+async def lookup_exhibits(
+    lookup: LookupRequest,
+    response: Response,
+    fields: Optional[List[str]] = Depends(fields_query),
+    include: Optional[List[str]] = Depends(include_query),
+    session: AsyncSession = Depends(get_async_read_session),
+) -> Response:
+    """
+    Get many exhibits by id, in request order
+
+    Use this instead of `GET /exhibits?ids=` for long lists of ids.
+    """
+    columns = fields_columns(
+        Exhibits, ExhibitsRead, fields, extra=include_keys(Exhibits, include)
+    )
+    exhibits = await lookup_rows(
+        session=session,
+        model_class=Exhibits,
+        columns=columns,
+        ids=lookup.ids,
+        response=response,
+    )
+    return await rows_response(
+        session=session,
+        model_class=Exhibits,
+        rows=exhibits,
+        fields=fields,
+        include=include,
+        response=response,
+    )
+
+
+MEMBERS = ((Animals, AnimalsRead), (Staff, StaffRead))
+
+embed_limit_query = Query(
+    default=20,
+    ge=0,
+    le=100,
+    description=(
+        "The most animals and staff embedded per exhibit, in `id` order. "
+        "The counts are exact, page through the rest with "
+        "`/exhibits/{exhibit_id}/animals` and `/exhibits/{exhibit_id}/staff`."
+    ),
+)
+
+MemberVersions = Dict[Type[Any], Dict[int, Tuple[int, Optional[datetime.datetime]]]]
+
+
+async def _member_versions(
+    session: AsyncSession, exhibit_ids: List[int]
+) -> MemberVersions:
+    """
+    Get the live animal and staff counts (and latest `updated_at`) of exhibits
+
+    One `GROUP BY exhibit_id` query per table, over the given exhibits only
+    """
+    versions: MemberVersions = {}
+    for model_class, _ in MEMBERS:
+        result = await session.execute(
+            select(
+                model_class.exhibit_id,
+                func.count(),
+                func.max(model_class.updated_at),
+            )
+            .where(model_class.exhibit_id.in_(exhibit_ids))
+            .group_by(model_class.exhibit_id)
+        )
+        versions[model_class] = {
+            exhibit_id: (count, updated_at) for exhibit_id, count, updated_at in result
+        }
+    return versions
+
+
+def _related_versions(
+    exhibits: Sequence[RowMapping], versions: MemberVersions
+) -> List[Tuple[int, Optional[datetime.datetime]]]:
+    """
+    Get the member versions of each exhibit, in page order, for the ETag
+    """
+    return [
+        versions[model_class].get(exhibit["id"], (0, None))
+        for exhibit in exhibits
+        for model_class, _ in MEMBERS
+    ]
+
+
+async def _full_views(
+    session: AsyncSession,
+    exhibits: Sequence[RowMapping],
+    versions: MemberVersions,
+    embed_limit: int,
+) -> List[ExhibitsFull]:
+    """
+    Attach the first live animals and staff to exhibits, one query per table
+    """
+    exhibit_ids = [exhibit["id"] for exhibit in exhibits]
+    members: Dict[Type[Any], DefaultDict[int, List[Any]]] = {
+        model_class: defaultdict(list) for model_class, _ in MEMBERS
+    }
+    for model_class, read_model in MEMBERS if embed_limit else ():
+        position = (
+            func.row_number()
+            .over(partition_by=model_class.exhibit_id, order_by=model_class.id)
+            .label("position")
+        )
+        ranked = (
+            select(*fields_columns(model_class, read_model, fields=None), position)
+            .where(model_class.exhibit_id.in_(exhibit_ids))
+            .subquery()
+        )
+        result = await session.execute(
+            select(ranked)
+            .where(ranked.c.position <= embed_limit)
+            .order_by(ranked.c.exhibit_id, ranked.c.id)
+        )
+        grouped = members[model_class]
+        for model in validate_all(read_model, result.mappings().all()):
+            grouped[model.exhibit_id].append(model)
+    animals, staff = members[Animals], members[Staff]
+    return validate_all(
+        ExhibitsFull,
+        [
+            {
+                **exhibit,
+                "animals": animals[exhibit["id"]],
+                "staff": staff[exhibit["id"]],
+                "animals_count": versions[Animals].get(exhibit["id"], (0, None))[0],
+                "staff_count": versions[Staff].get(exhibit["id"], (0, None))[0],
+            }
+            for exhibit in exhibits
+        ],
+    )
+
+
+@exhibits_router.get("/exhibits/full", response_model=List[ExhibitsFull])
+async def get_exhibits_full(
+    request: Request,
+    response: Response,
+    offset: int = 0,
+    limit: int = Query(default=100, ge=1, le=100),
+    cursor: Optional[str] = cursor_query,
+    sort: SortOrder = sort_query,
+    count: CountMode = count_query,
+    embed_limit: int = embed_limit_query,
+    filters: ExhibitsFilter = Depends(),
+    session: AsyncSession = Depends(get_async_read_session),
+) -> Response:
+    """
+    Get exhibits with their first live animals, staff and counts
+
+    A page is loaded with the exhibits, one count query per table over
+    the page's exhibits, and one query per table for the embedded records.
+    """
+    columns = fields_columns(Exhibits, ExhibitsRead, None, sort=sort)
+    statement = paginate(
+        statement=select(*columns).where(
+            *filter_clauses(model_class=Exhibits, filters=filters)
+        ),
+        model_class=Exhibits,
+        offset=offset,
+        limit=limit,
+        cursor=cursor,
+        sort=sort,
+    )
+    await total_count(
+        session=session,
+        model_class=Exhibits,
+        filters=filters,
+        count=count,
+        response=response,
+    )
+    result = await session.execute(statement)
+    exhibits: Sequence[RowMapping] = next_page(
+        rows=result.mappings().all(),
+        limit=limit,
+        request=request,
+        response=response,
+        sort=sort,
+    )
+    versions = await _member_versions(
+        session=session, exhibit_ids=[exhibit["id"] for exhibit in exhibits]
+    )
+    unchanged = page_not_modified(
+        request,
+        response=response,
+        rows=exhibits,
+        related=_related_versions(exhibits, versions),
+    )
+    if unchanged is not None:
+        return unchanged
+    full_views = await _full_views(
+        session=session, exhibits=exhibits, versions=versions, embed_limit=embed_limit
+    )
+    return models_response(ExhibitsFull, full_views, response)
+
+
+@exhibits_router.get("/exhibits/{exhibit_id}/full", response_model=ExhibitsFull)
+async def get_exhibit_full(
+    exhibit_id: int,
+    request: Request,
+    response: Response,
+    embed_limit: int = embed_limit_query,
+    session: AsyncSession = Depends(get_async_read_session),
+) -> Response:
+    """
+    Get an exhibit with its first live animals, staff and counts
     """
-    result = await session.execute(
-        select(Exhibits)
-        .where(Exhibits.deleted_at.is_(None))
-        .order_by(Exhibits.id)
-        .offset(offset)
-        .limit(limit)
+    statement = select(*fields_columns(Exhibits, ExhibitsRead, None))
+    result = await session.execute(statement.where(Exhibits.id == exhibit_id))
+    exhibit = result.mappings().one_or_none()
+    if exhibit is None:
+        raise not_found(model_class=Exhibits, id=exhibit_id)
+    versions = await _member_versions(session=session, exhibit_ids=[exhibit_id])
+    unchanged = page_not_modified(
+        request,
+        response=response,
+        rows=[exhibit],
+        related=_related_versions([exhibit], versions),
+    )
+    if unchanged is not None:
+        return unchanged
+    full_views = await _full_views(
+        session=session, exhibits=[exhibit], versions=versions, embed_limit=embed_limit
     )
-    exhibits: Sequence[Exhibits] = result.scalars().all()
-    exhibit_models = [ExhibitsRead.model_validate(exhibit) for exhibit in exhibits]
-    return exhibit_models
+    return model_response(full_views[0], response)
 
 
 @exhibits_router.post("/exhibits", response_model=ExhibitsRead)
 async def create_exhibit(
     exhibit: ExhibitsCreate, session: AsyncSession = Depends(get_async_session)
-) -> ExhibitsRead:
+) -> Response:
     """
     Create a new exhibit in the database
     """
-    new_exhibit = Exhibits(**exhibit.model_dump(exclude_unset=True))
-    session.add(new_exhibit)
-    await session.commit()
-    await session.refresh(new_exhibit)
-    exhibit_model = ExhibitsRead.model_validate(new_exhibit)
-    return exhibit_model
+    new_exhibit = await insert_one(
+        session=session,
+        model_class=Exhibits,
+        values=exhibit.model_dump(exclude_unset=True),
+    )
+    return model_response(ExhibitsRead.model_validate(new_exhibit))
+
+
+@exhibits_router.post("/exhibits/bulk", response_model=List[ExhibitsRead])
+async def bulk_create_exhibits(
+    exhibits: List[ExhibitsBulkCreate],
+    on_conflict: Optional[OnConflict] = on_conflict_query,
+    session: AsyncSession = Depends(get_async_session),
+    cache: ZooCache = Depends(get_read_cache),
+) -> Response:
+    """
+    Create (or upsert) many exhibits in the database
+    """
+    rows = await bulk_insert(
+        session=session, model_class=Exhibits, records=exhibits, on_conflict=on_conflict
+    )
+    cache.delete(*(entity_key(Exhibits, row.id) for row in rows))
+    return models_response(ExhibitsRead, validate_all(ExhibitsRead, rows))
+
+
+@exhibits_router.patch("/exhibits/bulk", response_model=BulkResult)
+async def bulk_update_exhibits(
+    exhibit: ExhibitsUpdate,
+    ids: Optional[List[int]] = Depends(ids_query),
+    filters: ExhibitsFilter = Depends(),
+    session: AsyncSession = Depends(get_async_session),
+    cache: ZooCache = Depends(get_read_cache),
+) -> Response:
+    """
+    Update many exhibits in the database by id or filter
+    """
+    updated_ids = await bulk_update(
+        session=session,
+        model_class=Exhibits,
+        values=exhibit.model_dump(exclude_unset=True),
+        ids=ids,
+        filters=filters,
+    )
+    cache.delete(*(entity_key(Exhibits, exhibit_id) for exhibit_id in updated_ids))
+    return model_response(BulkResult(count=len(updated_ids), ids=updated_ids))
+
+
+@exhibits_router.delete("/exhibits/bulk", response_model=BulkResult)
+async def bulk_delete_exhibits(
+    ids: Optional[List[int]] = Depends(ids_query),
+    filters: ExhibitsFilter = Depends(),
+    session: AsyncSession = Depends(get_async_session),
+    cache: ZooCache = Depends(get_read_cache),
+) -> Response:
+    """
+    Delete many exhibits from the database by id or filter
+    """
+    deleted_ids = await bulk_update(
+        session=session,
+        model_class=Exhibits,
+        values={"deleted_at": func.current_timestamp()},
+        ids=ids,
+        filters=filters,
+    )
+    cache.delete(*(entity_key(Exhibits, exhibit_id) for exhibit_id in deleted_ids))
+    invalidate_rosters(cache, Animals, exhibit_ids=deleted_ids)
+    invalidate_rosters(cache, Staff, exhibit_ids=deleted_ids)
+    return model_response(BulkResult(count=len(deleted_ids), ids=deleted_ids))
 
 
-@exhibits_router.get("/exhibits/{exhibit_id}", response_model=ExhibitsRead)
+@exhibits_router.get(
+    "/exhibits/{exhibit_id}",
+    response_model=Union[ExhibitsRead, CompoundDocument[ExhibitsRead]],
+)
 async def get_exhibit(
     exhibit_id: int,
-    session: AsyncSession = Depends(get_async_session),
-) -> ExhibitsRead:
+    request: Request,
+    response: Response,
+    fields: Optional[List[str]] = Depends(fields_query),
+    include: Optional[List[str]] = Depends(include_query),
+    session: AsyncSession = Depends(get_async_read_session),
+    cache: ZooCache = Depends(get_read_through_cache),
+) -> Response:
     """
     Get exhibit from the database
     """
-    exhibit: Optional[Exhibits] = await session.get(Exhibits, exhibit_id)
-    exhibit = check_model(model_instance=exhibit, model_class=Exhibits, id=exhibit_id)
-    exhibit_model = ExhibitsRead.model_validate(exhibit)
-    return exhibit_model
+    check_fields(ExhibitsRead, fields)
+    include_keys(Exhibits, include)
+    cache_key = entity_key(Exhibits, exhibit_id)
+    exhibit_model: Optional[ExhibitsRead] = cache.get(cache_key)
+    if exhibit_model is None:
+        generation = cache.generation
+        if include is None:
+            unchanged = await entity_not_modified(
+                request=request,
+                session=session,
+                model_class=Exhibits,
+                id=exhibit_id,
+                fields=fields,
+            )
+            if unchanged is not None:
+                return unchanged
+        exhibit: Optional[Exhibits] = await session.get(Exhibits, exhibit_id)
+        exhibit = check_model(
+            model_instance=exhibit, model_class=Exhibits, id=exhibit_id
+        )
+        exhibit_model = ExhibitsRead.model_validate(exhibit)
+        cache.set(cache_key, exhibit_model, generation=generation)
+    exhibit_fields = fields_model(ExhibitsRead, fields).model_validate(exhibit_model)
+    if include is not None:
+        included = await load_included(
+            session=session, model_class=Exhibits, rows=[exhibit_model], include=include
+        )
+        return compound_response(exhibit_fields, included, response)
+    updated_at = exhibit_model.updated_at
+    etag = entity_etag(Exhibits, id=exhibit_id, updated_at=updated_at, fields=fields)
+    if is_not_modified(request, etag=etag, last_modified=updated_at):
+        return not_modified(etag=etag, last_modified=updated_at)
+    set_validators(response, etag=etag, last_modified=updated_at)
+    return model_response(exhibit_fields, response)
 
 
 @exhibits_router.delete("/exhibits/{exhibit_id}", response_model=ExhibitsRead)
 async def delete_exhibit(
     exhibit_id: int,
     session: AsyncSession = Depends(get_async_session),
-) -> ExhibitsRead:
+    cache: ZooCache = Depends(get_read_cache),
+) -> Response:
     """
     Delete exhibit from the database
     """
-    exhibit: Optional[Exhibits] = await session.get(Exhibits, exhibit_id)
-    exhibit = check_model(model_instance=exhibit, model_class=Exhibits, id=exhibit_id)
-    exhibit.deleted_at = func.current_timestamp()
-    session.add(exhibit)
-    await session.commit()
-    await session.refresh(exhibit)
-    exhibit_model = ExhibitsRead.model_validate(exhibit)
-    return exhibit_model
+    db_exhibit = await delete_one(session=session, model_class=Exhibits, id=exhibit_id)
+    cache.delete(entity_key(Exhibits, exhibit_id))
+    invalidate_rosters(cache, Animals, exhibit_ids=[exhibit_id])
+    invalidate_rosters(cache, Staff, exhibit_ids=[exhibit_id])
+    return model_response(ExhibitsRead.model_validate(db_exhibit))
 
 
 @exhibits_router.patch("/exhibits/{exhibit_id}", response_model=ExhibitsRead)
@@ -97,62 +568,152 @@ async def update_exhibit(
     exhibit_id: int,
     exhibit: ExhibitsUpdate,
     session: AsyncSession = Depends(get_async_session),
-) -> ExhibitsRead:
+    cache: ZooCache = Depends(get_read_cache),
+) -> Response:
     """
     Update exhibit from the database
     """
-    db_exhibit: Optional[Exhibits] = await session.get(Exhibits, exhibit_id)
-    db_exhibit = check_model(
-        model_instance=db_exhibit, model_class=Exhibits, id=exhibit_id
+    db_exhibit = await update_one(
+        session=session,
+        model_class=Exhibits,
+        id=exhibit_id,
+        values=exhibit.model_dump(exclude_unset=True),
+    )
+    cache.delete(entity_key(Exhibits, exhibit_id))
+    return model_response(ExhibitsRead.model_validate(db_exhibit))
+
+
+async def _get_roster(
+    exhibit_id: int,
+    model_class: Type[Any],
+    read_model: Type[ZooModel],
+    filters: ZooModel,
+    request: Request,
+    response: Response,
+    offset: int,
+    limit: int,
+    cursor: Optional[str],
+    sort: str,
+    count: CountMode,
+    fields: Optional[List[str]],
+    session: AsyncSession,
+    cache: ZooCache,
+) -> Response:
+    """
+    Get a page of the live animals or staff of an exhibit
+
+    Pages are cached (body and pagination headers) by query string
+    until the roster changes. A page read while anything was invalidated
+    isn't cached, it may predate the write.
+    """
+    cache_key = roster_key(exhibit_id, model_class, page=request.url.query)
+    cached: Optional[Tuple[bytes, Dict[str, str]]] = cache.get(cache_key)
+    if cached is not None:
+        body, headers = cached
+        response.headers.update(headers)
+        return json_response(body, response)
+    generation = cache.generation
+    exhibit: Optional[Exhibits] = await session.get(Exhibits, exhibit_id)
+    check_model(model_instance=exhibit, model_class=Exhibits, id=exhibit_id)
+    columns = fields_columns(model_class, read_model, fields, sort=sort)
+    statement = paginate(
+        statement=select(*columns).where(
+            *filter_clauses(model_class=model_class, filters=filters)
+        ),
+        model_class=model_class,
+        offset=offset,
+        limit=limit,
+        cursor=cursor,
+        sort=sort,
+    )
+    await total_count(
+        session=session,
+        model_class=model_class,
+        filters=filters,
+        count=count,
+        response=response,
+    )
+    result = await session.execute(statement)
+    rows: Sequence[RowMapping] = next_page(
+        rows=result.mappings().all(),
+        limit=limit,
+        request=request,
+        response=response,
+        sort=sort,
     )
-    for field, value in exhibit.model_dump(exclude_unset=True).items():
-        setattr(db_exhibit, field, value)
-    session.add(db_exhibit)
-    await session.commit()
-    await session.refresh(db_exhibit)
-    exhibit_model = ExhibitsRead.model_validate(db_exhibit)
-    return exhibit_model
+    page_model = fields_model(read_model, fields)
+    page = models_response(page_model, validate_all(page_model, rows), response)
+    cache.set(cache_key, (page.body, dict(response.headers)), generation=generation)
+    return page
 
 
 @exhibits_router.get("/exhibits/{exhibit_id}/animals", response_model=List[AnimalsRead])
 async def get_exhibit_animals(
     exhibit_id: int,
-    session: AsyncSession = Depends(get_async_session),
-) -> List[AnimalsRead]:
+    request: Request,
+    response: Response,
+    offset: int = 0,
+    limit: int = Query(default=100, ge=1, le=100),
+    cursor: Optional[str] = cursor_query,
+    sort: SortOrder = sort_query,
+    count: CountMode = count_query,
+    filters: AnimalsRosterFilter = Depends(),
+    fields: Optional[List[str]] = Depends(fields_query),
+    session: AsyncSession = Depends(get_async_read_session),
+    cache: ZooCache = Depends(get_read_through_cache),
+) -> Response:
     """
     List animals in an exhibit
     """
-    exhibit: Optional[Exhibits] = await session.get(
-        entity=Exhibits,
-        ident=exhibit_id,
-        options=[
-            joinedload(
-                Exhibits.animals
-            )  # explicit load of relationship supports async session
-        ],
+    return await _get_roster(
+        exhibit_id=exhibit_id,
+        model_class=Animals,
+        read_model=AnimalsRead,
+        filters=AnimalsFilter(**filters.model_dump(), exhibit_id=exhibit_id),
+        request=request,
+        response=response,
+        offset=offset,
+        limit=limit,
+        cursor=cursor,
+        sort=sort,
+        count=count,
+        fields=fields,
+        session=session,
+        cache=cache,
     )
-    exhibit = check_model(model_instance=exhibit, model_class=Exhibits, id=exhibit_id)
-    animals: List[Animals] = exhibit.animals
-    animals_models = [AnimalsRead.model_validate(animal) for animal in animals]
-    return animals_models
 
 
 @exhibits_router.get("/exhibits/{exhibit_id}/staff", response_model=List[StaffRead])
 async def get_exhibit_staff(
     exhibit_id: int,
-    session: AsyncSession = Depends(get_async_session),
-) -> List[StaffRead]:
+    request: Request,
+    response: Response,
+    offset: int = 0,
+    limit: int = Query(default=100, ge=1, le=100),
+    cursor: Optional[str] = cursor_query,
+    sort: SortOrder = sort_query,
+    count: CountMode = count_query,
+    filters: StaffRosterFilter = Depends(),
+    fields: Optional[List[str]] = Depends(fields_query),
+    session: AsyncSession = Depends(get_async_read_session),
+    cache: ZooCache = Depends(get_read_through_cache),
+) -> Response:
     """
     List staff in an exhibit
     """
-    exhibit: Optional[Exhibits] = await session.get(
-        entity=Exhibits,
-        ident=exhibit_id,
-        options=[
-            joinedload(Exhibits.staff),
-        ],
+    return await _get_roster(
+        exhibit_id=exhibit_id,
+        model_class=Staff,
+        read_model=StaffRead,
+        filters=StaffFilter(**filters.model_dump(), exhibit_id=exhibit_id),
+        request=request,
+        response=response,
+        offset=offset,
+        limit=limit,
+        cursor=cursor,
+        sort=sort,
+        count=count,
+        fields=fields,
+        session=session,
+        cache=cache,
     )
-    exhibit = check_model(model_instance=exhibit, model_class=Exhibits, id=exhibit_id)
-    staff: List[Staff] = exhibit.staff
-    staff_models = [StaffRead.model_validate(staff) for staff in staff]
-    return staff_models
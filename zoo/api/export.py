@@ -0,0 +1,113 @@
+"""
+Streaming Export Helpers
+
+Newline delimited JSON (NDJSON) exports of full entity tables
+"""
+
+from typing import Any, AsyncGenerator, Dict, Type, Union
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from zoo.api.fields import fields_columns
+from zoo.api.responses import validate_all
+from zoo.db import async_read_engine
+from zoo.schemas.base import ZooModel
+
+EXPORT_CHUNK_SIZE = 1000
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+export_responses: Dict[Union[int, str], Dict[str, Any]] = {
+    200: {
+        "description": "One JSON object per line",
+        "content": {NDJSON_MEDIA_TYPE: {}},
+    }
+}
+
+
+def snapshot_execution_options() -> Dict[str, Any]:
+    """
+    Get the execution options for a consistent read snapshot
+
+    PostgreSQL needs REPEATABLE READ to see a single snapshot across
+    the fetches of a server-side cursor. SQLite reads through a single
+    statement are already isolated from concurrent writers.
+    """
+    if async_read_engine.dialect.name == "postgresql":
+        return {"isolation_level": "REPEATABLE READ"}
+    return {}
+
+
+async def iter_ndjson(
+    model_class: Type[Any],
+    read_model: Type[ZooModel],
+    sessionmaker: async_sessionmaker[AsyncSession],
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> AsyncGenerator[bytes, None]:
+    """
+    Yield live rows of a table as NDJSON, one chunk at a time
+
+    The rows are read with a server-side cursor so memory stays
+    flat regardless of the table size. A dedicated session is used
+    because request scoped sessions are closed before a streaming
+    response is sent.
+
+    Parameters
+    ----------
+    model_class : Type[Any]
+        The database model to export
+    read_model : Type[ZooModel]
+        The pydantic model used to serialize each row
+    sessionmaker : async_sessionmaker[AsyncSession]
+        The sessionmaker of the request, see `read_sessionmaker`
+    chunk_size : int
+        The number of rows fetched and flushed at a time
+
+    Yields
+    ------
+    bytes
+        A chunk of NDJSON lines
+    """
+    statement = (
+        select(*fields_columns(model_class, read_model, fields=None))
+        .order_by(model_class.id)
+        .execution_options(yield_per=chunk_size)
+    )
+    async with sessionmaker() as session:
+        await session.connection(execution_options=snapshot_execution_options())
+        result = await session.stream(statement)
+        async for rows in result.mappings().partitions():
+            yield b"".join(
+                model.model_dump_json().encode("utf-8") + b"\n"
+                for model in validate_all(read_model, rows)
+            )
+
+
+def ndjson_export(
+    model_class: Type[Any],
+    read_model: Type[ZooModel],
+    sessionmaker: async_sessionmaker[AsyncSession],
+) -> StreamingResponse:
+    """
+    Stream the live rows of a table as an NDJSON response
+
+    Parameters
+    ----------
+    model_class : Type[Any]
+        The database model to export
+    read_model : Type[ZooModel]
+        The pydantic model used to serialize each row
+    sessionmaker : async_sessionmaker[AsyncSession]
+        The sessionmaker of the request, see `read_sessionmaker`
+
+    Returns
+    -------
+    StreamingResponse
+    """
+    return StreamingResponse(
+        iter_ndjson(
+            model_class=model_class, read_model=read_model, sessionmaker=sessionmaker
+        ),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
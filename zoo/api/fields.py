@@ -0,0 +1,143 @@
+"""
+Sparse Fieldset Helpers
+
+Limit the columns loaded from the database and the fields returned
+"""
+
+import functools
+from typing import Any, List, Optional, Sequence, Tuple, Type
+
+from fastapi import HTTPException, Query
+from pydantic import BaseModel, ConfigDict, create_model
+
+from zoo.api.pagination import sort_column
+from zoo.schemas.base import ZooModel
+
+
+def fields_query(
+    fields: Optional[str] = Query(
+        default=None,
+        description=(
+            "Comma separated list of fields to return, e.g. `id,name`. "
+            "Only these columns are loaded from the database."
+        ),
+    ),
+) -> Optional[List[str]]:
+    """
+    Parse a comma separated list of fields
+
+    Used by FastAPI Depends
+    """
+    if fields is None:
+        return None
+    parsed = [field.strip() for field in fields.split(",") if field.strip()]
+    return list(dict.fromkeys(parsed))
+
+
+def check_fields(read_model: Type[ZooModel], fields: Optional[List[str]]) -> None:
+    """
+    Check that the requested fields exist on a pydantic model
+
+    Parameters
+    ----------
+    read_model : Type[ZooModel]
+        The pydantic model the fields belong to
+    fields : Optional[List[str]]
+        The requested fields
+
+    Raises
+    ------
+    HTTPException
+        If a requested field doesn't exist
+    """
+    if fields is None:
+        return
+    unknown_fields = [field for field in fields if field not in read_model.model_fields]
+    if unknown_fields or not fields:
+        error_msg = f"Error: invalid fields - {','.join(unknown_fields)}"
+        raise HTTPException(status_code=400, detail=error_msg)
+
+
+def fields_columns(
+    model_class: Type[Any],
+    read_model: Type[ZooModel],
+    fields: Optional[List[str]],
+    sort: str = "id",
+    extra: Sequence[str] = (),
+) -> List[Any]:
+    """
+    Get the columns to select for the requested fields
+
+    Selecting columns (instead of the model) returns plain rows, so no
+    ORM instances are built. The `id` and sort columns are always
+    selected, they are needed for pagination.
+
+    Parameters
+    ----------
+    model_class : Type[Any]
+        The database model being selected
+    read_model : Type[ZooModel]
+        The pydantic model the fields belong to
+    fields : Optional[List[str]]
+        The requested fields, `None` selects every field of the read model
+    sort : str
+        The sort order of the query
+    extra : Sequence[str]
+        Additional columns to select, e.g. relationship join columns
+
+    Returns
+    -------
+    List[Any]
+
+    Raises
+    ------
+    HTTPException
+        If a requested field doesn't exist
+    """
+    check_fields(read_model, fields)
+    names = list(read_model.model_fields) if fields is None else fields
+    columns = dict.fromkeys([*names, "id", sort_column(sort), *extra])
+    return [getattr(model_class, column) for column in columns]
+
+
+@functools.lru_cache(maxsize=128)
+def _fields_model(
+    read_model: Type[ZooModel], fields: Tuple[str, ...]
+) -> Type[BaseModel]:
+    """
+    Create (and cache) a pydantic model with a subset of fields
+    """
+    field_definitions: Any = {
+        field: (
+            read_model.model_fields[field].annotation,
+            read_model.model_fields[field],
+        )
+        for field in fields
+    }
+    return create_model(
+        f"{read_model.__name__}Fields",
+        __config__=ConfigDict(from_attributes=True),
+        **field_definitions,
+    )
+
+
+def fields_model(
+    read_model: Type[ZooModel], fields: Optional[List[str]]
+) -> Type[BaseModel]:
+    """
+    Get the pydantic model used to serialize the requested fields
+
+    Parameters
+    ----------
+    read_model : Type[ZooModel]
+        The full read model
+    fields : Optional[List[str]]
+        The requested fields, `None` returns the full read model
+
+    Returns
+    -------
+    Type[BaseModel]
+    """
+    if fields is None:
+        return read_model
+    return _fields_model(read_model, tuple(fields))
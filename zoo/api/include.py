@@ -0,0 +1,207 @@
+"""
+Compound Document Helpers
+
+Side-load related records with `?include=` in a bounded number of queries
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from fastapi import HTTPException, Query, Response
+from sqlalchemy import RowMapping, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import RelationshipProperty
+
+from zoo.api.fields import fields_columns, fields_model
+from zoo.api.pagination import row_value
+from zoo.api.responses import compound_response, models_response, validate_all
+from zoo.models.animals import Animals
+from zoo.models.exhibits import Exhibits
+from zoo.models.staff import Staff
+from zoo.schemas.animals import AnimalsRead
+from zoo.schemas.base import ZooModel
+from zoo.schemas.exhibits import ExhibitsRead
+from zoo.schemas.staff import StaffRead
+
+READ_MODELS: Dict[Type[Any], Type[ZooModel]] = {
+    Animals: AnimalsRead,
+    Exhibits: ExhibitsRead,
+    Staff: StaffRead,
+}
+
+
+def include_query(
+    include: Optional[str] = Query(
+        default=None,
+        description=(
+            "Comma separated list of relationships to side-load, e.g. "
+            "`exhibit,exhibit.staff`. The response becomes "
+            '`{"data": ..., "included": {"<table>": [...]}}`.'
+        ),
+    ),
+) -> Optional[List[str]]:
+    """
+    Parse a comma separated list of relationship paths
+
+    Used by FastAPI Depends
+    """
+    if include is None:
+        return None
+    parsed = [path.strip() for path in include.split(",") if path.strip()]
+    return list(dict.fromkeys(parsed)) or None
+
+
+def _relationship(model_class: Type[Any], name: str) -> "RelationshipProperty[Any]":
+    """
+    Get a relationship of a database model
+
+    Raises
+    ------
+    HTTPException
+        If the model has no such relationship
+    """
+    relationship = inspect(model_class).relationships.get(name)
+    if relationship is None or relationship.mapper.class_ not in READ_MODELS:
+        error_msg = f"Error: invalid include - {name}"
+        raise HTTPException(status_code=400, detail=error_msg)
+    return relationship
+
+
+def _join_keys(relationship: "RelationshipProperty[Any]") -> Tuple[str, str]:
+    """
+    Get the (local, remote) column names joining a relationship
+    """
+    pairs = relationship.local_remote_pairs or []
+    local, remote = pairs[0]
+    return str(local.name), str(remote.name)
+
+
+def include_keys(model_class: Type[Any], include: Optional[List[str]]) -> List[str]:
+    """
+    Check the include paths and get the columns needed to follow them
+
+    Parameters
+    ----------
+    model_class : Type[Any]
+        The database model of the primary records
+    include : Optional[List[str]]
+        The requested relationship paths
+
+    Returns
+    -------
+    List[str]
+        The columns of the primary records the relationships join on
+
+    Raises
+    ------
+    HTTPException
+        If a relationship doesn't exist
+    """
+    keys: List[str] = []
+    for path in include or []:
+        source_class = model_class
+        for depth, name in enumerate(path.split(".")):
+            relationship = _relationship(source_class, name)
+            if depth == 0:
+                keys.append(_join_keys(relationship)[0])
+            source_class = relationship.mapper.class_
+    return keys
+
+
+async def load_included(
+    session: AsyncSession,
+    model_class: Type[Any],
+    rows: Sequence[Any],
+    include: List[str],
+) -> Dict[str, List[Any]]:
+    """
+    Load the related records of the primary records
+
+    Each relationship on a path is loaded for all of its source records
+    with one `WHERE key IN (...)` query, so the number of queries depends
+    on the include paths, never on the number of rows.
+
+    Parameters
+    ----------
+    session : AsyncSession
+        The database session
+    model_class : Type[Any]
+        The database model of the primary records
+    rows : Sequence[Any]
+        The primary records (rows or models), with their join columns
+    include : List[str]
+        The relationship paths to load
+
+    Returns
+    -------
+    Dict[str, List[Any]]
+        The validated related records by table name, ordered by id
+    """
+    loaded: Dict[str, Sequence[Any]] = {"": rows}
+    included: Dict[Type[Any], Dict[int, RowMapping]] = {}
+    for path in include:
+        names = path.split(".")
+        source_class = model_class
+        for depth, name in enumerate(names):
+            prefix = ".".join(names[: depth + 1])
+            relationship = _relationship(source_class, name)
+            target_class = relationship.mapper.class_
+            if prefix not in loaded:
+                local_key, remote_key = _join_keys(relationship)
+                source_rows = loaded[".".join(names[:depth])]
+                values = {row_value(row, local_key) for row in source_rows} - {None}
+                read_model = READ_MODELS[target_class]
+                statement = select(*fields_columns(target_class, read_model, None))
+                result = await session.execute(
+                    statement.where(getattr(target_class, remote_key).in_(values))
+                )
+                loaded[prefix] = result.mappings().all()
+                records = included.setdefault(target_class, {})
+                records.update((row["id"], row) for row in loaded[prefix])
+            source_class = target_class
+    return {
+        target_class.__tablename__: validate_all(
+            READ_MODELS[target_class], [records[key] for key in sorted(records)]
+        )
+        for target_class, records in included.items()
+    }
+
+
+async def rows_response(
+    session: AsyncSession,
+    model_class: Type[Any],
+    rows: Sequence[Any],
+    fields: Optional[List[str]],
+    include: Optional[List[str]],
+    response: Response,
+) -> Response:
+    """
+    Serialize list rows, side-loading the included relationships
+
+    Parameters
+    ----------
+    session : AsyncSession
+        The database session
+    model_class : Type[Any]
+        The database model of the rows
+    rows : Sequence[Any]
+        The primary records
+    fields : Optional[List[str]]
+        The requested fields of the primary records
+    include : Optional[List[str]]
+        The relationship paths to side-load
+    response : Response
+        The route's response, to copy headers from
+
+    Returns
+    -------
+    Response
+        A list, or a compound document when relationships are included
+    """
+    read_model = fields_model(READ_MODELS[model_class], fields)
+    models = validate_all(read_model, rows)
+    if include is None:
+        return models_response(read_model, models, response)
+    included = await load_included(
+        session=session, model_class=model_class, rows=rows, include=include
+    )
+    return compound_response(models, included, response)
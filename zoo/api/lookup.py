@@ -0,0 +1,81 @@
+"""
+Multi-Get Helpers
+
+Fetch many records by id with a single `WHERE id IN (...)` query
+"""
+
+from typing import Any, Dict, List, Type
+
+from fastapi import HTTPException, Response
+from sqlalchemy import RowMapping, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from zoo.schemas.utils import MAX_LOOKUP_IDS
+
+NOT_FOUND_HEADER = "X-Not-Found-Ids"
+DELETED_HEADER = "X-Deleted-Ids"
+
+
+async def lookup_rows(
+    session: AsyncSession,
+    model_class: Type[Any],
+    columns: List[Any],
+    ids: List[int],
+    response: Response,
+) -> List[RowMapping]:
+    """
+    Get the live records with the given ids, in request order
+
+    Ids that don't exist are listed in the `X-Not-Found-Ids` header and
+    ids of soft-deleted records in the `X-Deleted-Ids` header.
+
+    Parameters
+    ----------
+    session : AsyncSession
+        The database session
+    model_class : Type[Any]
+        The database model to select
+    columns : List[Any]
+        The columns to select, see `fields_columns`
+    ids : List[int]
+        The ids to get, duplicates are only returned once
+    response : Response
+        The route's response, the status headers are set on it
+
+    Returns
+    -------
+    List[RowMapping]
+        The rows of the live records
+
+    Raises
+    ------
+    HTTPException
+        If too many ids are requested
+    """
+    ids = list(dict.fromkeys(ids))
+    if len(ids) > MAX_LOOKUP_IDS:
+        error_msg = f"Error: too many ids - the maximum is {MAX_LOOKUP_IDS}"
+        raise HTTPException(status_code=400, detail=error_msg)
+    statement = (
+        select(*columns)
+        .add_columns(model_class.deleted_at.label("lookup_deleted_at"))
+        .where(model_class.id.in_(ids))
+        .execution_options(include_deleted=True)
+    )
+    result = await session.execute(statement)
+    rows: Dict[int, RowMapping] = {row["id"]: row for row in result.mappings()}
+    not_found_ids = [str(id_) for id_ in ids if id_ not in rows]
+    deleted_ids = [
+        str(id_)
+        for id_ in ids
+        if id_ in rows and rows[id_]["lookup_deleted_at"] is not None
+    ]
+    if not_found_ids:
+        response.headers[NOT_FOUND_HEADER] = ",".join(not_found_ids)
+    if deleted_ids:
+        response.headers[DELETED_HEADER] = ",".join(deleted_ids)
+    return [
+        rows[id_]
+        for id_ in ids
+        if id_ in rows and rows[id_]["lookup_deleted_at"] is None
+    ]
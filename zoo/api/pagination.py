@@ -0,0 +1,236 @@
+"""
+Pagination Helpers
+
+Offset and keyset (cursor) pagination for list endpoints
+"""
+
+import base64
+import binascii
+import datetime
+import json
+from typing import Any, Dict, Literal, Mapping, Optional, Sequence, Type, TypeVar
+
+from fastapi import HTTPException, Query, Request, Response
+from sqlalchemy import Select, literal, tuple_
+
+RowType = TypeVar("RowType")
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+SortOrder = Literal[
+    "id",
+    "-id",
+    "name",
+    "-name",
+    "created_at",
+    "-created_at",
+    "updated_at",
+    "-updated_at",
+]
+
+cursor_query = Query(
+    default=None,
+    description=(
+        "Opaque cursor returned in the `X-Next-Cursor` header of a previous page. "
+        "When provided, `offset` is ignored and the page starts after the cursor."
+    ),
+)
+sort_query = Query(
+    default="id",
+    description="The column to sort by, prefix with `-` for descending order",
+)
+
+
+def encode_cursor(values: Dict[str, Any]) -> str:
+    """
+    Encode keyset values into an opaque cursor
+
+    Parameters
+    ----------
+    values : Dict[str, Any]
+        The keyset values of the last row on a page
+
+    Returns
+    -------
+    str
+        A URL-safe cursor string
+    """
+    payload = json.dumps(values, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    Decode an opaque cursor into its keyset values
+
+    Parameters
+    ----------
+    cursor : str
+        A cursor previously created by `encode_cursor`
+
+    Returns
+    -------
+    Dict[str, Any]
+        The keyset values of the last row on the previous page
+
+    Raises
+    ------
+    HTTPException
+        If the cursor is malformed
+    """
+    padding = "=" * (-len(cursor) % 4)
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + padding))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail="Error: invalid cursor") from e
+    if not isinstance(values, dict) or not isinstance(values.get("id"), int):
+        raise HTTPException(status_code=400, detail="Error: invalid cursor")
+    return values
+
+
+def sort_column(sort: str) -> str:
+    """
+    Get the column name of a sort order, e.g. `-name` -> `name`
+    """
+    return sort.lstrip("-")
+
+
+def _cursor_value(model_class: Type[Any], sort: str, value: Any) -> Any:
+    """
+    Convert a JSON cursor value back into the sort column's python type
+    """
+    column = getattr(model_class, sort_column(sort))
+    try:
+        if column.type.python_type is datetime.datetime:
+            return datetime.datetime.fromisoformat(value)
+    except (TypeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail="Error: invalid cursor") from e
+    return value
+
+
+def paginate(
+    statement: "Select[Any]",
+    model_class: Type[Any],
+    offset: int,
+    limit: int,
+    cursor: Optional[str],
+    sort: str = "id",
+) -> "Select[Any]":
+    """
+    Apply sorting and offset or keyset pagination to a select statement
+
+    Rows are always ordered by the sort column and then `id`, so keyset
+    pagination seeks with `WHERE (sort_column, id) > (:last_value, :last_id)`.
+    One extra row is requested so `next_page` can tell whether
+    another page exists without a second query.
+
+    Parameters
+    ----------
+    statement : Select
+        The select statement to paginate
+    model_class : Type[Any]
+        The model class being paged through
+    offset : int
+        The number of rows to skip (ignored when a cursor is provided)
+    limit : int
+        The page size
+    cursor : Optional[str]
+        The cursor of the previous page
+    sort : str
+        The sort order, a column name optionally prefixed by `-` for descending
+
+    Returns
+    -------
+    Select
+        The paginated select statement
+
+    Raises
+    ------
+    HTTPException
+        If the cursor doesn't belong to this sort order
+    """
+    descending = sort.startswith("-")
+    sort_by_id = sort_column(sort) == "id"
+    id_column = model_class.id
+    column = getattr(model_class, sort_column(sort))
+    if cursor is not None:
+        values = decode_cursor(cursor)
+        if values.get("sort", "id") != sort:
+            error_msg = f"Error: cursor does not match sort order - {sort}"
+            raise HTTPException(status_code=400, detail=error_msg)
+        if sort_by_id:
+            keyset, last_keyset = id_column, values["id"]
+        else:
+            last_value = _cursor_value(model_class, sort, values.get("value"))
+            keyset = tuple_(column, id_column)
+            last_keyset = tuple_(literal(last_value, column.type), values["id"])
+        seek = keyset < last_keyset if descending else keyset > last_keyset
+        statement = statement.where(seek)
+    else:
+        statement = statement.offset(offset)
+    sort_key = id_column if sort_by_id else column
+    order_by = [sort_key, id_column]
+    if descending:
+        order_by = [sort_key.desc(), id_column.desc()]
+    if sort_by_id:
+        order_by = order_by[:1]
+    return statement.order_by(*order_by).limit(limit + 1)
+
+
+def row_value(row: Any, column: str) -> Any:
+    """
+    Get a column value from an ORM instance, row or row mapping
+    """
+    if isinstance(row, Mapping):
+        return row[column]
+    return getattr(row, column)
+
+
+def next_page(
+    rows: Sequence[RowType],
+    limit: int,
+    request: Request,
+    response: Response,
+    sort: str = "id",
+) -> Sequence[RowType]:
+    """
+    Trim a page fetched by `paginate` and set the next page headers
+
+    Sets `X-Next-Cursor` and a `Link: rel="next"` header
+    when there are more rows after this page.
+
+    Parameters
+    ----------
+    rows : Sequence[RowType]
+        The rows returned by the paginated statement
+    limit : int
+        The page size
+    request : Request
+        The incoming request, used to build the next page URL
+    response : Response
+        The outgoing response to set the headers on
+    sort : str
+        The sort order the rows were paginated with
+
+    Returns
+    -------
+    Sequence[RowType]
+        The rows of this page
+    """
+    page = rows[:limit]
+    if len(rows) <= limit or not page:
+        return page
+    last_row: Any = page[-1]
+    cursor_values: Dict[str, Any] = {"id": row_value(last_row, "id")}
+    if sort != "id":
+        value = row_value(last_row, sort_column(sort))
+        if isinstance(value, datetime.datetime):
+            value = value.isoformat()
+        cursor_values.update(sort=sort, value=value)
+    next_cursor = encode_cursor(cursor_values)
+    next_url = request.url.remove_query_params("offset").include_query_params(
+        cursor=next_cursor
+    )
+    response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    response.headers["Link"] = f'<{next_url}>; rel="next"'
+    return page
@@ -0,0 +1,126 @@
+"""
+JSON Response Helpers
+
+Validate models once and serialize them straight to JSON bytes, instead
+of FastAPI re-validating the `response_model` and running `jsonable_encoder`
+"""
+
+import functools
+from typing import Any, Dict, Iterable, List, Optional, Type
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+from zoo.schemas.include import CompoundDocument, IncludedRecords
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+@functools.lru_cache(maxsize=128)
+def list_adapter(model: Type[BaseModel]) -> "TypeAdapter[List[Any]]":
+    """
+    Get (and cache) a TypeAdapter for a list of models
+    """
+    return TypeAdapter(List[model])  # type: ignore[valid-type]
+
+
+def validate_all(model: Type[BaseModel], rows: Iterable[Any]) -> List[Any]:
+    """
+    Validate many objects into models in a single call
+
+    Parameters
+    ----------
+    model : Type[BaseModel]
+        The pydantic model to validate into
+    rows : Iterable[Any]
+        ORM instances (or any objects / mappings) to validate
+
+    Returns
+    -------
+    List[Any]
+        The validated models
+    """
+    return list_adapter(model).validate_python(rows, from_attributes=True)
+
+
+def json_response(body: bytes, response: Optional[Response]) -> Response:
+    """
+    Wrap JSON bytes in a response, keeping any headers already set
+    """
+    body_response = Response(content=body, media_type=JSON_MEDIA_TYPE)
+    if response is not None:
+        body_response.raw_headers.extend(response.raw_headers)
+    return body_response
+
+
+def model_response(content: BaseModel, response: Optional[Response] = None) -> Response:
+    """
+    Serialize a model into a JSON response
+
+    Parameters
+    ----------
+    content : BaseModel
+        The validated model
+    response : Optional[Response]
+        The route's response, to copy headers from
+
+    Returns
+    -------
+    Response
+    """
+    return json_response(content.model_dump_json().encode("utf-8"), response)
+
+
+def models_response(
+    model: Type[BaseModel],
+    content: List[Any],
+    response: Optional[Response] = None,
+) -> Response:
+    """
+    Serialize a list of models into a JSON response
+
+    Parameters
+    ----------
+    model : Type[BaseModel]
+        The pydantic model of the list items
+    content : List[Any]
+        The validated models
+    response : Optional[Response]
+        The route's response, to copy headers from
+
+    Returns
+    -------
+    Response
+    """
+    return json_response(list_adapter(model).dump_json(content), response)
+
+
+def compound_response(
+    data: Any,
+    included: Dict[str, List[Any]],
+    response: Optional[Response] = None,
+) -> Response:
+    """
+    Serialize primary data and side-loaded records into a JSON response
+
+    Parameters
+    ----------
+    data : Any
+        The validated model (or list of models)
+    included : Dict[str, List[Any]]
+        The validated related models by table name
+    response : Optional[Response]
+        The route's response, to copy headers from
+
+    Returns
+    -------
+    Response
+        A `{"data": ..., "included": ...}` document, see `CompoundDocument`
+    """
+    document = CompoundDocument[Any](
+        data=data, included=IncludedRecords.model_validate(included)
+    )
+    # Only the included tables are present
+    missing = set(IncludedRecords.model_fields) - set(included)
+    body = document.model_dump_json(exclude={"included": missing})
+    return json_response(body.encode("utf-8"), response)
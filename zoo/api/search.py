@@ -0,0 +1,123 @@
+"""
+Search Router app
+"""
+
+import logging
+import re
+from typing import Any, List, Tuple, Type, Union
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy import (
+    Select,
+    column,
+    desc,
+    func,
+    literal,
+    literal_column,
+    select,
+    table,
+    union_all,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnClause
+
+from zoo.api.responses import models_response, validate_all
+from zoo.db import get_async_read_session
+from zoo.models.animals import Animals
+from zoo.models.exhibits import Exhibits
+from zoo.models.staff import Staff
+from zoo.schemas.search import SearchResult
+
+logger = logging.getLogger(__name__)
+
+search_router = APIRouter(tags=["search"])
+
+searchable_models: Tuple[Union[Type[Animals], Type[Exhibits], Type[Staff]], ...] = (
+    Animals,
+    Exhibits,
+    Staff,
+)
+
+# The FTS5 virtual table (SQLite only), managed by migrations
+search_index = table(
+    "search_index",
+    column("rowid"),
+    column("entity_type"),
+    column("entity_id"),
+    column("name"),
+)
+
+# bm25 column weights: entity_type, entity_id, name, body
+SQLITE_WEIGHTS = (0.0, 0.0, 10.0, 1.0)
+
+
+def _fts5_query(q: str) -> str:
+    """
+    Quote each search term so user input can't use FTS5 query syntax
+    """
+    return " ".join(f'"{term}"' for term in re.findall(r"\w+", q))
+
+
+def _sqlite_statement(q: str) -> Select[Any]:
+    """
+    Rank matches from the FTS5 `search_index` table
+    """
+    bm25 = func.bm25(literal_column(search_index.name), *SQLITE_WEIGHTS)
+    return (
+        select(
+            search_index.c.entity_type,
+            search_index.c.entity_id.label("id"),
+            search_index.c.name,
+            (-bm25).label("rank"),
+        )
+        .where(literal_column(search_index.name).op("MATCH")(_fts5_query(q)))
+        .order_by(bm25, search_index.c.rowid)
+    )
+
+
+def _postgresql_statement(q: str) -> Select[Any]:
+    """
+    Rank matches from the `search_vector` column of every searchable table
+    """
+    ts_query = func.websearch_to_tsquery("english", q)
+    statements = []
+    for model_class in searchable_models:
+        table_name = model_class.__tablename__
+        search_vector: ColumnClause[Any] = literal_column(f"{table_name}.search_vector")
+        statements.append(
+            select(
+                literal(table_name).label("entity_type"),
+                model_class.id,
+                model_class.name,
+                func.ts_rank(search_vector, ts_query).label("rank"),
+            ).where(
+                search_vector.op("@@")(ts_query),
+                model_class.deleted_at.is_(None),
+            )
+        )
+    search = union_all(*statements).subquery()
+    return select(search).order_by(
+        desc(search.c.rank), search.c.entity_type, search.c.id
+    )
+
+
+@search_router.get("/search", response_model=List[SearchResult])
+async def search(
+    q: str = Query(min_length=1, description="The text to search for"),
+    offset: int = 0,
+    limit: int = Query(default=100, ge=1, le=100),
+    session: AsyncSession = Depends(get_async_read_session),
+) -> Response:
+    """
+    Search animals, exhibits and staff, ranked by relevance
+    """
+    dialect_name = session.get_bind().dialect.name
+    if dialect_name == "postgresql":
+        statement = _postgresql_statement(q)
+    elif not _fts5_query(q):
+        return models_response(SearchResult, [])
+    else:
+        statement = _sqlite_statement(q)
+    result = await session.execute(statement.offset(offset).limit(limit))
+    rows = validate_all(SearchResult, result.all())
+    return models_response(SearchResult, rows)
@@ -3,86 +3,356 @@ Staff backend
 """
 
 import logging
-from typing import List, Optional, Sequence
+from typing import List, Optional, Sequence, Union
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import RowMapping, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from zoo.api.utils import check_model
-from zoo.db import get_async_session
+from zoo.api.bulk import OnConflict, bulk_insert, bulk_update, on_conflict_query
+from zoo.api.conditional import (
+    entity_etag,
+    entity_not_modified,
+    is_not_modified,
+    not_modified,
+    page_not_modified,
+    set_validators,
+)
+from zoo.api.count import CountMode, count_query, total_count
+from zoo.api.export import export_responses, ndjson_export
+from zoo.api.fields import (
+    check_fields,
+    fields_columns,
+    fields_model,
+    fields_query,
+)
+from zoo.api.include import (
+    include_keys,
+    include_query,
+    load_included,
+    rows_response,
+)
+from zoo.api.lookup import lookup_rows
+from zoo.api.pagination import (
+    SortOrder,
+    cursor_query,
+    next_page,
+    paginate,
+    sort_query,
+)
+from zoo.api.responses import (
+    compound_response,
+    model_response,
+    models_response,
+    validate_all,
+)
+from zoo.api.utils import check_model, filter_clauses, ids_query
+from zoo.api.writes import delete_one, insert_one, update_one
+from zoo.cache import (
+    ZooCache,
+    entity_key,
+    get_read_cache,
+    get_read_through_cache,
+    invalidate_rosters,
+)
+from zoo.db import get_async_read_session, get_async_session, read_sessionmaker
 from zoo.models.staff import Staff
-from zoo.schemas.staff import StaffCreate, StaffRead, StaffUpdate
+from zoo.schemas.include import CompoundDocument
+from zoo.schemas.staff import (
+    StaffBulkCreate,
+    StaffCreate,
+    StaffFilter,
+    StaffRead,
+    StaffUpdate,
+)
+from zoo.schemas.utils import BulkResult, LookupRequest
 
 logger = logging.getLogger(__name__)
 
 staff_router = APIRouter(tags=["staff"])
 
 
-@staff_router.get("/staff", response_model=List[StaffRead])
+@staff_router.get(
+    "/staff",
+    response_model=Union[List[StaffRead], CompoundDocument[List[StaffRead]]],
+)
 async def get_staff_members(
+    request: Request,
+    response: Response,
     offset: int = 0,
-    limit: int = Query(default=100, le=100),
-    session: AsyncSession = Depends(get_async_session),
-) -> List[StaffRead]:
+    limit: int = Query(default=100, ge=1, le=100),
+    cursor: Optional[str] = cursor_query,
+    sort: SortOrder = sort_query,
+    count: CountMode = count_query,
+    filters: StaffFilter = Depends(),
+    ids: Optional[List[int]] = Depends(ids_query),
+    fields: Optional[List[str]] = Depends(fields_query),
+    include: Optional[List[str]] = Depends(include_query),
+    session: AsyncSession = Depends(get_async_read_session),
+) -> Response:
     """
     Get staff from the database
+
+    When `ids` are given, those staff are returned in request order
+    instead of a page (the other query parameters are ignored).
+    """
+    columns = fields_columns(
+        Staff,
+        StaffRead,
+        fields,
+        sort=sort,
+        extra=[*include_keys(Staff, include), "updated_at"],
+    )
+    if ids is not None:
+        requested = await lookup_rows(
+            session=session,
+            model_class=Staff,
+            columns=columns,
+            ids=ids,
+            response=response,
+        )
+        return await rows_response(
+            session=session,
+            model_class=Staff,
+            rows=requested,
+            fields=fields,
+            include=include,
+            response=response,
+        )
+    statement = paginate(
+        statement=select(*columns).where(
+            *filter_clauses(model_class=Staff, filters=filters)
+        ),
+        model_class=Staff,
+        offset=offset,
+        limit=limit,
+        cursor=cursor,
+        sort=sort,
+    )
+    await total_count(
+        session=session,
+        model_class=Staff,
+        filters=filters,
+        count=count,
+        response=response,
+    )
+    result = await session.execute(statement)
+    staff: Sequence[RowMapping] = next_page(
+        rows=result.mappings().all(),
+        limit=limit,
+        request=request,
+        response=response,
+        sort=sort,
+    )
+    if include is None:
+        # Included records have their own versions, so only plain lists are
+        # answered with validators
+        unchanged = page_not_modified(request, response=response, rows=staff)
+        if unchanged is not None:
+            return unchanged
+    return await rows_response(
+        session=session,
+        model_class=Staff,
+        rows=staff,
+        fields=fields,
+        include=include,
+        response=response,
+    )
+
+
+@staff_router.get(
+    "/staff/export",
+    response_class=StreamingResponse,
+    responses=export_responses,
+)
+async def export_staff(request: Request) -> StreamingResponse:
+    """
+    Export all staff from the database as newline delimited JSON
     """
-    result = await session.execute(
-        select(Staff)
-        .where(Staff.deleted_at.is_(None))
-        .order_by(Staff.id)
-        .offset(offset)
-        .limit(limit)
+    return ndjson_export(
+        model_class=Staff, read_model=StaffRead, sessionmaker=read_sessionmaker(request)
     )
-    staff: Sequence[Staff] = result.scalars().all()
-    staff_models = [StaffRead.model_validate(staff_member) for staff_member in staff]
-    return staff_models
 
 
-@staff_router.get("/staff/{staff_id}", response_model=StaffRead)
+@staff_router.post(
+    "/staff/lookup",
+    response_model=Union[List[StaffRead], CompoundDocument[List[StaffRead]]],
+)
+async def lookup_staff(
+    lookup: LookupRequest,
+    response: Response,
+    fields: Optional[List[str]] = Depends(fields_query),
+    include: Optional[List[str]] = Depends(include_query),
+    session: AsyncSession = Depends(get_async_read_session),
+) -> Response:
+    """
+    Get many staff by id, in request order
+
+    Use this instead of `GET /staff?ids=` for long lists of ids.
+    """
+    columns = fields_columns(
+        Staff, StaffRead, fields, extra=include_keys(Staff, include)
+    )
+    staff = await lookup_rows(
+        session=session,
+        model_class=Staff,
+        columns=columns,
+        ids=lookup.ids,
+        response=response,
+    )
+    return await rows_response(
+        session=session,
+        model_class=Staff,
+        rows=staff,
+        fields=fields,
+        include=include,
+        response=response,
+    )
+
+
+@staff_router.get(
+    "/staff/{staff_id}",
+    response_model=Union[StaffRead, CompoundDocument[StaffRead]],
+)
 async def get_staff(
-    staff_id: int, session: AsyncSession = Depends(get_async_session)
-) -> StaffRead:
+    staff_id: int,
+    request: Request,
+    response: Response,
+    fields: Optional[List[str]] = Depends(fields_query),
+    include: Optional[List[str]] = Depends(include_query),
+    session: AsyncSession = Depends(get_async_read_session),
+    cache: ZooCache = Depends(get_read_through_cache),
+) -> Response:
     """
     Get a staff from the database
     """
-    staff: Optional[Staff] = await session.get(Staff, staff_id)
-    staff = check_model(model_instance=staff, model_class=Staff, id=staff_id)
-    staff_model = StaffRead.model_validate(staff)
-    return staff_model
+    check_fields(StaffRead, fields)
+    include_keys(Staff, include)
+    cache_key = entity_key(Staff, staff_id)
+    staff_model: Optional[StaffRead] = cache.get(cache_key)
+    if staff_model is None:
+        generation = cache.generation
+        if include is None:
+            unchanged = await entity_not_modified(
+                request=request,
+                session=session,
+                model_class=Staff,
+                id=staff_id,
+                fields=fields,
+            )
+            if unchanged is not None:
+                return unchanged
+        staff: Optional[Staff] = await session.get(Staff, staff_id)
+        staff = check_model(model_instance=staff, model_class=Staff, id=staff_id)
+        staff_model = StaffRead.model_validate(staff)
+        cache.set(cache_key, staff_model, generation=generation)
+    staff_fields = fields_model(StaffRead, fields).model_validate(staff_model)
+    if include is not None:
+        included = await load_included(
+            session=session, model_class=Staff, rows=[staff_model], include=include
+        )
+        return compound_response(staff_fields, included, response)
+    updated_at = staff_model.updated_at
+    etag = entity_etag(Staff, id=staff_id, updated_at=updated_at, fields=fields)
+    if is_not_modified(request, etag=etag, last_modified=updated_at):
+        return not_modified(etag=etag, last_modified=updated_at)
+    set_validators(response, etag=etag, last_modified=updated_at)
+    return model_response(staff_fields, response)
 
 
 @staff_router.post("/staff", response_model=StaffRead)
 async def create_staff(
-    staff: StaffCreate, session: AsyncSession = Depends(get_async_session)
-) -> StaffRead:
+    staff: StaffCreate,
+    session: AsyncSession = Depends(get_async_session),
+    cache: ZooCache = Depends(get_read_cache),
+) -> Response:
     """
     Create a new staff in the database
     """
-    new_staff = Staff(**staff.model_dump(exclude_unset=True))
-    session.add(new_staff)
-    await session.commit()
-    await session.refresh(new_staff)
-    staff_model = StaffRead.model_validate(new_staff)
-    return staff_model
+    new_staff = await insert_one(
+        session=session, model_class=Staff, values=staff.model_dump(exclude_unset=True)
+    )
+    invalidate_rosters(cache, Staff, exhibit_ids=[new_staff.exhibit_id])
+    return model_response(StaffRead.model_validate(new_staff))
+
+
+@staff_router.post("/staff/bulk", response_model=List[StaffRead])
+async def bulk_create_staff(
+    staff: List[StaffBulkCreate],
+    on_conflict: Optional[OnConflict] = on_conflict_query,
+    session: AsyncSession = Depends(get_async_session),
+    cache: ZooCache = Depends(get_read_cache),
+) -> Response:
+    """
+    Create (or upsert) many staff in the database
+    """
+    rows = await bulk_insert(
+        session=session, model_class=Staff, records=staff, on_conflict=on_conflict
+    )
+    cache.delete(*(entity_key(Staff, row.id) for row in rows))
+    invalidate_rosters(cache, Staff)
+    return models_response(StaffRead, validate_all(StaffRead, rows))
+
+
+@staff_router.patch("/staff/bulk", response_model=BulkResult)
+async def bulk_update_staff(
+    staff: StaffUpdate,
+    ids: Optional[List[int]] = Depends(ids_query),
+    filters: StaffFilter = Depends(),
+    session: AsyncSession = Depends(get_async_session),
+    cache: ZooCache = Depends(get_read_cache),
+) -> Response:
+    """
+    Update many staff in the database by id or filter
+    """
+    updated_ids = await bulk_update(
+        session=session,
+        model_class=Staff,
+        values=staff.model_dump(exclude_unset=True),
+        ids=ids,
+        filters=filters,
+    )
+    cache.delete(*(entity_key(Staff, staff_id) for staff_id in updated_ids))
+    invalidate_rosters(cache, Staff)
+    return model_response(BulkResult(count=len(updated_ids), ids=updated_ids))
+
+
+@staff_router.delete("/staff/bulk", response_model=BulkResult)
+async def bulk_delete_staff(
+    ids: Optional[List[int]] = Depends(ids_query),
+    filters: StaffFilter = Depends(),
+    session: AsyncSession = Depends(get_async_session),
+    cache: ZooCache = Depends(get_read_cache),
+) -> Response:
+    """
+    Delete many staff from the database by id or filter
+    """
+    deleted_ids = await bulk_update(
+        session=session,
+        model_class=Staff,
+        values={"deleted_at": func.current_timestamp()},
+        ids=ids,
+        filters=filters,
+    )
+    cache.delete(*(entity_key(Staff, staff_id) for staff_id in deleted_ids))
+    invalidate_rosters(cache, Staff)
+    return model_response(BulkResult(count=len(deleted_ids), ids=deleted_ids))
 
 
 @staff_router.delete("/staff/{staff_id}", response_model=StaffRead)
 async def delete_staff(
-    staff_id: int, session: AsyncSession = Depends(get_async_session)
-) -> StaffRead:
+    staff_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    cache: ZooCache = Depends(get_read_cache),
+) -> Response:
     """
     Delete a staff in the database
     """
-    db_staff: Optional[Staff] = await session.get(Staff, staff_id)
-    db_staff = check_model(model_instance=db_staff, model_class=Staff, id=staff_id)
-    db_staff.deleted_at = func.current_timestamp()
-    session.add(db_staff)
-    await session.commit()
-    await session.refresh(db_staff)
-    staff_model = StaffRead.model_validate(db_staff)
-    return staff_model
+    db_staff = await delete_one(session=session, model_class=Staff, id=staff_id)
+    cache.delete(entity_key(Staff, staff_id))
+    invalidate_rosters(cache, Staff, exhibit_ids=[db_staff.exhibit_id])
+    return model_response(StaffRead.model_validate(db_staff))
 
 
 @staff_router.patch("/staff/{staff_id}", response_model=StaffRead)
@@ -90,17 +360,19 @@ async def update_staff(
     staff_id: int,
     staff: StaffUpdate,
     session: AsyncSession = Depends(get_async_session),
-) -> StaffRead:
+    cache: ZooCache = Depends(get_read_cache),
+) -> Response:
     """
     Update a staff in the database
     """
-    db_staff: Optional[Staff] = await session.get(Staff, staff_id)
-    db_staff = check_model(model_instance=db_staff, model_class=Staff, id=staff_id)
     update_data = staff.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_staff, field, value)
-    session.add(db_staff)
-    await session.commit()
-    await session.refresh(db_staff)
-    staff_model = StaffRead.model_validate(db_staff)
-    return staff_model
+    db_staff = await update_one(
+        session=session, model_class=Staff, id=staff_id, values=update_data
+    )
+    cache.delete(entity_key(Staff, staff_id))
+    # The previous exhibit isn't returned, every roster is invalidated on a move
+    moved = "exhibit_id" in update_data
+    invalidate_rosters(
+        cache, Staff, exhibit_ids=None if moved else [db_staff.exhibit_id]
+    )
+    return model_response(StaffRead.model_validate(db_staff))
@@ -2,19 +2,102 @@
 Utilities APIRouter
 """
 
+import dataclasses
 import datetime
-from typing import Optional, Type
+from typing import Any, List, Optional, Type, cast
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.openapi.docs import get_swagger_ui_html
+from sqlalchemy import Boolean, ColumnElement, String, and_, literal
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.functions import FunctionElement
 from starlette.responses import HTMLResponse
 
 from zoo._version import __application__, __favicon__
+from zoo.cache import NullCache, ZooCache, get_read_cache
+from zoo.db import async_engine, async_read_engine
+from zoo.hashing import hashing_pool
 from zoo.models.base import DatabaseTypeDeletedAt
-from zoo.schemas.utils import Health
+from zoo.pool import InstrumentedPool
+from zoo.schemas.base import ZooModel
+from zoo.schemas.utils import CacheStats, HashingStats, Health, PoolStats
 
 utils_router = APIRouter(tags=["utilities"])
 
+PREFIX_SUFFIX = "_prefix"
+# The highest code point, sorts after anything that can follow a prefix
+MAX_CHARACTER = "\U0010ffff"
+LIKE_ESCAPE = "/"
+
+
+class PrefixMatch(FunctionElement[bool]):
+    """
+    A case-sensitive match of the start of a text column
+
+    Compiled to a byte order range, which an index can seek: SQLite's
+    default `BINARY` collation is the byte order, PostgreSQL compares with
+    the `text_pattern_ops` operators (`~>=~`, `~<~`) of the live row
+    `ix_*_name_pattern` indexes, whatever the database collation.
+    """
+
+    name = "prefix_match"
+    inherit_cache = True
+    type = Boolean()
+    _is_implicitly_boolean = True
+
+    def __init__(self, column: ColumnElement[str], prefix: str) -> None:
+        escaped = "".join(
+            f"{LIKE_ESCAPE}{character}"
+            if character in f"%_{LIKE_ESCAPE}"
+            else character
+            for character in prefix
+        )
+        super().__init__(
+            column,
+            literal(prefix, String()),
+            literal(prefix + MAX_CHARACTER, String()),
+            literal(f"{escaped}%", String()),
+        )
+
+
+@compiles(PrefixMatch)
+def _compile_prefix_match(
+    element: PrefixMatch, compiler: SQLCompiler, **kwargs: Any
+) -> str:
+    """
+    Compile a PrefixMatch: `LIKE 'prefix%'`
+    """
+    column, _, _, pattern = element.clauses
+    return compiler.process(column.like(pattern, escape=LIKE_ESCAPE), **kwargs)
+
+
+@compiles(PrefixMatch, "sqlite")
+def _compile_prefix_match_sqlite(
+    element: PrefixMatch, compiler: SQLCompiler, **kwargs: Any
+) -> str:
+    """
+    Compile a PrefixMatch on SQLite: a range in the `BINARY` collation
+    """
+    column, lower, upper, _ = element.clauses
+    byte_range = and_(column >= lower, column < upper).self_group()
+    return compiler.process(byte_range, **kwargs)
+
+
+@compiles(PrefixMatch, "postgresql")
+def _compile_prefix_match_postgresql(
+    element: PrefixMatch, compiler: SQLCompiler, **kwargs: Any
+) -> str:
+    """
+    Compile a PrefixMatch on PostgreSQL: a range in byte order
+    """
+    column, lower, upper, _ = element.clauses
+    byte_range = and_(
+        column.op("~>=~", is_comparison=True)(lower),
+        column.op("~<~", is_comparison=True)(upper),
+    ).self_group()
+    return compiler.process(byte_range, **kwargs)
+
 
 @utils_router.get("/health", response_model=Health)
 def health_check() -> Health:
@@ -28,6 +111,69 @@ def health_check() -> Health:
     )
 
 
+@utils_router.get("/stats/cache", response_model=CacheStats)
+def cache_stats(cache: ZooCache = Depends(get_read_cache)) -> CacheStats:
+    """
+    Get the read cache statistics
+    """
+    return CacheStats(
+        enabled=not isinstance(cache, NullCache),
+        size=cache.size,
+        **dataclasses.asdict(cache.statistics),
+    )
+
+
+@utils_router.get("/stats/pool", response_model=List[PoolStats])
+def pool_stats() -> List[PoolStats]:
+    """
+    Get the database connection pool statistics of this worker
+
+    The read pool is only listed when reads have their own engine
+    """
+    engines = {"write": async_engine, "read": async_read_engine}
+    if async_read_engine is async_engine:
+        del engines["read"]
+    stats: List[PoolStats] = []
+    for name, engine in engines.items():
+        pool = cast(InstrumentedPool, engine.pool)
+        statistics = pool.statistics
+        stats.append(
+            PoolStats(
+                name=name,
+                size=pool.size(),
+                max_overflow=pool.max_overflow,
+                checked_in=pool.checkedin(),
+                checked_out=pool.checkedout(),
+                overflow=max(pool.overflow(), 0),
+                checked_out_max=statistics.checked_out_max,
+                checkouts=statistics.checkouts,
+                timeouts=statistics.timeouts,
+                wait_time_avg=statistics.wait_time_total / max(statistics.checkouts, 1),
+                wait_time_max=statistics.wait_time_max,
+            )
+        )
+    return stats
+
+
+@utils_router.get("/stats/hashing", response_model=HashingStats)
+def hashing_stats() -> HashingStats:
+    """
+    Get the password hashing pool statistics of this worker
+    """
+    statistics = hashing_pool.statistics
+    return HashingStats(
+        workers=hashing_pool.workers,
+        max_pending=hashing_pool.max_pending,
+        pending=hashing_pool.pending,
+        queued=hashing_pool.queued,
+        queued_max=statistics.queued_max,
+        completed=statistics.completed,
+        rejected=statistics.rejected,
+        wait_time_avg=statistics.wait_time_total / max(statistics.completed, 1),
+        wait_time_max=statistics.wait_time_max,
+    )
+
+
 @utils_router.get("/docs", include_in_schema=False)
 def swagger_docs() -> HTMLResponse:
     """
@@ -40,6 +186,14 @@ def swagger_docs() -> HTMLResponse:
     )
 
 
+def not_found(model_class: Type[Any], id: int) -> HTTPException:  # noqa: A002
+    """
+    Get the `404 Not Found` error of a missing (or deleted) record
+    """
+    error_msg = f"Error: `{model_class.__name__}` data not found or deleted - ID: {id}"
+    return HTTPException(status_code=404, detail=error_msg)
+
+
 def check_model(
     model_instance: Optional[DatabaseTypeDeletedAt],
     model_class: Type[DatabaseTypeDeletedAt],
@@ -67,7 +221,60 @@ def check_model(
     HTTPException
         If the model instance is None or has been deleted
     """
-    error_msg = f"Error: `{model_class.__name__}` data not found or deleted - ID: {id}"
     if model_instance is None or model_instance.deleted_at is not None:
-        raise HTTPException(status_code=404, detail=error_msg)
+        raise not_found(model_class=model_class, id=id)
     return model_instance
+
+
+def ids_query(
+    ids: Optional[str] = Query(
+        default=None, description="Comma separated list of ids, e.g. `1,2,3`"
+    ),
+) -> Optional[List[int]]:
+    """
+    Parse a comma separated list of ids
+
+    Used by FastAPI Depends
+
+    Raises
+    ------
+    HTTPException
+        If any of the ids is not an integer
+    """
+    if ids is None:
+        return None
+    try:
+        return [int(item) for item in ids.split(",") if item.strip()]
+    except ValueError as e:
+        error_msg = f"Error: invalid ids - {ids}"
+        raise HTTPException(status_code=400, detail=error_msg) from e
+
+
+def filter_clauses(
+    model_class: Type[Any], filters: ZooModel
+) -> List[ColumnElement[bool]]:
+    """
+    Compile a filter model into SQL WHERE clauses
+
+    Parameters
+    ----------
+    model_class : Type[Any]
+        The database model being filtered
+    filters : ZooModel
+        The filter model, every field that is set is compared for equality
+        against the column of the same name. Fields ending in `_prefix`
+        match the start of the column instead, case-sensitively.
+
+    Returns
+    -------
+    List[ColumnElement[bool]]
+        The WHERE clauses
+    """
+    clauses: List[ColumnElement[bool]] = []
+    for field, value in filters.model_dump(exclude_none=True).items():
+        if field.endswith(PREFIX_SUFFIX):
+            column = getattr(model_class, field[: -len(PREFIX_SUFFIX)])
+            clauses.append(PrefixMatch(column, value))
+        else:
+            clauses.append(getattr(model_class, field) == value)
+    return clauses
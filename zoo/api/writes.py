@@ -0,0 +1,144 @@
+"""
+Single Record Write Helpers
+
+One statement writes with INSERT / UPDATE ... RETURNING
+"""
+
+from typing import Any, Dict, Optional, Type, cast
+
+from sqlalchemy import Row, Table, func, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from zoo.api.utils import not_found
+from zoo.models.base import Base
+
+
+async def insert_one(
+    session: AsyncSession, model_class: Type[Base], values: Dict[str, Any]
+) -> Row[Any]:
+    """
+    Insert a record and return it with its server generated columns
+
+    Parameters
+    ----------
+    session : AsyncSession
+        The database session
+    model_class : Type[Base]
+        The database model to insert into
+    values : Dict[str, Any]
+        The column values of the record
+
+    Returns
+    -------
+    Row[Any]
+        The inserted row
+    """
+    table = cast(Table, model_class.__table__)
+    result = await session.execute(insert(table).values(**values).returning(*table.c))
+    row = result.one()
+    await session.commit()
+    return row
+
+
+async def update_one(
+    session: AsyncSession,
+    model_class: Type[Base],
+    id: int,  # noqa: A002
+    values: Dict[str, Any],
+) -> Row[Any]:
+    """
+    Update a live record and return it
+
+    A single UPDATE ... RETURNING only matches the record when a value
+    actually changes. When it matches nothing, one SELECT tells an
+    unchanged record (returned as is, `updated_at` and the ETag left
+    alone) from a missing one. An empty PATCH only runs the SELECT.
+
+    Parameters
+    ----------
+    session : AsyncSession
+        The database session
+    model_class : Type[Base]
+        The database model to update
+    id : int
+        The id of the record
+    values : Dict[str, Any]
+        The column values to set
+
+    Returns
+    -------
+    Row[Any]
+        The updated row
+
+    Raises
+    ------
+    HTTPException
+        If the record doesn't exist or has been deleted
+    """
+    table = cast(Table, model_class.__table__)
+    live_record = (table.c.id == id, table.c.deleted_at.is_(None))
+    if values:
+        changed = or_(
+            *(
+                table.c[column].is_distinct_from(value)
+                for column, value in values.items()
+            )
+        )
+        statement = (
+            update(table)
+            .where(*live_record, changed)
+            .values(**values)
+            .returning(*table.c)
+        )
+        row: Optional[Row[Any]] = (await session.execute(statement)).one_or_none()
+        if row is not None:
+            await session.commit()
+            return row
+        # Nothing was written, release the write transaction
+        await session.rollback()
+    result = await session.execute(select(*table.c).where(*live_record))
+    row = result.one_or_none()
+    if row is None:
+        raise not_found(model_class=model_class, id=id)
+    return row
+
+
+async def delete_one(
+    session: AsyncSession,
+    model_class: Type[Base],
+    id: int,  # noqa: A002
+) -> Row[Any]:
+    """
+    Soft-delete a live record and return it
+
+    Parameters
+    ----------
+    session : AsyncSession
+        The database session
+    model_class : Type[Base]
+        The database model to delete from
+    id : int
+        The id of the record
+
+    Returns
+    -------
+    Row[Any]
+        The deleted row
+
+    Raises
+    ------
+    HTTPException
+        If the record doesn't exist or has already been deleted
+    """
+    table = cast(Table, model_class.__table__)
+    statement = (
+        update(table)
+        .where(table.c.id == id, table.c.deleted_at.is_(None))
+        .values(deleted_at=func.current_timestamp())
+        .returning(*table.c)
+    )
+    row = (await session.execute(statement)).one_or_none()
+    await session.commit()
+    if row is None:
+        raise not_found(model_class=model_class, id=id)
+    return row
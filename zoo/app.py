@@ -2,16 +2,26 @@
 zoo app
 """
 
+import asyncio
+import contextlib
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
 import uvicorn
 from fastapi import FastAPI
 
 from zoo._version import __application__, __markdown_description__, __version__
 from zoo.api.animals import animals_router
+from zoo.api.count import count_cache
 from zoo.api.exhibits import exhibits_router
+from zoo.api.search import search_router
 from zoo.api.staff import staff_router
 from zoo.api.utils import utils_router
+from zoo.cache import read_cache
 from zoo.config import app_config
-from zoo.models.users import bootstrap_fastapi_users
+from zoo.db import RecentWriteMiddleware
+from zoo.models.users import auth_cache, bootstrap_fastapi_users
+from zoo.tokens import reap_expired_tokens
 
 if not app_config.DOCKER:
     app_config.rich_logging(
@@ -28,6 +38,35 @@ class ZooFastAPI(FastAPI):
     """
 
 
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """
+    Start and stop the cache invalidation buses with each worker
+
+    Workers also purge expired access tokens every `TOKEN_REAPER_INTERVAL`
+    seconds when tokens expire (`JWT_EXPIRATION`).
+    """
+    await read_cache.start()
+    await auth_cache.start()
+    await count_cache.start()
+    reaper: Optional["asyncio.Task[None]"] = None
+    if app_config.JWT_EXPIRATION and app_config.TOKEN_REAPER_INTERVAL > 0:
+        reaper = asyncio.create_task(
+            reap_expired_tokens(
+                max_age=app_config.JWT_EXPIRATION,
+                interval=app_config.TOKEN_REAPER_INTERVAL,
+            )
+        )
+    yield
+    if reaper is not None:
+        reaper.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await reaper
+    await count_cache.stop()
+    await auth_cache.stop()
+    await read_cache.stop()
+
+
 app = ZooFastAPI(
     title=__application__,
     description=__markdown_description__,
@@ -36,13 +75,16 @@ app = ZooFastAPI(
     docs_url=None,  # Custom Swagger UI @ utils_router
     redoc_url=None,
     generate_unique_id_function=app_config.custom_generate_unique_id,
+    lifespan=lifespan,
 )
+app.add_middleware(RecentWriteMiddleware)
 # Routers
 app_routers = [
     utils_router,
     animals_router,
     exhibits_router,
     staff_router,
+    search_router,
 ]
 for router in app_routers:
     app.include_router(router)
@@ -0,0 +1,751 @@
+"""
+Read Cache
+
+A pluggable, in-process cache for entity reads, kept coherent across
+worker processes by an invalidation bus
+"""
+
+import asyncio
+import contextlib
+import fcntl
+import json
+import logging
+import mmap
+import os
+import pathlib
+import struct
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+import asyncpg
+from fastapi import Depends
+from sqlalchemy import make_url
+from starlette.requests import Request
+
+from zoo.config import ZooSettings, app_config
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[Union[str, int], ...]
+# A cache key where `None` matches any value, e.g. `("exhibits", None, "animals", None)`
+CacheKeyPattern = Tuple[Union[str, int, None], ...]
+
+
+@dataclass
+class CacheStatistics:
+    """
+    Cache hit / miss / eviction counters
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+
+class ZooCache(ABC):
+    """
+    Cache interface, values are stored by key until invalidated or expired
+    """
+
+    def __init__(self) -> None:
+        self.statistics = CacheStatistics()
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """
+        A counter bumped by every invalidation
+
+        Read it before loading a value from the database and pass it to
+        `set`: a value loaded while something was invalidated may be stale.
+        """
+        return self._generation
+
+    @property
+    @abstractmethod
+    def size(self) -> int:
+        """
+        The number of cached values
+        """
+
+    @abstractmethod
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """
+        Get a cached value, `None` if it isn't cached
+        """
+
+    @abstractmethod
+    def set(self, key: CacheKey, value: Any, generation: Optional[int] = None) -> None:
+        """
+        Cache a value, unless invalidations happened since `generation`
+        """
+
+    @abstractmethod
+    def delete(self, *keys: CacheKey) -> None:
+        """
+        Invalidate cached values by key
+        """
+
+    @abstractmethod
+    def delete_matching(self, pattern: CacheKeyPattern) -> None:
+        """
+        Invalidate every cached value whose key matches a pattern
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Invalidate every cached value
+        """
+
+    async def start(self) -> None:  # noqa: B027
+        """
+        Start any background work, called on application startup
+        """
+
+    async def stop(self) -> None:  # noqa: B027
+        """
+        Stop any background work, called on application shutdown
+        """
+
+
+class NullCache(ZooCache):
+    """
+    A cache that never stores anything, used when caching is disabled
+    """
+
+    @property
+    def size(self) -> int:
+        """
+        The number of cached values
+        """
+        return 0
+
+    def get(self, key: CacheKey) -> Optional[Any]:  # noqa: ARG002
+        """
+        Get a cached value, always `None`
+        """
+        self.statistics.misses += 1
+        return None
+
+    def set(self, key: CacheKey, value: Any, generation: Optional[int] = None) -> None:
+        """
+        Cache a value (no-op)
+        """
+
+    def delete(self, *keys: CacheKey) -> None:
+        """
+        Invalidate cached values by key (no-op)
+        """
+
+    def delete_matching(self, pattern: CacheKeyPattern) -> None:
+        """
+        Invalidate cached values by pattern (no-op)
+        """
+
+    def clear(self) -> None:
+        """
+        Invalidate every cached value (no-op)
+        """
+
+
+class MemoryCache(ZooCache):
+    """
+    A bounded LRU cache whose values expire after a TTL
+
+    Parameters
+    ----------
+    max_size : int
+        The maximum number of cached values, least recently used values
+        are evicted first
+    ttl : float
+        The number of seconds a value stays cached
+    """
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        super().__init__()
+        self.max_size = max_size
+        self.ttl = ttl
+        self._values: "OrderedDict[CacheKey, Tuple[float, Any]]" = OrderedDict()
+
+    @property
+    def size(self) -> int:
+        """
+        The number of cached values
+        """
+        return len(self._values)
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """
+        Get a cached value, `None` if it isn't cached or has expired
+        """
+        cached = self._values.get(key)
+        if cached is None:
+            self.statistics.misses += 1
+            return None
+        expires_at, value = cached
+        if expires_at <= time.monotonic():
+            del self._values[key]
+            self.statistics.expirations += 1
+            self.statistics.misses += 1
+            return None
+        self._values.move_to_end(key)
+        self.statistics.hits += 1
+        return value
+
+    def set(self, key: CacheKey, value: Any, generation: Optional[int] = None) -> None:
+        """
+        Cache a value, evicting the least recently used values when full
+
+        The value is dropped if anything was invalidated since `generation`.
+        """
+        if generation is not None and generation != self._generation:
+            return
+        self._values[key] = (time.monotonic() + self.ttl, value)
+        self._values.move_to_end(key)
+        while len(self._values) > self.max_size:
+            self._values.popitem(last=False)
+            self.statistics.evictions += 1
+
+    def delete(self, *keys: CacheKey) -> None:
+        """
+        Invalidate cached values by key
+        """
+        self._generation += 1
+        for key in keys:
+            if self._values.pop(key, None) is not None:
+                self.statistics.invalidations += 1
+
+    def delete_matching(self, pattern: CacheKeyPattern) -> None:
+        """
+        Invalidate every cached value whose key matches a pattern
+        """
+        self.delete(*[key for key in self._values if key_matches(key, pattern)])
+
+    def clear(self) -> None:
+        """
+        Invalidate every cached value
+        """
+        self._generation += 1
+        self.statistics.invalidations += len(self._values)
+        self._values.clear()
+
+
+def key_matches(key: CacheKey, pattern: CacheKeyPattern) -> bool:
+    """
+    Check whether a cache key matches a pattern
+    """
+    return len(key) == len(pattern) and all(
+        expected is None or part == expected for part, expected in zip(key, pattern)
+    )
+
+
+class InvalidationBus(ABC):
+    """
+    Broadcasts invalidations between the caches of worker processes
+    """
+
+    def __init__(self) -> None:
+        self.cache: Optional[ZooCache] = None
+
+    def attach(self, cache: ZooCache) -> None:
+        """
+        Attach the local cache that remote invalidations are applied to
+        """
+        self.cache = cache
+
+    async def start(self) -> None:  # noqa: B027
+        """
+        Start listening for remote invalidations
+        """
+
+    async def stop(self) -> None:  # noqa: B027
+        """
+        Stop listening for remote invalidations
+        """
+
+    def receive(self) -> None:  # noqa: B027
+        """
+        Apply pending remote invalidations, called before every read
+        """
+
+    @abstractmethod
+    def publish(self, message: Dict[str, Any]) -> None:
+        """
+        Broadcast a local invalidation to the other processes
+        """
+
+
+class FileBus(InvalidationBus):
+    """
+    A generation counter in a shared memory-mapped file
+
+    Every invalidation increments the counter, a process that sees the
+    counter change clears its whole cache. Used with SQLite, where all
+    workers share a host.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        The path of the generation file
+    """
+
+    counter = struct.Struct("<Q")
+
+    def __init__(self, path: pathlib.Path) -> None:
+        super().__init__()
+        self.path = path
+        self._pid: Optional[int] = None
+        self._fd: Optional[int] = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._generation = 0
+
+    def _open(self) -> Tuple[int, mmap.mmap]:
+        """
+        Map the generation file, once per (forked) process
+        """
+        if self._fd is not None and self._mmap is not None:
+            if self._pid == os.getpid():
+                return self._fd, self._mmap
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        with self._locked(fd):
+            if os.fstat(fd).st_size < self.counter.size:
+                os.ftruncate(fd, self.counter.size)
+        shared = mmap.mmap(fd, self.counter.size)
+        self._fd, self._mmap, self._pid = fd, shared, os.getpid()
+        self._generation = self._read(shared)
+        return fd, shared
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _locked(fd: int) -> Iterator[None]:
+        """
+        Hold an exclusive lock on the generation file
+        """
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def _read(self, shared: mmap.mmap) -> int:
+        """
+        Read the shared generation
+        """
+        generation: int = self.counter.unpack_from(shared, 0)[0]
+        return generation
+
+    def receive(self) -> None:
+        """
+        Clear the local cache if another process invalidated anything
+        """
+        _, shared = self._open()
+        generation = self._read(shared)
+        if generation != self._generation:
+            self._generation = generation
+            if self.cache is not None:
+                self.cache.clear()
+
+    def publish(self, message: Dict[str, Any]) -> None:  # noqa: ARG002
+        """
+        Increment the shared generation
+        """
+        fd, shared = self._open()
+        with self._locked(fd):
+            generation = self._read(shared)
+            if generation != self._generation and self.cache is not None:
+                # Another process invalidated since our last read
+                self.cache.clear()
+            self._generation = generation + 1
+            self.counter.pack_into(shared, 0, self._generation)
+
+    async def stop(self) -> None:
+        """
+        Unmap the generation file
+        """
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class PostgresBus(InvalidationBus):
+    """
+    Broadcast invalidations with PostgreSQL `LISTEN` / `NOTIFY`
+
+    Each process holds one dedicated connection, outside of the engine's
+    pool, that listens on the channel and sends its own notifications.
+    Messages are applied key by key.
+
+    A lost connection is reopened (and re-`LISTEN`ed) with a backoff. The
+    local cache is cleared every time the bus (re)connects, as any
+    invalidation sent in the meantime was missed. Notifications that
+    could not be sent are retried on the new connection.
+
+    Parameters
+    ----------
+    dsn : str
+        The `postgresql://` connection string
+    channel : str
+        The notification channel
+    connect : Callable[[str], Awaitable[Any]]
+        Opens a driver connection, `asyncpg.connect` by default
+    """
+
+    # NOTIFY payloads are limited to 8000 bytes
+    max_payload_size = 7900
+    # Seconds without a notification to send before checking the connection
+    keepalive_interval = 10.0
+    min_retry_delay = 0.5
+    max_retry_delay = 30.0
+
+    def __init__(
+        self,
+        dsn: str,
+        channel: str = "zoo_cache",
+        connect: Callable[[str], Awaitable[Any]] = asyncpg.connect,
+    ) -> None:
+        super().__init__()
+        self.dsn = dsn
+        self.channel = channel
+        self.connect = connect
+        self.sender = uuid.uuid4().hex
+        self.connections = 0
+        self._queue: "asyncio.Queue[str]" = asyncio.Queue()
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._connected = asyncio.Event()
+
+    async def start(self) -> None:
+        """
+        Start listening and sending notifications, in the background
+        """
+        self._queue = asyncio.Queue()
+        self._connected = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stop sending notifications and close the listening connection
+        """
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def wait_connected(self) -> None:
+        """
+        Wait until the bus is listening
+        """
+        await self._connected.wait()
+
+    def _on_notify(self, _: Any, __: int, ___: str, payload: str) -> None:
+        """
+        Apply an invalidation sent by another process
+        """
+        message = json.loads(payload)
+        if message.pop("sender") != self.sender and self.cache is not None:
+            apply_invalidation(self.cache, message)
+
+    async def _run(self) -> None:
+        """
+        Keep a listening connection open and send queued notifications
+        """
+        delay = self.min_retry_delay
+        payload: Optional[str] = None
+        while True:
+            connection: Any = None
+            try:
+                connection = await self.connect(self.dsn)
+                await connection.add_listener(self.channel, self._on_notify)
+                self.connections += 1
+                if self.cache is not None:
+                    self.cache.clear()
+                self._connected.set()
+                delay = self.min_retry_delay
+                while True:
+                    if payload is None:
+                        try:
+                            payload = await asyncio.wait_for(
+                                self._queue.get(), timeout=self.keepalive_interval
+                            )
+                        except asyncio.TimeoutError:
+                            await connection.execute("SELECT 1")
+                            continue
+                    await connection.execute(
+                        "SELECT pg_notify($1, $2)", self.channel, payload
+                    )
+                    payload = None
+            except Exception:
+                logger.exception(
+                    "Cache invalidation bus disconnected, retrying in %.1fs", delay
+                )
+            finally:
+                self._connected.clear()
+                if connection is not None:
+                    with contextlib.suppress(Exception):
+                        await connection.close()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_retry_delay)
+
+    def publish(self, message: Dict[str, Any]) -> None:
+        """
+        Queue an invalidation notification
+        """
+        if self._task is None:
+            return
+        payload = json.dumps({**message, "sender": self.sender})
+        if len(payload.encode("utf-8")) > self.max_payload_size:
+            payload = json.dumps({"op": "clear", "sender": self.sender})
+        self._queue.put_nowait(payload)
+
+
+def apply_invalidation(cache: ZooCache, message: Dict[str, Any]) -> None:
+    """
+    Apply an invalidation message to a cache
+    """
+    if message["op"] == "delete":
+        cache.delete(*(tuple(key) for key in message["keys"]))
+    elif message["op"] == "delete_matching":
+        cache.delete_matching(tuple(message["pattern"]))
+    else:
+        cache.clear()
+
+
+class BroadcastCache(ZooCache):
+    """
+    A local cache whose invalidations are broadcast to other processes
+
+    Parameters
+    ----------
+    cache : ZooCache
+        The local cache
+    bus : InvalidationBus
+        The bus invalidations are published to and received from
+    """
+
+    def __init__(self, cache: ZooCache, bus: InvalidationBus) -> None:
+        super().__init__()
+        self.cache = cache
+        self.bus = bus
+        self.statistics = cache.statistics
+        bus.attach(cache)
+
+    @property
+    def size(self) -> int:
+        """
+        The number of cached values
+        """
+        return self.cache.size
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """
+        Get a cached value, after applying remote invalidations
+        """
+        self.bus.receive()
+        return self.cache.get(key)
+
+    @property
+    def generation(self) -> int:
+        """
+        The local cache's invalidation counter, after applying remote invalidations
+        """
+        self.bus.receive()
+        return self.cache.generation
+
+    def set(self, key: CacheKey, value: Any, generation: Optional[int] = None) -> None:
+        """
+        Cache a value locally, after applying remote invalidations
+        """
+        self.bus.receive()
+        self.cache.set(key, value, generation=generation)
+
+    def delete(self, *keys: CacheKey) -> None:
+        """
+        Invalidate cached values by key, in every process
+        """
+        if keys:
+            self.cache.delete(*keys)
+            self.bus.publish({"op": "delete", "keys": keys})
+
+    def delete_matching(self, pattern: CacheKeyPattern) -> None:
+        """
+        Invalidate every cached value whose key matches a pattern, in every process
+        """
+        self.cache.delete_matching(pattern)
+        self.bus.publish({"op": "delete_matching", "pattern": pattern})
+
+    def clear(self) -> None:
+        """
+        Invalidate every cached value, in every process
+        """
+        self.cache.clear()
+        self.bus.publish({"op": "clear"})
+
+    async def start(self) -> None:
+        """
+        Start the invalidation bus
+        """
+        await self.bus.start()
+
+    async def stop(self) -> None:
+        """
+        Stop the invalidation bus
+        """
+        await self.bus.stop()
+
+
+def entity_key(model_class: Type[Any], id: int) -> CacheKey:  # noqa: A002
+    """
+    Get the cache key of a single record, e.g. `("animals", 1)`
+    """
+    return (model_class.__tablename__, id)
+
+
+def roster_key(exhibit_id: int, model_class: Type[Any], page: str = "") -> CacheKey:
+    """
+    Get the cache key of a roster page, e.g. `("exhibits", 1, "animals", "limit=10")`
+
+    The page is the request's query string.
+    """
+    return ("exhibits", exhibit_id, model_class.__tablename__, page)
+
+
+def invalidate_rosters(
+    cache: ZooCache,
+    model_class: Type[Any],
+    exhibit_ids: Optional[Iterable[Optional[int]]] = None,
+) -> None:
+    """
+    Invalidate the cached exhibit rosters of a model
+
+    Parameters
+    ----------
+    cache : ZooCache
+        The cache
+    model_class : Type[Any]
+        The database model listed by the rosters
+    exhibit_ids : Optional[Iterable[Optional[int]]]
+        The exhibits whose rosters changed, `None` invalidates every roster.
+        Every cached page of a roster is invalidated.
+    """
+    table_name = model_class.__tablename__
+    if exhibit_ids is None:
+        cache.delete_matching(("exhibits", None, table_name, None))
+        return
+    for exhibit_id in dict.fromkeys(exhibit_ids):
+        if exhibit_id is not None:
+            cache.delete_matching(("exhibits", exhibit_id, table_name, None))
+
+
+def broadcast_cache(settings: ZooSettings, cache: ZooCache, name: str) -> ZooCache:
+    """
+    Broadcast the invalidations of a local cache to the other workers
+
+    Invalidations are broadcast with `LISTEN` / `NOTIFY` on asyncpg, and
+    a generation file under `cache_bus_dir` on SQLite. Each named cache
+    gets its own channel / file.
+    """
+    driver = settings.DATABASE_DRIVER.lower()
+    if "asyncpg" in driver:
+        dsn = make_url(settings.connection_string).set(drivername="postgresql")
+        bus = PostgresBus(
+            dsn=dsn.render_as_string(hide_password=False), channel=f"zoo_{name}"
+        )
+        return BroadcastCache(cache=cache, bus=bus)
+    if "sqlite" in driver:
+        generation_file = settings.cache_bus_dir / f"{name}.generation"
+        return BroadcastCache(cache=cache, bus=FileBus(path=generation_file))
+    logger.warning("No cache invalidation bus for %s, caching per process", driver)
+    return cache
+
+
+def build_cache(settings: ZooSettings) -> ZooCache:
+    """
+    Create the read cache configured by the settings
+    """
+    if not settings.CACHE_ENABLED:
+        return NullCache()
+    cache = MemoryCache(max_size=settings.CACHE_MAX_SIZE, ttl=settings.CACHE_TTL)
+    return broadcast_cache(settings=settings, cache=cache, name="cache")
+
+
+def build_auth_cache(settings: ZooSettings) -> ZooCache:
+    """
+    Create the authentication cache configured by the settings
+
+    `AUTH_CACHE_TTL` bounds how long a user change made outside of the
+    API, or missed by a worker, can go unnoticed.
+    """
+    if not settings.AUTH_CACHE_ENABLED:
+        return NullCache()
+    cache = MemoryCache(
+        max_size=settings.AUTH_CACHE_MAX_SIZE, ttl=settings.AUTH_CACHE_TTL
+    )
+    return broadcast_cache(settings=settings, cache=cache, name="auth")
+
+
+def build_count_cache(settings: ZooSettings) -> ZooCache:
+    """
+    Create the exact count cache configured by the settings
+
+    Counts are keyed by `(table name, filters)`. `COUNT_CACHE_TTL` bounds
+    how long a write made outside of the API, or missed by a worker, can
+    go unnoticed.
+    """
+    if not settings.COUNT_CACHE_ENABLED:
+        return NullCache()
+    cache = MemoryCache(
+        max_size=settings.COUNT_CACHE_MAX_SIZE, ttl=settings.COUNT_CACHE_TTL
+    )
+    return broadcast_cache(settings=settings, cache=cache, name="counts")
+
+
+read_cache = build_cache(app_config)
+# Used instead of the read cache by clients pinned to the primary
+bypass_cache = NullCache()
+
+
+def get_read_cache() -> ZooCache:
+    """
+    Get the read cache
+
+    Used by FastAPI Depends
+    """
+    return read_cache
+
+
+def get_read_through_cache(
+    request: Request, cache: ZooCache = Depends(get_read_cache)
+) -> ZooCache:
+    """
+    Get the read cache for a read-only request
+
+    Clients pinned to the primary after a write bypass the cache: another
+    request may have refilled it from the lagging read replica.
+
+    Used by FastAPI Depends
+    """
+    from zoo.db import is_pinned
+
+    return bypass_cache if is_pinned(request) else cache
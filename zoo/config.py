@@ -3,9 +3,11 @@ Application configuration
 """
 
 import asyncio
+import hashlib
 import logging
 import pathlib
-from typing import List, Optional, Union
+import tempfile
+from typing import Any, Dict, List, Optional, Union
 
 import fastapi
 import starlette
@@ -48,9 +50,42 @@ class ZooSettings(BaseSettings):
     DATABASE_USER: Optional[str] = None
     DATABASE_PASSWORD: Optional[str] = None
     DATABASE_NAME: Optional[str] = None
+    DATABASE_READ_HOST: Optional[str] = None
+    DATABASE_READ_PORT: Optional[int] = None
+    DATABASE_READ_FILE: Optional[str] = None
+    DATABASE_READ_PIN_SECONDS: int = 5
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_POOL_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: float = 30.0
+    DATABASE_POOL_RECYCLE: int = -1
+    DATABASE_POOL_PRE_PING: bool = False
+    DATABASE_STATEMENT_CACHE_SIZE: int = 100
+    DATABASE_PREPARED_STATEMENT_CACHE_SIZE: int = 100
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT: int = 5_000
+    SQLITE_MMAP_SIZE: int = 268_435_456
+    SQLITE_CACHE_SIZE: int = -64_000
     JWT_EXPIRATION: Optional[int] = None
+    TOKEN_PURGE_BATCH_SIZE: int = 1_000
+    TOKEN_REAPER_INTERVAL: float = 3_600.0
     SEED_DATA: bool = True
 
+    CACHE_ENABLED: bool = False
+    CACHE_MAX_SIZE: int = 10_000
+    CACHE_TTL: float = 60.0
+
+    AUTH_CACHE_ENABLED: bool = True
+    AUTH_CACHE_MAX_SIZE: int = 10_000
+    AUTH_CACHE_TTL: float = 30.0
+
+    COUNT_CACHE_ENABLED: bool = True
+    COUNT_CACHE_MAX_SIZE: int = 1_024
+    COUNT_CACHE_TTL: float = 30.0
+    CACHE_BUS_DIR: Optional[str] = None
+    HASHING_WORKERS: int = 2
+    HASHING_MAX_PENDING: int = 64
+
     DATABASE_SECRET: str = __application__
 
     model_config = SettingsConfigDict(
@@ -58,29 +93,117 @@ class ZooSettings(BaseSettings):
         case_sensitive=True,
     )
 
-    @property
-    def connection_string(self) -> str:
+    def database_url(
+        self, host: Optional[str], port: Optional[int], database_file: str
+    ) -> str:
         """
-        Get the database connection string
+        Get the connection string of a database server or SQLite file
         """
         database_url = URL.create(
             drivername=self.DATABASE_DRIVER,
             username=self.DATABASE_USER,
             password=self.DATABASE_PASSWORD,
-            host=self.DATABASE_HOST or self.DATABASE_FILE,
-            port=self.DATABASE_PORT,
+            host=host or database_file,
+            port=port,
             database=self.DATABASE_NAME,
         ).render_as_string(hide_password=False)
         if all(
             [
-                self.DATABASE_HOST is None,
-                "sqlite" in self.DATABASE_DRIVER.lower(),
+                host is None,
+                self.sqlite,
                 "////" not in database_url,
             ]
         ):
             database_url = str(database_url).replace("///", "////", 1)
         return database_url
 
+    @property
+    def connection_string(self) -> str:
+        """
+        Get the database connection string
+        """
+        return self.database_url(
+            host=self.DATABASE_HOST,
+            port=self.DATABASE_PORT,
+            database_file=self.DATABASE_FILE,
+        )
+
+    @property
+    def read_connection_string(self) -> Optional[str]:
+        """
+        Get the read replica connection string, `None` without a replica
+        """
+        if self.DATABASE_READ_HOST is None and self.DATABASE_READ_FILE is None:
+            return None
+        return self.database_url(
+            host=self.DATABASE_READ_HOST,
+            port=self.DATABASE_READ_PORT or self.DATABASE_PORT,
+            database_file=self.DATABASE_READ_FILE or self.DATABASE_FILE,
+        )
+
+    @property
+    def engine_options(self) -> Dict[str, Any]:
+        """
+        Get the keyword arguments of the database engine
+
+        The asyncpg statement caches only apply to `postgresql+asyncpg`,
+        set both to `0` behind a transaction pooling PgBouncer.
+        """
+        options: Dict[str, Any] = {
+            "echo": self.DEBUG,
+            "future": True,
+            "pool_size": self.DATABASE_POOL_SIZE,
+            "max_overflow": self.DATABASE_POOL_MAX_OVERFLOW,
+            "pool_timeout": self.DATABASE_POOL_TIMEOUT,
+            "pool_recycle": self.DATABASE_POOL_RECYCLE,
+            "pool_pre_ping": self.DATABASE_POOL_PRE_PING,
+        }
+        if "asyncpg" in self.DATABASE_DRIVER.lower():
+            options["connect_args"] = {
+                "statement_cache_size": self.DATABASE_STATEMENT_CACHE_SIZE,
+                "prepared_statement_cache_size": (
+                    self.DATABASE_PREPARED_STATEMENT_CACHE_SIZE
+                ),
+            }
+        return options
+
+    @property
+    def cache_bus_dir(self) -> pathlib.Path:
+        """
+        Get the directory of the SQLite cache invalidation generation files
+
+        `CACHE_BUS_DIR`, or a directory per database under the system's
+        temporary directory, so workers sharing a database share the files.
+        """
+        if self.CACHE_BUS_DIR is not None:
+            return pathlib.Path(self.CACHE_BUS_DIR)
+        database_file = str(pathlib.Path(self.DATABASE_FILE).resolve())
+        digest = hashlib.sha256(database_file.encode("utf-8")).hexdigest()[:16]
+        return pathlib.Path(tempfile.gettempdir()) / f"{__application__}-{digest}"
+
+    @property
+    def sqlite(self) -> bool:
+        """
+        Whether the database is SQLite
+        """
+        return "sqlite" in self.DATABASE_DRIVER.lower()
+
+    @property
+    def sqlite_pragmas(self) -> Dict[str, Union[str, int]]:
+        """
+        Get the pragmas set on every new SQLite connection
+
+        `busy_timeout` is in milliseconds, `mmap_size` in bytes and a
+        negative `cache_size` is in KiB.
+        """
+        return {
+            "journal_mode": self.SQLITE_JOURNAL_MODE,
+            "synchronous": self.SQLITE_SYNCHRONOUS,
+            "busy_timeout": self.SQLITE_BUSY_TIMEOUT,
+            "mmap_size": self.SQLITE_MMAP_SIZE,
+            "cache_size": self.SQLITE_CACHE_SIZE,
+        }
+
     @classmethod
     def rich_logging(cls, loggers: List[Union[str, logging.Logger]]) -> None:
         """
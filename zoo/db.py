@@ -1,16 +1,94 @@
 """
 Database Connections
+
+SQLite databases get a reader pool of `query_only` connections and a
+single writer connection, so readers never wait on the write lock and
+writers queue in the pool instead of failing with `database is locked`.
+
+With a read replica (`ZOO_DATABASE_READ_*`) reads are sent to it, except
+for clients that wrote in the last `ZOO_DATABASE_READ_PIN_SECONDS`.
 """
 
-from typing import AsyncGenerator
+import functools
+from typing import Any, AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from zoo.config import app_config
+from zoo.pool import InstrumentedPool
+
+RECENT_WRITE_COOKIE = "zoo_recent_write"
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+LOOKUP_SUFFIX = "/lookup"
+ERROR_STATUS = 400
+
+
+def set_sqlite_pragmas(
+    dbapi_connection: Any,
+    connection_record: Any,  # noqa: ARG001
+    query_only: bool,
+) -> None:
+    """
+    Apply the SQLite pragmas to a new connection
+
+    Used as a `connect` event listener
+    """
+    pragmas = dict(app_config.sqlite_pragmas, query_only=int(query_only))
+    cursor = dbapi_connection.cursor()
+    for pragma, value in pragmas.items():
+        cursor.execute(f"PRAGMA {pragma} = {value}")
+    cursor.close()
+
+
+def create_engine(connection_string: str, reader: bool) -> AsyncEngine:
+    """
+    Create an engine, SQLite engines apply the pragmas on connect
+
+    Parameters
+    ----------
+    connection_string : str
+        The database to connect to
+    reader : bool
+        Whether the engine only reads. SQLite readers are multi-connection
+        and `query_only`, SQLite writers have a single connection.
+
+    Returns
+    -------
+    AsyncEngine
+    """
+    options = app_config.engine_options
+    if app_config.sqlite and not reader:
+        options.update(pool_size=1, max_overflow=0)
+    engine = create_async_engine(
+        connection_string, poolclass=InstrumentedPool, **options
+    )
+    if app_config.sqlite:
+        event.listen(
+            engine.sync_engine,
+            "connect",
+            functools.partial(set_sqlite_pragmas, query_only=reader),
+        )
+    return engine
+
+
+async_engine = create_engine(app_config.connection_string, reader=False)
+read_replica = app_config.read_connection_string is not None
+if app_config.read_connection_string is not None:
+    async_read_engine = create_engine(app_config.read_connection_string, reader=True)
+elif app_config.sqlite:
+    async_read_engine = create_engine(app_config.connection_string, reader=True)
+else:
+    async_read_engine = async_engine
 
-async_engine = create_async_engine(
-    app_config.connection_string, echo=app_config.DEBUG, future=True
-)
 async_session = async_sessionmaker(
     async_engine,
     class_=AsyncSession,
@@ -18,6 +96,13 @@ async_session = async_sessionmaker(
     expire_on_commit=False,
     autoflush=False,
 )
+async_read_session = async_sessionmaker(
+    async_read_engine,
+    class_=AsyncSession,
+    autocommit=False,
+    expire_on_commit=False,
+    autoflush=False,
+)
 
 
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
@@ -31,3 +116,77 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
             yield session
     finally:
         await session.close()
+
+
+def is_pinned(request: Request) -> bool:
+    """
+    Check whether a client wrote recently and must read from the primary
+    """
+    return read_replica and RECENT_WRITE_COOKIE in request.cookies
+
+
+def read_sessionmaker(request: Request) -> async_sessionmaker[AsyncSession]:
+    """
+    Get the sessionmaker for a read-only request
+
+    Reads go to the read replica, unless the client wrote recently
+    (see `RecentWriteMiddleware`) and the replica may still lag behind.
+    """
+    return async_session if is_pinned(request) else async_read_session
+
+
+async def get_async_read_session(
+    request: Request,
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Yield an AsyncSession for read-only requests, see `read_sessionmaker`
+
+    Used by FastAPI Depends
+    """
+    try:
+        async with read_sessionmaker(request)() as session:
+            yield session
+    finally:
+        await session.close()
+
+
+class RecentWriteMiddleware:
+    """
+    Pin clients to the primary for a while after they write
+
+    Successful POST / PUT / PATCH / DELETE responses set a short-lived
+    cookie while a read replica is configured, so the client reads its
+    own writes.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Set the recent write cookie on successful writes
+        """
+        if (
+            not read_replica
+            or scope["type"] != "http"
+            or scope["method"] not in WRITE_METHODS
+            or scope["path"].endswith(LOOKUP_SUFFIX)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_pinned(message: Message) -> None:
+            if (
+                message["type"] == "http.response.start"
+                and message["status"] < ERROR_STATUS
+            ):
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "set-cookie",
+                    f"{RECENT_WRITE_COOKIE}=1; "
+                    f"Max-Age={app_config.DATABASE_READ_PIN_SECONDS}; "
+                    "Path=/; HttpOnly; SameSite=lax",
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_pinned)
@@ -0,0 +1,102 @@
+"""
+Password Hashing Pool
+
+Run password hashing off the event loop, in a bounded thread pool
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Tuple, TypeVar
+
+from fastapi import HTTPException
+
+from zoo.config import app_config
+
+T = TypeVar("T")
+
+
+@dataclass
+class HashingStatistics:
+    """
+    Password hashing counters
+    """
+
+    completed: int = 0
+    rejected: int = 0
+    queued_max: int = 0
+    wait_time_total: float = 0.0
+    wait_time_max: float = 0.0
+
+
+class HashingPool:
+    """
+    A size-limited thread pool for password hashing and verification
+
+    Argon2 and bcrypt release the GIL while hashing, so threads keep the
+    event loop responsive without the cost of a process pool. Once
+    `max_pending` hashes are running or queued, new ones are rejected with
+    `503 Service Unavailable` rather than growing the queue.
+
+    Parameters
+    ----------
+    workers : int
+        The number of hashing threads
+    max_pending : int
+        The number of running and queued hashes allowed
+    """
+
+    def __init__(self, workers: int, max_pending: int) -> None:
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self.statistics = HashingStatistics()
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="zoo-hashing"
+        )
+
+    @property
+    def queued(self) -> int:
+        """
+        The number of hashes waiting for a thread
+        """
+        return max(self.pending - self.workers, 0)
+
+    async def run(self, function: Callable[..., T], *args: Any) -> T:
+        """
+        Run a hashing function in the pool
+
+        Raises
+        ------
+        HTTPException
+            If too many hashes are already pending
+        """
+        if self.pending >= self.max_pending:
+            self.statistics.rejected += 1
+            error_msg = "Error: too many logins in progress - retry later"
+            raise HTTPException(
+                status_code=503, detail=error_msg, headers={"Retry-After": "1"}
+            )
+        self.pending += 1
+        self.statistics.queued_max = max(self.statistics.queued_max, self.queued)
+        submitted = time.perf_counter()
+
+        def timed() -> Tuple[float, T]:
+            return time.perf_counter(), function(*args)
+
+        try:
+            loop = asyncio.get_running_loop()
+            started, result = await loop.run_in_executor(self._executor, timed)
+        finally:
+            self.pending -= 1
+        wait_time = started - submitted
+        self.statistics.completed += 1
+        self.statistics.wait_time_total += wait_time
+        self.statistics.wait_time_max = max(self.statistics.wait_time_max, wait_time)
+        return result
+
+
+hashing_pool = HashingPool(
+    workers=app_config.HASHING_WORKERS, max_pending=app_config.HASHING_MAX_PENDING
+)
@@ -7,7 +7,13 @@ from typing import TYPE_CHECKING
 from sqlalchemy import ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from zoo.models.base import Base, CreatedUpdatedMixin, DeletedAtMixin, IDMixin
+from zoo.models.base import (
+    Base,
+    CreatedUpdatedMixin,
+    DeletedAtMixin,
+    IDMixin,
+    live_index,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
     from zoo.models.exhibits import Exhibits
@@ -19,6 +25,14 @@ class Animals(IDMixin, CreatedUpdatedMixin, DeletedAtMixin, Base):
     """
 
     __tablename__ = "animals"
+    __table_args__ = (
+        live_index("ix_animals_live_id", "id"),
+        live_index("ix_animals_created_at", "created_at", "id"),
+        live_index("ix_animals_updated_at", "updated_at", "id"),
+        live_index("ix_animals_exhibit_id", "exhibit_id", "id"),
+        live_index("ix_animals_name", "name"),
+        live_index("ix_animals_species", "species"),
+    )
 
     name: Mapped[str]
     description: Mapped[str] = mapped_column(default=None, nullable=True)
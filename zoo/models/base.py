@@ -3,10 +3,33 @@ SQLAlchemy Base Model
 """
 
 import datetime
-from typing import TypeVar
+from typing import Any, TypeVar
+
+from sqlalchemy import DateTime, Index, event, func, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    ORMExecuteState,
+    Session,
+    mapped_column,
+    with_loader_criteria,
+)
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.functions import now
+
+
+@compiles(now, "sqlite")
+def _compile_now_sqlite(_element: now, _compiler: SQLCompiler, **_kwargs: Any) -> str:
+    """
+    Compile `func.now()` on SQLite with millisecond precision
 
-from sqlalchemy import DateTime, func
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+    `CURRENT_TIMESTAMP` only has second precision, so `updated_at` (and
+    the ETags derived from it) wouldn't change between quick updates.
+    The text is padded to the microseconds SQLAlchemy binds, so stored
+    and bound timestamps compare (and sort) as plain strings.
+    """
+    return "strftime('%Y-%m-%d %H:%M:%f000', 'now')"
 
 
 class Base(DeclarativeBase):
@@ -29,7 +52,7 @@ class CreatedAtMixin:
     """
 
     created_at: Mapped[datetime.datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True), default=func.now(), server_default=func.now()
     )
 
 
@@ -39,7 +62,10 @@ class UpdatedAtMixin:
     """
 
     updated_at: Mapped[datetime.datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True),
+        default=func.now(),
+        server_default=func.now(),
+        onupdate=func.now(),
     )
 
 
@@ -59,5 +85,47 @@ class DeletedAtMixin:
     )
 
 
+def live_index(name: str, *columns: str) -> Index:
+    """
+    Create a partial index over the live (not soft-deleted) rows of a table
+
+    Parameters
+    ----------
+    name : str
+        The name of the index
+    *columns : str
+        The columns to index
+
+    Returns
+    -------
+    Index
+    """
+    live_rows = text("deleted_at IS NULL")
+    return Index(name, *columns, postgresql_where=live_rows, sqlite_where=live_rows)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _exclude_deleted(execute_state: ORMExecuteState) -> None:
+    """
+    Exclude soft-deleted rows from ORM queries and relationship loads
+
+    Column loads (e.g. `session.refresh`) are left alone so deleted
+    instances can still be refreshed. Set the `include_deleted`
+    execution option to opt out.
+    """
+    if (
+        execute_state.is_select
+        and not execute_state.is_column_load
+        and not execute_state.execution_options.get("include_deleted", False)
+    ):
+        execute_state.statement = execute_state.statement.options(
+            with_loader_criteria(
+                DeletedAtMixin,
+                lambda cls: cls.deleted_at.is_(None),
+                include_aliases=True,
+            )
+        )
+
+
 DatabaseType = TypeVar("DatabaseType", bound=Base)
 DatabaseTypeDeletedAt = TypeVar("DatabaseTypeDeletedAt", bound=DeletedAtMixin)
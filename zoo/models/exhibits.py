@@ -6,7 +6,13 @@ from typing import TYPE_CHECKING, List
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from zoo.models.base import Base, CreatedUpdatedMixin, DeletedAtMixin, IDMixin
+from zoo.models.base import (
+    Base,
+    CreatedUpdatedMixin,
+    DeletedAtMixin,
+    IDMixin,
+    live_index,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
     from zoo.models.animals import Animals
@@ -19,6 +25,13 @@ class Exhibits(IDMixin, CreatedUpdatedMixin, DeletedAtMixin, Base):
     """
 
     __tablename__ = "exhibits"
+    __table_args__ = (
+        live_index("ix_exhibits_live_id", "id"),
+        live_index("ix_exhibits_created_at", "created_at", "id"),
+        live_index("ix_exhibits_updated_at", "updated_at", "id"),
+        live_index("ix_exhibits_location", "location"),
+        live_index("ix_exhibits_name", "name"),
+    )
 
     name: Mapped[str]
     description: Mapped[str] = mapped_column(default=None, nullable=True)
@@ -7,7 +7,13 @@ from typing import TYPE_CHECKING
 from sqlalchemy import ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from zoo.models.base import Base, CreatedUpdatedMixin, DeletedAtMixin, IDMixin
+from zoo.models.base import (
+    Base,
+    CreatedUpdatedMixin,
+    DeletedAtMixin,
+    IDMixin,
+    live_index,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
     from zoo.models.exhibits import Exhibits
@@ -19,6 +25,15 @@ class Staff(Base, IDMixin, DeletedAtMixin, CreatedUpdatedMixin):
     """
 
     __tablename__ = "staff"
+    __table_args__ = (
+        live_index("ix_staff_live_id", "id"),
+        live_index("ix_staff_created_at", "created_at", "id"),
+        live_index("ix_staff_updated_at", "updated_at", "id"),
+        live_index("ix_staff_email", "email"),
+        live_index("ix_staff_exhibit_id", "exhibit_id", "id"),
+        live_index("ix_staff_job_title", "job_title"),
+        live_index("ix_staff_name", "name"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str]
@@ -3,11 +3,20 @@ User Database Model
 """
 
 import contextlib
+import datetime
 import uuid
-from typing import Any, AsyncGenerator
-
-from fastapi import Depends, FastAPI
-from fastapi_users import BaseUserManager, FastAPIUsers, UUIDIDMixin
+from typing import Any, AsyncGenerator, Dict, Optional, Tuple, cast
+
+import sqlalchemy as sa
+from fastapi import Depends, FastAPI, Request
+from fastapi.security import OAuth2PasswordRequestForm
+from fastapi_users import (
+    BaseUserManager,
+    FastAPIUsers,
+    UUIDIDMixin,
+    exceptions,
+    schemas,
+)
 from fastapi_users.authentication import (
     AuthenticationBackend,
     BearerTransport,
@@ -24,10 +33,13 @@ from fastapi_users_db_sqlalchemy.access_token import (
     SQLAlchemyBaseAccessTokenTableUUID,
 )
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
 from zoo._version import __application__
+from zoo.cache import CacheKey, build_auth_cache
 from zoo.config import app_config
 from zoo.db import get_async_session
+from zoo.hashing import hashing_pool
 from zoo.models.base import Base, CreatedUpdatedMixin, UpdatedAtMixin
 from zoo.schemas.users import UserCreate, UserRead
 
@@ -50,11 +62,140 @@ class AccessToken(SQLAlchemyBaseAccessTokenTableUUID, UpdatedAtMixin, Base):
     __tablename__ = "access_token"
 
 
+auth_cache = build_auth_cache(app_config)
+
+
+def user_key(user_id: uuid.UUID) -> CacheKey:
+    """
+    Get the auth cache key of a user
+    """
+    return ("user", str(user_id))
+
+
+def access_token_key(token: str) -> CacheKey:
+    """
+    Get the auth cache key of a database access token
+    """
+    return ("access_token", token)
+
+
+def detached_user(user: User) -> User:
+    """
+    Copy a user's columns into a detached instance that can be cached
+    """
+    columns = sa.inspect(User).column_attrs
+    copy = User(**{column.key: getattr(user, column.key) for column in columns})
+    make_transient_to_detached(copy)
+    return copy
+
+
 class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
     """
     UserManager for FastAPI Users
+
+    Users are read through the auth cache, so resolving the user of a
+    token costs no query until the user changes or the cache entry expires.
+    Passwords are hashed and verified in the `hashing_pool`, off the event
+    loop.
     """
 
+    async def get(self, id: uuid.UUID) -> User:  # noqa: A002
+        """
+        Get a user by id, from the auth cache when possible
+
+        Raises
+        ------
+        UserNotExists
+            If the user does not exist
+        """
+        user: Optional[User] = auth_cache.get(user_key(id))
+        if user is None:
+            user = detached_user(await super().get(id))
+            auth_cache.set(user_key(id), user)
+        session = cast(SQLAlchemyUserDatabase[User, uuid.UUID], self.user_db).session
+        return await session.merge(user, load=False)
+
+    async def authenticate(
+        self, credentials: OAuth2PasswordRequestForm
+    ) -> Optional[User]:
+        """
+        Authenticate a user by email and password
+
+        Raises
+        ------
+        HTTPException
+            If the hashing pool is full
+        """
+        try:
+            user = await self.get_by_email(credentials.username)
+        except exceptions.UserNotExists:
+            # Hash anyway, so unknown emails take as long as wrong passwords
+            await hashing_pool.run(self.password_helper.hash, credentials.password)
+            return None
+        verified, updated_password_hash = await hashing_pool.run(
+            self.password_helper.verify_and_update,
+            credentials.password,
+            user.hashed_password,
+        )
+        if not verified:
+            return None
+        if updated_password_hash is not None:
+            await self.user_db.update(user, {"hashed_password": updated_password_hash})
+        return user
+
+    async def create(
+        self,
+        user_create: schemas.UC,
+        safe: bool = False,
+        request: Optional[Request] = None,
+    ) -> User:
+        """
+        Create a user, hashing the password in the `hashing_pool`
+
+        Raises
+        ------
+        UserAlreadyExists
+            If the email is taken
+        HTTPException
+            If the hashing pool is full
+        """
+        await self.validate_password(user_create.password, user_create)
+        if await self.user_db.get_by_email(user_create.email) is not None:
+            raise exceptions.UserAlreadyExists()
+        user_dict = (
+            user_create.create_update_dict()
+            if safe
+            else user_create.create_update_dict_superuser()
+        )
+        password = user_dict.pop("password")
+        user_dict["hashed_password"] = await hashing_pool.run(
+            self.password_helper.hash, password
+        )
+        created_user = await self.user_db.create(user_dict)
+        await self.on_after_register(created_user, request)
+        return created_user
+
+    async def on_after_update(
+        self,
+        user: User,
+        update_dict: Dict[str, Any],  # noqa: ARG002
+        request: Optional[Request] = None,  # noqa: ARG002
+    ) -> None:
+        """
+        Invalidate the cached user
+        """
+        auth_cache.delete(user_key(user.id))
+
+    async def on_after_delete(
+        self,
+        user: User,
+        request: Optional[Request] = None,  # noqa: ARG002
+    ) -> None:
+        """
+        Invalidate the cached user
+        """
+        auth_cache.delete(user_key(user.id))
+
 
 async def get_user_db(
     session: AsyncSession = Depends(get_async_session),
@@ -94,13 +235,55 @@ def get_jwt_strategy() -> JWTStrategy:  # type: ignore[type-arg]
     )
 
 
+class CachedDatabaseStrategy(DatabaseStrategy[User, uuid.UUID, AccessToken]):
+    """
+    A DatabaseStrategy that caches which user an access token belongs to
+    """
+
+    async def read_token(
+        self,
+        token: Optional[str],
+        user_manager: BaseUserManager[User, uuid.UUID],
+    ) -> Optional[User]:
+        """
+        Get the user of a live access token, from the auth cache when possible
+        """
+        if token is None:
+            return None
+        cached: Optional[Tuple[uuid.UUID, datetime.datetime]] = auth_cache.get(
+            access_token_key(token)
+        )
+        if cached is None:
+            access_token = await self.database.get_by_token(token)
+            if access_token is None:
+                return None
+            cached = (access_token.user_id, access_token.created_at)
+            auth_cache.set(access_token_key(token), cached)
+        user_id, created_at = cached
+        if self.lifetime_seconds and created_at < datetime.datetime.now(
+            tz=datetime.timezone.utc
+        ) - datetime.timedelta(seconds=self.lifetime_seconds):
+            return None
+        try:
+            return await user_manager.get(user_id)
+        except exceptions.UserNotExists:
+            return None
+
+    async def destroy_token(self, token: str, user: User) -> None:
+        """
+        Delete an access token and invalidate it in the auth cache
+        """
+        await super().destroy_token(token=token, user=user)
+        auth_cache.delete(access_token_key(token))
+
+
 def get_database_strategy(
     access_token_db: AccessTokenDatabase = Depends(get_access_token_db),  # type: ignore[type-arg]
 ) -> DatabaseStrategy:  # type: ignore[type-arg]
     """
     Get a DatabaseStrategy using the AccessTokenDatabase
     """
-    return DatabaseStrategy(
+    return CachedDatabaseStrategy(
         database=access_token_db, lifetime_seconds=app_config.JWT_EXPIRATION
     )
 
@@ -0,0 +1,70 @@
+"""
+Database Connection Pool
+
+An async queue pool that records how long checkouts wait for a connection
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, cast
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+
+@dataclass
+class PoolStatistics:
+    """
+    Connection checkout counters
+    """
+
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_time_total: float = 0.0
+    wait_time_max: float = 0.0
+    checked_out_max: int = 0
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """
+    A queue pool counting checkouts, timeouts and the time spent waiting
+
+    The wait time of a checkout includes opening (and pre-pinging) a
+    connection, so a pool that is too small and a database that is slow
+    to connect to both show up in it.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.max_overflow: int = kwargs.get("max_overflow", 10)
+        self.statistics = PoolStatistics()
+
+    def connect(self) -> PoolProxiedConnection:
+        """
+        Check out a connection, recording the wait
+        """
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.statistics.timeouts += 1
+            raise
+        finally:
+            wait_time = time.perf_counter() - start
+            self.statistics.wait_time_total += wait_time
+            self.statistics.wait_time_max = max(
+                self.statistics.wait_time_max, wait_time
+            )
+        self.statistics.checkouts += 1
+        self.statistics.checked_out_max = max(
+            self.statistics.checked_out_max, self.checkedout()
+        )
+        return connection
+
+    def recreate(self) -> "InstrumentedPool":
+        """
+        Recreate the pool, keeping its statistics
+        """
+        pool = cast(InstrumentedPool, super().recreate())
+        pool.statistics = self.statistics
+        return pool
@@ -9,6 +9,7 @@ from pydantic import ConfigDict, Field
 from zoo.schemas.base import (
     CreatedModifiedMixin,
     DeletedMixin,
+    OptionalIdMixin,
     RequiredIdMixin,
     ZooModel,
 )
@@ -47,6 +48,18 @@ class AnimalsCreate(AnimalsBase):
     )
 
 
+class AnimalsBulkCreate(AnimalsBase, OptionalIdMixin):
+    """
+    Animals model: bulk create
+
+    An `id` may be provided to upsert existing records
+    """
+
+    model_config = ConfigDict(
+        json_schema_extra=AnimalsBase.get_openapi_create_example()
+    )
+
+
 class AnimalsRead(
     DeletedMixin,
     CreatedModifiedMixin,
@@ -80,3 +93,22 @@ class AnimalsUpdate(ZooModel):
     model_config = ConfigDict(
         json_schema_extra=AnimalsBase.get_openapi_update_example()
     )
+
+
+class AnimalsRosterFilter(ZooModel):
+    """
+    Animals model: filter within an exhibit
+    """
+
+    name_prefix: Optional[str] = Field(
+        default=None, description="Filter by the start of the name, case-sensitive"
+    )
+    species: Optional[str] = Field(default=None, description="Filter by species")
+
+
+class AnimalsFilter(AnimalsRosterFilter):
+    """
+    Animals model: filter
+    """
+
+    exhibit_id: Optional[int] = Field(default=None, description="Filter by exhibit id")
@@ -2,16 +2,19 @@
 Exhibits models
 """
 
-from typing import Any, ClassVar, Dict, Optional
+from typing import Any, ClassVar, Dict, List, Optional
 
 from pydantic import ConfigDict, Field
 
+from zoo.schemas.animals import AnimalsBase, AnimalsRead
 from zoo.schemas.base import (
     CreatedModifiedMixin,
     DeletedMixin,
+    OptionalIdMixin,
     RequiredIdMixin,
     ZooModel,
 )
+from zoo.schemas.staff import StaffBase, StaffRead
 
 
 class ExhibitsBase(ZooModel):
@@ -44,6 +47,18 @@ class ExhibitsCreate(ExhibitsBase):
     )
 
 
+class ExhibitsBulkCreate(ExhibitsBase, OptionalIdMixin):
+    """
+    Exhibits model: bulk create
+
+    An `id` may be provided to upsert existing records
+    """
+
+    model_config = ConfigDict(
+        json_schema_extra=ExhibitsBase.get_openapi_create_example()
+    )
+
+
 class ExhibitsRead(
     DeletedMixin,
     CreatedModifiedMixin,
@@ -59,6 +74,35 @@ class ExhibitsRead(
     )
 
 
+class ExhibitsFull(ExhibitsRead):
+    """
+    Exhibits model: full view, with the first live animals and staff
+    """
+
+    animals: List[AnimalsRead] = Field(
+        description="The first `embed_limit` live animals in the exhibit, by id"
+    )
+    staff: List[StaffRead] = Field(
+        description="The first `embed_limit` live staff of the exhibit, by id"
+    )
+    animals_count: int = Field(description="The number of live animals")
+    staff_count: int = Field(description="The number of live staff")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    **ExhibitsBase.get_openapi_read_example()["examples"][0],
+                    "animals": AnimalsBase.get_openapi_read_example()["examples"],
+                    "staff": StaffBase.get_openapi_read_example()["examples"],
+                    "animals_count": 1,
+                    "staff_count": 1,
+                }
+            ]
+        }
+    )
+
+
 class ExhibitsUpdate(ZooModel):
     """
     Exhibits model: update
@@ -75,3 +119,14 @@ class ExhibitsUpdate(ZooModel):
     model_config = ConfigDict(
         json_schema_extra=ExhibitsBase.get_openapi_update_example()
     )
+
+
+class ExhibitsFilter(ZooModel):
+    """
+    Exhibits model: filter
+    """
+
+    name_prefix: Optional[str] = Field(
+        default=None, description="Filter by the start of the name, case-sensitive"
+    )
+    location: Optional[str] = Field(default=None, description="Filter by location")
@@ -0,0 +1,39 @@
+"""
+Compound document models, the responses of `?include=`
+"""
+
+from typing import Generic, List, Optional, TypeVar
+
+from pydantic import Field
+
+from zoo.schemas.animals import AnimalsRead
+from zoo.schemas.base import ZooModel
+from zoo.schemas.exhibits import ExhibitsRead
+from zoo.schemas.staff import StaffRead
+
+DataT = TypeVar("DataT")
+
+
+class IncludedRecords(ZooModel):
+    """
+    Side-loaded records by table name, only the included tables are present
+    """
+
+    animals: Optional[List[AnimalsRead]] = Field(
+        default=None, description="The included animals, ordered by id"
+    )
+    exhibits: Optional[List[ExhibitsRead]] = Field(
+        default=None, description="The included exhibits, ordered by id"
+    )
+    staff: Optional[List[StaffRead]] = Field(
+        default=None, description="The included staff, ordered by id"
+    )
+
+
+class CompoundDocument(ZooModel, Generic[DataT]):
+    """
+    Primary data with its side-loaded related records
+    """
+
+    data: DataT = Field(description="The requested record(s)")
+    included: IncludedRecords = Field(description="The related records")
@@ -0,0 +1,36 @@
+"""
+Search models
+"""
+
+from typing import Literal
+
+from pydantic import ConfigDict, Field
+
+from zoo.schemas.base import ZooModel
+
+EntityType = Literal["animals", "exhibits", "staff"]
+
+
+class SearchResult(ZooModel):
+    """
+    Search result model
+    """
+
+    entity_type: EntityType = Field(description="The type of the matching record")
+    id: int = Field(description="The id of the matching record")
+    name: str = Field(description="The name of the matching record")
+    rank: float = Field(description="The relevance of the match, higher is better")
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "examples": [
+                {
+                    "entity_type": "animals",
+                    "id": 1,
+                    "name": "Lion",
+                    "rank": 1.23,
+                }
+            ]
+        },
+    )
@@ -9,6 +9,7 @@ from pydantic import ConfigDict, EmailStr, Field
 from zoo.schemas.base import (
     CreatedModifiedMixin,
     DeletedMixin,
+    OptionalIdMixin,
     RequiredIdMixin,
     ZooModel,
 )
@@ -52,6 +53,16 @@ class StaffCreate(StaffBase):
     model_config = ConfigDict(json_schema_extra=StaffBase.get_openapi_create_example())
 
 
+class StaffBulkCreate(StaffBase, OptionalIdMixin):
+    """
+    Staff model: bulk create
+
+    An `id` may be provided to upsert existing records
+    """
+
+    model_config = ConfigDict(json_schema_extra=StaffBase.get_openapi_create_example())
+
+
 class StaffRead(
     DeletedMixin,
     CreatedModifiedMixin,
@@ -88,3 +99,23 @@ class StaffUpdate(ZooModel):
     exhibit_id: Optional[int] = Field(description="The id of the exhibit", default=None)
 
     model_config = ConfigDict(json_schema_extra=StaffBase.get_openapi_update_example())
+
+
+class StaffRosterFilter(ZooModel):
+    """
+    Staff model: filter within an exhibit
+    """
+
+    name_prefix: Optional[str] = Field(
+        default=None, description="Filter by the start of the name, case-sensitive"
+    )
+    job_title: Optional[str] = Field(default=None, description="Filter by job title")
+    email: Optional[str] = Field(default=None, description="Filter by email")
+
+
+class StaffFilter(StaffRosterFilter):
+    """
+    Staff model: filter
+    """
+
+    exhibit_id: Optional[int] = Field(default=None, description="Filter by exhibit id")
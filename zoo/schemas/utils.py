@@ -3,11 +3,14 @@ Generic database utility models
 """
 
 import datetime
+from typing import List
 
 from pydantic import ConfigDict, Field
 
 from zoo.schemas.base import ZooModel
 
+MAX_LOOKUP_IDS = 1000
+
 
 class Health(ZooModel):
     """
@@ -31,3 +34,149 @@ class Health(ZooModel):
             ]
         }
     )
+
+
+class BulkResult(ZooModel):
+    """
+    Bulk operation result model
+    """
+
+    count: int = Field(description="The number of records affected")
+    ids: List[int] = Field(description="The ids of the records affected")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "count": 2,
+                    "ids": [1, 2],
+                }
+            ]
+        }
+    )
+
+
+class LookupRequest(ZooModel):
+    """
+    Multi-get request model
+    """
+
+    ids: List[int] = Field(
+        description="The ids of the records to get, in the order to return them",
+        min_length=1,
+        max_length=MAX_LOOKUP_IDS,
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "ids": [3, 1, 2],
+                }
+            ]
+        }
+    )
+
+
+class CacheStats(ZooModel):
+    """
+    Read cache statistics model
+    """
+
+    enabled: bool = Field(description="Whether the read cache is enabled")
+    size: int = Field(description="The number of cached values")
+    hits: int = Field(description="The number of reads served from the cache")
+    misses: int = Field(description="The number of reads not found in the cache")
+    evictions: int = Field(description="The number of values evicted when full")
+    expirations: int = Field(description="The number of values expired by TTL")
+    invalidations: int = Field(description="The number of values invalidated")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "enabled": True,
+                    "size": 10,
+                    "hits": 500,
+                    "misses": 10,
+                    "evictions": 0,
+                    "expirations": 2,
+                    "invalidations": 1,
+                }
+            ]
+        }
+    )
+
+
+class PoolStats(ZooModel):
+    """
+    Database connection pool statistics model
+    """
+
+    name: str = Field(description="The pool, `write` or `read`")
+    size: int = Field(description="The number of connections kept open")
+    max_overflow: int = Field(description="The number of extra connections allowed")
+    checked_in: int = Field(description="The number of idle connections")
+    checked_out: int = Field(description="The number of connections in use")
+    overflow: int = Field(description="The number of extra connections open")
+    checked_out_max: int = Field(
+        description="The highest number of connections in use at once"
+    )
+    checkouts: int = Field(description="The number of connections checked out")
+    timeouts: int = Field(description="The number of checkouts that timed out")
+    wait_time_avg: float = Field(description="The mean checkout wait in seconds")
+    wait_time_max: float = Field(description="The longest checkout wait in seconds")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "name": "read",
+                    "size": 5,
+                    "max_overflow": 10,
+                    "checked_in": 4,
+                    "checked_out": 3,
+                    "overflow": 2,
+                    "checked_out_max": 7,
+                    "checkouts": 1200,
+                    "timeouts": 0,
+                    "wait_time_avg": 0.0004,
+                    "wait_time_max": 0.0350,
+                }
+            ]
+        }
+    )
+
+
+class HashingStats(ZooModel):
+    """
+    Password hashing pool statistics model
+    """
+
+    workers: int = Field(description="The number of hashing threads")
+    max_pending: int = Field(description="The number of pending hashes allowed")
+    pending: int = Field(description="The number of hashes running or queued")
+    queued: int = Field(description="The number of hashes waiting for a thread")
+    queued_max: int = Field(description="The longest the queue has been")
+    completed: int = Field(description="The number of hashes completed")
+    rejected: int = Field(description="The number of hashes rejected when full")
+    wait_time_avg: float = Field(description="The mean queue wait in seconds")
+    wait_time_max: float = Field(description="The longest queue wait in seconds")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "workers": 2,
+                    "max_pending": 64,
+                    "pending": 3,
+                    "queued": 1,
+                    "queued_max": 12,
+                    "completed": 450,
+                    "rejected": 0,
+                    "wait_time_avg": 0.0120,
+                    "wait_time_max": 0.2500,
+                }
+            ]
+        }
+    )
@@ -0,0 +1,101 @@
+"""
+Access Token Maintenance
+
+Purge expired database access tokens, on demand or in the background
+"""
+
+import asyncio
+import datetime
+import logging
+import time
+from dataclasses import dataclass
+from typing import cast
+
+from sqlalchemy import Table, delete, select
+
+from zoo.config import app_config
+from zoo.db import async_session
+from zoo.models.users import AccessToken, access_token_key, auth_cache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PurgeResult:
+    """
+    The outcome of a token purge
+    """
+
+    deleted: int = 0
+    batches: int = 0
+    elapsed: float = 0.0
+
+
+async def purge_expired_tokens(
+    max_age: int, batch_size: int = app_config.TOKEN_PURGE_BATCH_SIZE
+) -> PurgeResult:
+    """
+    Delete the access tokens created more than `max_age` seconds ago
+
+    Tokens are deleted oldest first, `batch_size` at a time with one
+    transaction per batch, so the writer is never held for long. The
+    batches are found through the `access_token.created_at` index.
+
+    Parameters
+    ----------
+    max_age : int
+        The token lifetime in seconds
+    batch_size : int
+        The number of tokens deleted per transaction
+
+    Returns
+    -------
+    PurgeResult
+        The number of tokens deleted, in how many batches and seconds
+    """
+    start = time.perf_counter()
+    cutoff = datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(
+        seconds=max_age
+    )
+    table = cast(Table, AccessToken.__table__)
+    expired = (
+        select(table.c.token)
+        .where(table.c.created_at < cutoff)
+        .order_by(table.c.created_at)
+        .limit(batch_size)
+    )
+    statement = (
+        delete(table)
+        .where(table.c.token.in_(expired.scalar_subquery()))
+        .returning(table.c.token)
+    )
+    result = PurgeResult()
+    while True:
+        async with async_session() as session:
+            tokens = (await session.scalars(statement)).all()
+            await session.commit()
+        result.batches += 1
+        result.deleted += len(tokens)
+        auth_cache.delete(*(access_token_key(token) for token in tokens))
+        if len(tokens) < batch_size:
+            break
+        await asyncio.sleep(0)
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+async def reap_expired_tokens(max_age: int, interval: float) -> None:
+    """
+    Purge expired access tokens every `interval` seconds, until cancelled
+    """
+    while True:
+        try:
+            result = await purge_expired_tokens(max_age=max_age)
+            logger.info(
+                "Purged %d expired access tokens in %.3fs",
+                result.deleted,
+                result.elapsed,
+            )
+        except Exception:
+            logger.exception("Failed to purge expired access tokens")
+        await asyncio.sleep(interval)